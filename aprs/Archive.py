@@ -0,0 +1,395 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import os
+import struct
+import time
+import typing
+import zlib
+
+import aprs  # pylint: disable=R0801
+
+try:
+    import lzma
+except ImportError:  # pragma: no cover
+    lzma = None
+
+# File header of an archive: magic, codec id and bloom filter bytes per
+# block.
+ARCHIVE_MAGIC = b'APRSARC1'
+ARCHIVE_HEADER = struct.Struct('<8sBI')
+
+# Codec ids, by name.
+ARCHIVE_CODECS = {'zlib': 1, 'lzma': 2}
+
+# Each footer index entry: block offset, compressed length, record count,
+# first & last timestamp, followed by the source Callsign bloom filter bits.
+BLOCK_ENTRY = struct.Struct('<QIIqq')
+BLOOM_HASHES = 3
+
+# Last bytes of an archive: index offset, block count and magic.
+ARCHIVE_TRAILER = struct.Struct('<QI8s')
+
+
+def _bloom_positions(source: bytes, bits: int) -> typing.List[int]:
+    """
+    Returns the bloom filter bit positions of a source Callsign.
+    """
+    first = zlib.crc32(source)
+    second = zlib.crc32(source, 0x9E3779B9) | 1
+    return [(first + i * second) % bits for i in range(BLOOM_HASHES)]
+
+
+def _source(line: bytes) -> bytes:
+    """
+    Returns the source Callsign of a raw plain-text Frame, or b''.
+    """
+    sd_delim = line.find(b'>')
+    return bytes(line[:sd_delim]).upper() if sd_delim != -1 else b''
+
+
+class ArchiveWriter(object):
+
+    """
+    ArchiveWriter Class.
+
+    Writes raw Frames into a block-compressed archive: an `ARCHIVE_HEADER`,
+    then independently compressed blocks of `block_records` capture records
+    (see `aprs.Capture.RECORD_HEADER`), then a footer index with the time
+    range and a source Callsign bloom filter of each block.
+
+    Bloom filters default to 8 bits per record, about a 3% false positive
+    rate when every record of a block has a different source.
+
+    Timestamps default to wall-clock ns, so archives stay comparable across
+    restarts, and are expected to be non-decreasing.
+    """
+
+    __slots__ = ['path', 'codec', 'level', 'block_records', 'bloom_bytes',
+                 'clock', 'records', '_file', '_compress', '_blocks',
+                 '_buffer', '_count', '_first', '_last', '_bloom']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, path: str, codec: str='zlib', level: int=None,
+                 block_records: int=4096, bloom_bytes: int=0,
+                 clock=time.time_ns) -> None:
+        if codec not in ARCHIVE_CODECS:
+            raise ValueError('Unsupported codec: %s' % codec)
+        if codec == 'lzma' and lzma is None:
+            raise ValueError('lzma is not available.')
+        self.path: str = path
+        self.codec: str = codec
+        self.level: int = level
+        self.block_records: int = block_records
+        self.bloom_bytes: int = bloom_bytes or block_records
+        self.clock = clock
+        self.records: int = 0
+
+        if codec == 'zlib':
+            self._compress = lambda data: zlib.compress(
+                data, -1 if level is None else level)
+        else:
+            self._compress = lambda data: lzma.compress(
+                data, preset=6 if level is None else level)
+
+        self._file = open(path, 'wb')
+        self._file.write(ARCHIVE_HEADER.pack(
+            ARCHIVE_MAGIC, ARCHIVE_CODECS[codec], self.bloom_bytes))
+        self._blocks: typing.List[bytes] = []
+        self._reset()
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return '<ArchiveWriter %s codec=%s records=%d blocks=%d>' % (
+            self.path, self.codec, self.records, len(self._blocks))
+
+    def _reset(self) -> None:
+        self._buffer: bytearray = bytearray()
+        self._count: int = 0
+        self._first: int = 0
+        self._last: int = 0
+        self._bloom: bytearray = bytearray(self.bloom_bytes)
+
+    def write(self, frame, timestamp: int=None, interface: int=0) -> None:
+        """
+        Appends a raw Frame (bytes, or an `aprs.Frame`).
+        """
+        if isinstance(frame, aprs.Frame):
+            frame = bytes(frame)
+        elif isinstance(frame, str):
+            frame = bytes(frame, 'UTF-8')
+        if timestamp is None:
+            timestamp = self.clock()
+
+        if not self._count:
+            self._first = timestamp
+        self._last = timestamp
+        bloom = self._bloom
+        for position in _bloom_positions(_source(frame), self.bloom_bytes * 8):
+            bloom[position >> 3] |= 1 << (position & 7)
+
+        self._buffer += aprs.Capture.RECORD_HEADER.pack(
+            len(frame), timestamp, interface)
+        self._buffer += frame
+        self._count += 1
+        self.records += 1
+        if self._count >= self.block_records:
+            self.flush()
+
+    def write_many(self, frames: typing.Iterable, interface: int=0) -> int:
+        """
+        Appends many raw Frames, timestamped now.
+
+        :returns: Number of records written.
+        :rtype: int
+        """
+        count = 0
+        for frame in frames:
+            self.write(frame, interface=interface)
+            count += 1
+        return count
+
+    def write_capture(self, reader: 'aprs.CaptureReader') -> int:
+        """
+        Appends every record of an `aprs.CaptureReader`.
+
+        :returns: Number of records written.
+        :rtype: int
+        """
+        count = 0
+        for timestamp, interface, payload in reader:
+            self.write(bytes(payload), timestamp, interface)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """
+        Compresses and writes the current block.
+        """
+        if not self._count:
+            return
+        data = self._compress(bytes(self._buffer))
+        offset = self._file.tell()
+        self._file.write(data)
+        self._blocks.append(
+            BLOCK_ENTRY.pack(offset, len(data), self._count, self._first,
+                             self._last) +
+            self._bloom)
+        self._reset()
+
+    def close(self) -> None:
+        """
+        Writes the last block and the footer index, and closes the archive.
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        index_offset = self._file.tell()
+        for entry in self._blocks:
+            self._file.write(entry)
+        self._file.write(ARCHIVE_TRAILER.pack(
+            index_offset, len(self._blocks), ARCHIVE_MAGIC))
+        self._file.close()
+
+
+class ArchiveReader(object):
+
+    """
+    ArchiveReader Class.
+
+    Random access to an archive written by `aprs.ArchiveWriter`. Queries by
+    time range and source Callsign only decompress the blocks whose footer
+    index entry can match.
+
+    Records are `(timestamp, interface, payload)` tuples, as from
+    `aprs.CaptureReader`.
+    """
+
+    __slots__ = ['path', 'codec', 'bloom_bytes', 'blocks', 'blocks_read',
+                 '_file', '_decompress']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self._file = open(path, 'rb')
+        try:
+            self._read_footer()
+        except (aprs.BadCaptureError, struct.error):
+            self._file.close()
+            raise aprs.BadCaptureError('Not an archive: %s' % path)
+        # Number of blocks decompressed so far:
+        self.blocks_read: int = 0
+
+    def __enter__(self) -> 'ArchiveReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __iter__(self) -> typing.Iterator[tuple]:
+        return self.records()
+
+    def __len__(self) -> int:
+        return sum(block[2] for block in self.blocks)
+
+    def __repr__(self) -> str:
+        return '<ArchiveReader %s codec=%s blocks=%d>' % (
+            self.path, self.codec, len(self.blocks))
+
+    def _read_footer(self) -> None:
+        magic, codec_id, self.bloom_bytes = ARCHIVE_HEADER.unpack(
+            self._file.read(ARCHIVE_HEADER.size))
+        if magic != ARCHIVE_MAGIC:
+            raise aprs.BadCaptureError('Bad header.')
+        codecs = {value: name for name, value in ARCHIVE_CODECS.items()}
+        self.codec: str = codecs.get(codec_id)
+        if self.codec == 'zlib':
+            self._decompress = zlib.decompress
+        elif self.codec == 'lzma' and lzma is not None:
+            self._decompress = lzma.decompress
+        else:
+            raise aprs.BadCaptureError('Unsupported codec: %s' % codec_id)
+
+        size = os.fstat(self._file.fileno()).st_size
+        if size < ARCHIVE_HEADER.size + ARCHIVE_TRAILER.size:
+            raise aprs.BadCaptureError('Truncated archive.')
+        self._file.seek(-ARCHIVE_TRAILER.size, 2)
+        index_offset, count, magic = ARCHIVE_TRAILER.unpack(
+            self._file.read(ARCHIVE_TRAILER.size))
+        if magic != ARCHIVE_MAGIC:
+            raise aprs.BadCaptureError('Bad trailer, incomplete archive?')
+
+        entry_size = BLOCK_ENTRY.size + self.bloom_bytes
+        self._file.seek(index_offset)
+        index = self._file.read(count * entry_size)
+        # (offset, length, count, first, last, bloom) of each block:
+        self.blocks: typing.List[tuple] = []
+        for start in range(0, count * entry_size, entry_size):
+            bloom = index[start + BLOCK_ENTRY.size:start + entry_size]
+            self.blocks.append(
+                BLOCK_ENTRY.unpack_from(index, start) + (bloom,))
+
+    def candidates(self, start: int=None, end: int=None,
+                   source: bytes=None) -> typing.List[int]:
+        """
+        Returns the indices of blocks that may hold records with
+        `start <= timestamp < end` from `source`.
+        """
+        if source is not None:
+            if isinstance(source, str):
+                source = bytes(source, 'UTF-8')
+            positions = _bloom_positions(
+                source.upper(), self.bloom_bytes * 8)
+
+        matches = []
+        for idx, (_, _, _, first, last, bloom) in enumerate(self.blocks):
+            if start is not None and last < start:
+                continue
+            if end is not None and first >= end:
+                continue
+            if source is not None and not all(
+                    bloom[pos >> 3] & (1 << (pos & 7)) for pos in positions):
+                continue
+            matches.append(idx)
+        return matches
+
+    def read_block(self, idx: int) -> bytes:
+        """
+        Decompresses block `idx`.
+        """
+        offset, length = self.blocks[idx][:2]
+        self._file.seek(offset)
+        self.blocks_read += 1
+        return self._decompress(self._file.read(length))
+
+    def records(self, start: int=None, end: int=None,
+                source: bytes=None) -> typing.Iterator[tuple]:
+        """
+        Yields the records with `start <= timestamp < end` from `source`,
+        decompressing one block at a time.
+        """
+        if isinstance(source, str):
+            source = bytes(source, 'UTF-8')
+        if source is not None:
+            source = source.upper()
+        if source is not None:
+            prefix = source + b'>'
+        unpack_from = aprs.Capture.RECORD_HEADER.unpack_from
+        header_size = aprs.Capture.RECORD_HEADER.size
+
+        for idx in self.candidates(start, end, source):
+            block = memoryview(self.read_block(idx))
+            offset = 0
+            while offset < len(block):
+                length, timestamp, interface = unpack_from(block, offset)
+                offset += header_size
+                payload = block[offset:offset + length]
+                offset += length
+                if start is not None and timestamp < start:
+                    continue
+                if end is not None and timestamp >= end:
+                    break
+                if (source is not None and
+                        bytes(payload[:len(prefix)]).upper() != prefix):
+                    continue
+                yield timestamp, interface, payload
+
+    def lines(self, start: int=None, end: int=None,
+              source: bytes=None) -> typing.Iterator[bytes]:
+        """
+        Yields the raw Frames matching a query, as bytes.
+        """
+        for record in self.records(start, end, source):
+            yield bytes(record[2])
+
+    def frames(self, start: int=None, end: int=None, source: bytes=None,
+               lazy: bool=False) -> typing.Iterator['aprs.Frame']:
+        """
+        Yields `aprs.Frame` objects matching a query.
+        """
+        for line in self.lines(start, end, source):
+            yield aprs.Frame.parse(line, lazy=lazy)
+
+    def batches(self, start: int=None, end: int=None,
+                source: bytes=None) -> typing.Iterator['aprs.FrameBatch']:
+        """
+        Yields one `aprs.FrameBatch` per matching block.
+        """
+        lines = []
+        block = None
+        for record in self.records(start, end, source):
+            if record[2].obj is not block and lines:
+                yield aprs.FrameBatch.from_lines(lines)
+                lines = []
+            block = record[2].obj
+            lines.append(record[2])
+        if lines:
+            yield aprs.FrameBatch.from_lines(lines)
+
+    def close(self) -> None:
+        """
+        Closes the archive.
+        """
+        self._file.close()
@@ -8,6 +8,9 @@ import aprs  # pylint: disable=R0801
 
 AprsCallsign = typing.TypeVar('AprsCallsign', bound='aprs.Callsign')
 
+# Every byte value with the low bit clear, for `Callsign.is_ax25`.
+_EVEN_BYTES = bytes(range(0, 256, 2))
+
 class Callsign(object):
 
     """
@@ -27,6 +30,9 @@ class Callsign(object):
 
     __slots__ = ['callsign', 'ssid', 'digi']
 
+    # Optional aprs.CallsignCache, see `enable_cache`.
+    cache = None
+
     def __init__(self, callsign: bytes=b'', ssid: bytes=b'0',
                  digi: bool=False) -> None:
         self.callsign: bytes = callsign
@@ -40,19 +46,69 @@ class Callsign(object):
         """
         if isinstance(raw_callsign, cls):
             return raw_callsign
-        try:
+        elif isinstance(raw_callsign, str):
+            return cls.from_text(bytes(raw_callsign, 'UTF-8'))
+        elif cls.is_ax25(raw_callsign):
             return cls.from_ax25(raw_callsign)
-        except:
-            if isinstance(raw_callsign, str):
-                return cls.from_text(bytes(raw_callsign, 'UTF-8'))
-            else:
-                return cls.from_text(raw_callsign)
+        else:
+            return cls.from_text(raw_callsign)
+
+    @classmethod
+    def parse_many(cls, raw_callsigns: typing.Iterable) -> \
+            typing.List[AprsCallsign]:
+        """
+        Parses many AX.25/APRS Callsigns, see `parse`.
+        """
+        parse = cls.parse
+        return [parse(raw_callsign) for raw_callsign in raw_callsigns]
+
+    @staticmethod
+    def is_ax25(raw_callsign: bytes) -> bool:
+        """
+        Classifies a Callsign as AX.25 (rather than plain-text) without
+        decoding it.
+
+        AX.25 Callsigns are at least 7 bytes, and the address-end flag (the
+        low bit) is clear on each of the first 6 bytes.
+        """
+        return (len(raw_callsign) >= 7 and
+                not bytes(raw_callsign[:6]).translate(None, _EVEN_BYTES))
+
+    @classmethod
+    def enable_cache(cls, maxsize: int=4096) -> 'aprs.CallsignCache':
+        """
+        Interns plain-text Callsigns in a bounded LRU cache.
+
+        Once enabled, `from_text` (and so `parse` and `aprs.Frame.from_text`)
+        return shared, immutable `aprs.FrozenCallsign` objects.
+        """
+        if Callsign.cache is None:
+            Callsign.cache = aprs.CallsignCache(maxsize)
+        else:
+            Callsign.cache.resize(maxsize)
+        return Callsign.cache
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        """
+        Stops interning plain-text Callsigns.
+        """
+        Callsign.cache = None
 
     @classmethod
     def from_text(cls, raw_callsign: bytes) -> AprsCallsign:
         """
         Parses an AX.25/APRS Callsign & SSID from a plain-text AX.25/APRS Frame.
         """
+        if Callsign.cache is not None:
+            return Callsign.cache.get(raw_callsign)
+        return cls._from_text(raw_callsign)
+
+    @classmethod
+    def _from_text(cls, raw_callsign: bytes) -> AprsCallsign:
+        """
+        Uncached `from_text`.
+        """
         _callsign = raw_callsign
         ssid = b'0'
         digi = False
@@ -183,3 +239,23 @@ class Callsign(object):
         encoded_callsign.append(bytes([encoded_ssid]))
 
         return b''.join(encoded_callsign)
+
+
+class FrozenCallsign(Callsign):
+
+    """
+    FrozenCallsign Class.
+
+    Immutable Callsign, as shared by `aprs.CallsignCache`.
+    """
+
+    __slots__ = []
+
+    def __init__(self, callsign: bytes=b'', ssid: bytes=b'0',
+                 digi: bool=False) -> None:
+        object.__setattr__(self, 'callsign', callsign)
+        object.__setattr__(self, 'ssid', ssid)
+        object.__setattr__(self, 'digi', digi)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError('FrozenCallsign is immutable.')
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import collections
+import logging
+import typing
+
+import aprs  # pylint: disable=R0801
+
+
+class CallsignCache(object):
+
+    """
+    CallsignCache Class.
+
+    Bounded LRU of plain-text Callsigns, keyed on the raw bytes, that hands
+    out shared, immutable `aprs.FrozenCallsign` objects.
+    """
+
+    __slots__ = ['maxsize', 'hits', 'misses', 'evictions', '_entries']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, maxsize: int=4096) -> None:
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, raw_callsign: bytes) -> bool:
+        return raw_callsign in self._entries
+
+    def get(self, raw_callsign: bytes) -> 'aprs.FrozenCallsign':
+        """
+        Returns the shared Callsign for `raw_callsign`, parsing and caching
+        it on a miss.
+        """
+        if not isinstance(raw_callsign, bytes):
+            raw_callsign = bytes(raw_callsign)
+
+        entries = self._entries
+        callsign = entries.get(raw_callsign)
+        if callsign is not None:
+            self.hits += 1
+            try:
+                entries.move_to_end(raw_callsign)
+            except KeyError:
+                # Evicted by another thread in the meantime.
+                pass
+            return callsign
+
+        self.misses += 1
+        callsign = aprs.FrozenCallsign._from_text(raw_callsign)  # NOQA pylint: disable=W0212
+        entries[raw_callsign] = callsign
+        while len(entries) > self.maxsize:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                break
+            self.evictions += 1
+        return callsign
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Changes the maximum number of cached Callsigns, evicting the least
+        recently used as needed.
+        """
+        self.maxsize = maxsize
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Empties the cache and resets the counters.
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the cache counters.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize
+        }
@@ -0,0 +1,346 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import bisect
+import logging
+import mmap
+import os
+import struct
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+
+# File header of a capture file.
+CAPTURE_MAGIC = b'APRSCAP1'
+
+# Each record: payload length, receive timestamp (monotonic ns) and
+# interface id, followed by the raw Frame (plain-text or AX.25).
+RECORD_HEADER = struct.Struct('<IqH')
+
+# Each `.idx` sidecar entry: timestamp and file offset of a record.
+INDEX_ENTRY = struct.Struct('<qQ')
+
+# Suffix of the sparse time index sidecar.
+INDEX_SUFFIX = '.idx'
+
+
+class CaptureWriter(object):
+
+    """
+    CaptureWriter Class.
+
+    Appends received Frames to a capture file: `CAPTURE_MAGIC`, then
+    length-prefixed records (see `RECORD_HEADER`).
+
+    fsyncs are batched, every `sync_every` records or `sync_interval`
+    seconds, whichever comes first. Every `index_every` records the
+    timestamp & offset is appended to a sparse `.idx` sidecar, which
+    `CaptureReader` uses to seek by time.
+
+    Timestamps are expected to be non-decreasing. Reopening an existing
+    capture appends to it, after cutting off a record left partially
+    written by a crash (and any `.idx` entries past it).
+    """
+
+    __slots__ = ['path', 'interface', 'sync_every', 'sync_interval',
+                 'index_every', 'clock', 'records', 'syncs', '_file',
+                 '_index', '_offset', '_pending', '_last_sync']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, path: str, interface: int=0, sync_every: int=1024,
+                 sync_interval: float=1.0, index_every: int=1024,
+                 clock=time.monotonic_ns) -> None:
+        self.path: str = path
+        self.interface: int = interface
+        self.sync_every: int = sync_every
+        self.sync_interval: float = sync_interval
+        self.index_every: int = index_every
+        self.clock = clock
+        self.records: int = 0
+        self.syncs: int = 0
+
+        self._file = open(path, 'ab')
+        self._offset: int = self._file.tell()
+        if self._offset == 0:
+            self._file.write(CAPTURE_MAGIC)
+            self._offset = len(CAPTURE_MAGIC)
+        else:
+            try:
+                self._offset = self._recover()
+            except aprs.BadCaptureError:
+                self._file.close()
+                raise
+        self._index = open(path + INDEX_SUFFIX, 'ab')
+        self._pending: int = 0
+        self._last_sync: float = time.monotonic()
+
+    def _recover(self) -> int:
+        """
+        Truncates an existing capture after its last complete record, and
+        its `.idx` sidecar to the entries before that.
+
+        :returns: Offset of the end of the last complete record.
+        :rtype: int
+        """
+        header_size = RECORD_HEADER.size
+        unpack_from = RECORD_HEADER.unpack_from
+        with open(self.path, 'r+b') as capture:
+            if capture.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+                raise aprs.BadCaptureError(
+                    'Not a capture file: %s' % self.path)
+            size = os.fstat(capture.fileno()).st_size
+            offset = len(CAPTURE_MAGIC)
+            with mmap.mmap(capture.fileno(), 0,
+                           access=mmap.ACCESS_READ) as buf:
+                while offset + header_size <= size:
+                    end = offset + header_size + unpack_from(buf, offset)[0]
+                    if end > size:
+                        break
+                    offset = end
+            if offset < size:
+                self._logger.warning(
+                    'Truncating partial record at %d in %s', offset,
+                    self.path)
+                capture.truncate(offset)
+
+        try:
+            with open(self.path + INDEX_SUFFIX, 'r+b') as index_file:
+                data = index_file.read()
+                entries = 0
+                for _, entry_offset in INDEX_ENTRY.iter_unpack(
+                        data[:len(data) - len(data) % INDEX_ENTRY.size]):
+                    if entry_offset >= offset:
+                        break
+                    entries += 1
+                if entries * INDEX_ENTRY.size < len(data):
+                    index_file.truncate(entries * INDEX_ENTRY.size)
+        except FileNotFoundError:
+            pass
+        return offset
+
+    def __enter__(self) -> 'CaptureWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return '<CaptureWriter %s records=%d>' % (self.path, self.records)
+
+    def write(self, frame, timestamp: int=None, interface: int=None) -> int:
+        """
+        Appends a raw Frame (bytes, or an `aprs.Frame`).
+
+        :param timestamp: Receive time in monotonic ns, defaults to `clock`.
+        :param interface: Source interface id, defaults to `interface`.
+
+        :returns: File offset of the record.
+        :rtype: int
+        """
+        if isinstance(frame, aprs.Frame):
+            frame = bytes(frame)
+        elif isinstance(frame, str):
+            frame = bytes(frame, 'UTF-8')
+        if timestamp is None:
+            timestamp = self.clock()
+        if interface is None:
+            interface = self.interface
+
+        offset = self._offset
+        if self.records % self.index_every == 0:
+            self._index.write(INDEX_ENTRY.pack(timestamp, offset))
+
+        self._file.write(RECORD_HEADER.pack(len(frame), timestamp, interface))
+        self._file.write(frame)
+        self._offset += RECORD_HEADER.size + len(frame)
+        self.records += 1
+
+        self._pending += 1
+        if (self._pending >= self.sync_every or
+                time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+        return offset
+
+    def write_many(self, frames: typing.Iterable, interface: int=None) -> int:
+        """
+        Appends many raw Frames, timestamped now.
+
+        :returns: Number of records written.
+        :rtype: int
+        """
+        count = 0
+        for frame in frames:
+            self.write(frame, interface=interface)
+            count += 1
+        return count
+
+    def sync(self) -> None:
+        """
+        Flushes & fsyncs the capture file and its index.
+        """
+        for handle in (self._file, self._index):
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self.syncs += 1
+
+    def close(self) -> None:
+        """
+        Syncs and closes the capture file.
+        """
+        if self._file.closed:
+            return
+        self.sync()
+        self._file.close()
+        self._index.close()
+
+
+class CaptureReader(object):
+
+    """
+    CaptureReader Class.
+
+    Reads a capture file through `mmap`. Records are yielded as
+    `(timestamp, interface, payload)` tuples where `payload` is a
+    zero-copy `memoryview`, valid until the reader is closed.
+
+    `seek` and `between` jump to a timestamp through the sparse `.idx`
+    sidecar, or through an index built by scanning the record headers when
+    there's no sidecar. A partially written last record is ignored.
+    """
+
+    __slots__ = ['path', 'index', '_file', '_mmap', '_view']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, path: str, index_every: int=1024) -> None:
+        self.path: str = path
+        self._file = open(path, 'rb')
+        if self._file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            self._file.close()
+            raise aprs.BadCaptureError('Not a capture file: %s' % path)
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        # Sorted (timestamp, offset) pairs:
+        self.index: typing.List[typing.Tuple[int, int]] = (
+            self._read_index() or self.build_index(index_every))
+
+    def __enter__(self) -> 'CaptureReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __iter__(self) -> typing.Iterator[tuple]:
+        return self.records()
+
+    def __repr__(self) -> str:
+        return '<CaptureReader %s bytes=%d>' % (self.path, len(self._mmap))
+
+    def _read_index(self) -> typing.List[typing.Tuple[int, int]]:
+        try:
+            with open(self.path + INDEX_SUFFIX, 'rb') as index_file:
+                data = index_file.read()
+        except OSError:
+            return []
+        size = len(self._mmap)
+        data = data[:len(data) - len(data) % INDEX_ENTRY.size]
+        return [(timestamp, offset) for timestamp, offset
+                in INDEX_ENTRY.iter_unpack(data) if offset < size]
+
+    def build_index(self, index_every: int=1024) -> \
+            typing.List[typing.Tuple[int, int]]:
+        """
+        Builds a sparse time index by scanning the record headers.
+        """
+        index = []
+        for count, (offset, timestamp, _, _) in enumerate(self._headers()):
+            if count % index_every == 0:
+                index.append((timestamp, offset))
+        return index
+
+    def write_index(self) -> None:
+        """
+        Writes the time index to the `.idx` sidecar.
+        """
+        with open(self.path + INDEX_SUFFIX, 'wb') as index_file:
+            for timestamp, offset in self.index:
+                index_file.write(INDEX_ENTRY.pack(timestamp, offset))
+
+    def _headers(self, offset: int=len(CAPTURE_MAGIC)) -> \
+            typing.Iterator[typing.Tuple[int, int, int, int]]:
+        """
+        Yields `(offset, timestamp, interface, length)` of each complete
+        record from `offset` on.
+        """
+        buf = self._mmap
+        size = len(buf)
+        unpack_from = RECORD_HEADER.unpack_from
+        header_size = RECORD_HEADER.size
+        while offset + header_size <= size:
+            length, timestamp, interface = unpack_from(buf, offset)
+            if offset + header_size + length > size:
+                self._logger.warning(
+                    'Truncated record at %d in %s', offset, self.path)
+                return
+            yield offset, timestamp, interface, length
+            offset += header_size + length
+
+    def records(self, offset: int=len(CAPTURE_MAGIC)) -> \
+            typing.Iterator[tuple]:
+        """
+        Yields `(timestamp, interface, payload)` records from `offset` on.
+        """
+        view = self._view
+        header_size = RECORD_HEADER.size
+        for start, timestamp, interface, length in self._headers(offset):
+            start += header_size
+            yield timestamp, interface, view[start:start + length]
+
+    def seek(self, timestamp: int) -> int:
+        """
+        Returns the offset of the first record at or after `timestamp`.
+        """
+        # Last indexed record strictly before `timestamp`, if any:
+        pos = bisect.bisect_left(self.index, (timestamp,)) - 1
+        offset = self.index[pos][1] if pos >= 0 else len(CAPTURE_MAGIC)
+        for offset, record_time, _, _ in self._headers(offset):
+            if record_time >= timestamp:
+                return offset
+        return len(self._mmap)
+
+    def between(self, start: int=None, end: int=None) -> \
+            typing.Iterator[tuple]:
+        """
+        Yields records with `start <= timestamp < end`.
+        """
+        offset = len(CAPTURE_MAGIC) if start is None else self.seek(start)
+        for record in self.records(offset):
+            if end is not None and record[0] >= end:
+                return
+            yield record
+
+    def close(self) -> None:
+        """
+        Closes the capture file. Yielded payloads must be released first.
+        """
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
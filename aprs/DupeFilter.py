@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import collections
+import logging
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+
+
+class DupeFilter(object):
+
+    """
+    DupeFilter Class.
+
+    Suppresses copies of the same packet heard through several iGates or
+    paths within a time window, in the spirit of aprsc's 30 second dupe
+    check.
+
+    Packets are keyed on a hash of the source, destination and info (the
+    path is ignored). Keys live in a set for O(1) checks, and in a
+    time-ordered ring buffer for O(1) expiry.
+    """
+
+    __slots__ = ['window', 'clock', 'seen', 'suppressed', '_expiry', '_keys']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, window: float=30.0, clock=time.monotonic) -> None:
+        self.window: float = window
+        self.clock = clock
+        self.seen: int = 0
+        self.suppressed: int = 0
+        self._expiry: collections.deque = collections.deque()
+        self._keys: typing.Set[int] = set()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of packets currently in the window.
+        """
+        return len(self._keys)
+
+    def __call__(self, frame) -> bool:
+        """
+        Returns True if `frame` should pass, ie: it's not a duplicate. Makes
+        a DupeFilter usable with `filter()`.
+        """
+        return not self.is_duplicate(frame)
+
+    @staticmethod
+    def key(frame) -> int:
+        """
+        Hashes the source, destination and info of a raw plain-text Frame or
+        of an `aprs.Frame`.
+        """
+        if isinstance(frame, aprs.Frame):
+            return hash((bytes(frame.source), bytes(frame.destination),
+                         bytes(frame.info).rstrip(b' \r\n')))
+
+        if not isinstance(frame, bytes):
+            frame = bytes(frame)
+        try:
+            sd_delim, pi_delim = aprs.Frame.find_delimiters(frame)
+        except ValueError:
+            return hash(frame)
+        dest_end = frame.find(b',', sd_delim + 1, pi_delim)
+        if dest_end == -1:
+            dest_end = pi_delim
+        return hash((frame[:sd_delim], frame[sd_delim + 1:dest_end],
+                     frame[pi_delim + 1:].rstrip(b' \r\n')))
+
+    def is_duplicate(self, frame, now: float=None) -> bool:
+        """
+        Checks `frame` against the window, and records it if it's new.
+
+        :returns: True if the same packet was seen within the window.
+        :rtype: bool
+        """
+        if now is None:
+            now = self.clock()
+        self.expire(now)
+        self.seen += 1
+
+        key = self.key(frame)
+        if key in self._keys:
+            self.suppressed += 1
+            return True
+
+        self._keys.add(key)
+        self._expiry.append((now + self.window, key))
+        return False
+
+    def expire(self, now: float=None) -> None:
+        """
+        Drops packets that have left the window.
+        """
+        if now is None:
+            now = self.clock()
+        expiry = self._expiry
+        keys = self._keys
+        while expiry and expiry[0][0] <= now:
+            keys.discard(expiry.popleft()[1])
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the DupeFilter counters.
+        """
+        return {
+            'seen': self.seen,
+            'passed': self.seen - self.suppressed,
+            'suppressed': self.suppressed,
+            'window_size': len(self._keys)
+        }
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import http.server
+import logging
+import socket
+import socketserver
+import threading
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+
+AprsEmulator = typing.TypeVar('AprsEmulator', bound='aprs.Emulator')
+
+
+class _TCPHandler(socketserver.BaseRequestHandler):
+
+    """Handles one APRS-IS TCP client: login, then stream & uplink."""
+
+    def handle(self) -> None:
+        emulator = self.server.emulator
+        sock = self.request
+        sock.sendall(b'# ' + emulator.banner + b'\r\n')
+
+        rfile = sock.makefile('rb')
+        login = rfile.readline().strip()
+        if not login:
+            return
+        fields = login.split()
+        user = b'N0CALL'
+        verified = False
+        if len(fields) >= 4 and fields[0] == b'user' and fields[2] == b'pass':
+            user = fields[1]
+            verified = fields[3] == b'%d' % aprs.passcode(user)
+        emulator.logins.append(login)
+        sock.sendall(b'# logresp %s %s, server %s\r\n' % (
+            user, b'verified' if verified else b'unverified',
+            emulator.server_name))
+
+        uplink = threading.Thread(
+            target=emulator._read_uplink, args=(rfile,), daemon=True)
+        uplink.start()
+
+        emulator._stream(sock)
+        if emulator.close_after_stream:
+            # Only close our side: shutting down reads too would drop
+            # uplinked Frames the reader thread hasn't got to yet.
+            try:
+                sock.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+        uplink.join()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+
+    """Threaded TCP listener that can rebind a port still in TIME_WAIT."""
+
+    allow_reuse_address = True
+
+
+class _UDPHandler(socketserver.BaseRequestHandler):
+
+    """Handles one APRS-IS UDP submission: login line, then Frames."""
+
+    def handle(self) -> None:
+        self.server.emulator._submission(b'udp', self.request[0])
+
+
+class _HTTPHandler(http.server.BaseHTTPRequestHandler):
+
+    """Handles APRS-IS HTTP submissions: login line, then Frames."""
+
+    def do_POST(self) -> None:  # pylint: disable=C0103
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.server.emulator._submission(b'http', body):
+            self.send_response(204)
+        else:
+            self.send_response(400)
+        self.end_headers()
+
+    def log_message(self, *args) -> None:  # pylint: disable=W0221
+        pass
+
+
+class Emulator(object):
+
+    """
+    Emulator Class.
+
+    A local APRS-IS stand-in, for load & latency testing without a real
+    server.
+
+    The TCP side speaks the banner & logresp handshake of `aprs.TCP.start`,
+    then streams `frames` at `rate` Frames/s (0 for as fast as possible) in
+    bursts of `burst` Frames, and records Frames uplinked by the client.
+    With `disconnect_after`, each connection is dropped after that many
+    Frames, to exercise reconnects.
+
+    UDP and HTTP listeners accept the submissions of `aprs.UDP` and
+    `aprs.HTTP`. Every uplinked Frame lands in `uplinked` as a
+    `(monotonic ns, transport, frame)` tuple.
+    """
+
+    __slots__ = ['frames', 'rate', 'burst', 'disconnect_after',
+                 'close_after_stream', 'host', 'banner', 'server_name',
+                 'logins', 'uplinked', 'sent', 'connections', '_ports',
+                 '_servers', '_threads', '_stop', '_cond']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, frames: typing.Sequence[bytes]=(), rate: float=0,
+                 burst: int=1, disconnect_after: int=0,
+                 close_after_stream: bool=True, host: str='127.0.0.1',
+                 tcp_port: int=0, udp_port: int=0, http_port: int=0,
+                 server_name: bytes=b'T2EMU') -> None:
+        self.frames: typing.List[bytes] = [
+            bytes(frame, 'UTF-8') if isinstance(frame, str) else bytes(frame)
+            for frame in frames]
+        self.rate: float = rate
+        self.burst: int = max(1, burst)
+        self.disconnect_after: int = disconnect_after
+        self.close_after_stream: bool = close_after_stream
+        self.host: str = host
+        self.banner: bytes = b'aprsc-emulator Python APRS Module'
+        self.server_name: bytes = server_name
+        self.logins: typing.List[bytes] = []
+        self.uplinked: typing.List[typing.Tuple[int, bytes, bytes]] = []
+        self.sent: int = 0
+        self.connections: int = 0
+        self._ports = {'tcp': tcp_port, 'udp': udp_port, 'http': http_port}
+        self._servers: typing.Dict[str, socketserver.BaseServer] = {}
+        self._threads: typing.List[threading.Thread] = []
+        self._stop: threading.Event = threading.Event()
+        self._cond: threading.Condition = threading.Condition()
+
+    @classmethod
+    def from_capture(cls, path: str, **kwargs) -> AprsEmulator:
+        """
+        Builds an Emulator that streams the Frames of an `aprs.Capture`
+        file.
+        """
+        with aprs.CaptureReader(path) as reader:
+            frames = [bytes(payload) for _, _, payload in reader]
+        return cls(frames, **kwargs)
+
+    @staticmethod
+    def synthetic_frames(count: int=10000,
+                         stations: int=1000) -> typing.List[bytes]:
+        """
+        Returns `count` synthetic position Frames from `stations` stations,
+        each with its own source callsign (EMU0-1 through EMU0-15, then
+        EMU1-1 and so on).
+        """
+        frames = []
+        for idx in range(count):
+            station = idx % stations
+            frames.append(
+                b'EMU%d-%d>APRS,TCPIP*,qAC,T2EMU:!%02d%05.2fN/%03d%05.2fW-'
+                b'Emulated %d' % (
+                    station // 15, station % 15 + 1, station % 90,
+                    idx % 6000 / 100, station % 180, idx % 6000 / 100, idx))
+        return frames
+
+    def __enter__(self) -> AprsEmulator:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return '<Emulator %s frames=%d sent=%d uplinked=%d>' % (
+            self.host, len(self.frames), self.sent, len(self.uplinked))
+
+    @property
+    def servers(self) -> typing.List[bytes]:
+        """
+        `servers` argument for `aprs.TCP`.
+        """
+        return [b'%s:%d' % (self.host.encode(), self.address('tcp')[1])]
+
+    @property
+    def url(self) -> str:
+        """
+        `url` argument for `aprs.HTTP`.
+        """
+        return 'http://%s:%d/' % self.address('http')
+
+    def address(self, transport: str) -> typing.Tuple[str, int]:
+        """
+        Returns the listening address of 'tcp', 'udp' or 'http'.
+        """
+        return self._servers[transport].server_address[:2]
+
+    def start(self) -> AprsEmulator:
+        """
+        Starts the TCP, UDP & HTTP listeners.
+        """
+        self._stop.clear()
+        servers = {
+            'tcp': (_TCPServer, _TCPHandler),
+            'udp': (socketserver.ThreadingUDPServer, _UDPHandler),
+            'http': (http.server.ThreadingHTTPServer, _HTTPHandler),
+        }
+        for transport, (server_class, handler) in servers.items():
+            server = server_class((self.host, self._ports[transport]),
+                                  handler)
+            server.daemon_threads = True
+            server.emulator = self
+            self._servers[transport] = server
+            thread = threading.Thread(
+                target=server.serve_forever, kwargs={'poll_interval': 0.05},
+                daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self._logger.info('Emulator started: %s', self._servers)
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops all listeners and streams.
+        """
+        self._stop.set()
+        for server in self._servers.values():
+            server.shutdown()
+            server.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _stream(self, sock: socket.socket) -> None:
+        """
+        Streams `frames` to one client, paced by `rate` & `burst`.
+        """
+        with self._cond:
+            self.connections += 1
+        frames = self.frames
+        burst = self.burst
+        interval = burst / self.rate if self.rate else 0
+        deadline = time.monotonic()
+        sent = 0
+        try:
+            for start in range(0, len(frames), burst):
+                chunk = frames[start:start + burst]
+                if self.disconnect_after:
+                    chunk = chunk[:self.disconnect_after - sent]
+                sock.sendall(b''.join(frame + b'\r\n' for frame in chunk))
+                sent += len(chunk)
+                with self._cond:
+                    self.sent += len(chunk)
+                if self.disconnect_after and sent >= self.disconnect_after:
+                    self._logger.debug('Dropping client after %d', sent)
+                    sock.shutdown(socket.SHUT_RDWR)
+                    return
+                if interval:
+                    deadline += interval
+                    delay = deadline - time.monotonic()
+                    if delay > 0 and self._stop.wait(delay):
+                        return
+                elif self._stop.is_set():
+                    return
+        except OSError as ex:
+            self._logger.debug('Client went away: %s', ex)
+
+    def _read_uplink(self, rfile) -> None:
+        try:
+            for line in rfile:
+                line = line.strip()
+                if line and not line.startswith(b'#'):
+                    self._uplink(b'tcp', line)
+        except (OSError, ValueError):
+            pass
+
+    def _uplink(self, transport: bytes, frame: bytes) -> None:
+        with self._cond:
+            self.uplinked.append((time.monotonic_ns(), transport, frame))
+            self._cond.notify_all()
+
+    def _submission(self, transport: bytes, body: bytes) -> bool:
+        """
+        Records a UDP or HTTP submission: a login line, then Frames.
+        """
+        lines = body.split(b'\n')
+        if not lines[0].startswith(b'user '):
+            self._logger.warning('Submission without login: %s', body)
+            return False
+        self.logins.append(lines[0].strip())
+        for line in lines[1:]:
+            line = line.strip()
+            if line:
+                self._uplink(transport, line)
+        return True
+
+    def wait_uplinked(self, count: int, timeout: float=5.0) -> bool:
+        """
+        Waits until at least `count` Frames have been uplinked.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: len(self.uplinked) >= count, timeout)
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the Emulator counters.
+        """
+        return {
+            'connections': self.connections,
+            'logins': len(self.logins),
+            'sent': self.sent,
+            'uplinked': len(self.uplinked)
+        }
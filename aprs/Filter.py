@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import math
+import typing
+
+import aprs  # pylint: disable=R0801
+
+AprsFilter = typing.TypeVar('AprsFilter', bound='aprs.Filter')
+
+# Kilometers per degree of latitude.
+KM_PER_DEGREE = math.radians(aprs.geo_util.EARTH_RADIUS)
+
+# Data Type Identifiers for each `t/` filter type.
+TYPE_FILTER_MAP = {
+    'p': frozenset(b'!=/@`\'\x1c\x1d$'),
+    'o': frozenset(b';'),
+    'i': frozenset(b')'),
+    'm': frozenset(b':'),
+    'q': frozenset(b'?'),
+    's': frozenset(b'>'),
+    't': frozenset(b'T'),
+    'u': frozenset(b'{'),
+    'w': frozenset(b'_#*'),
+}
+
+_EXACT = 1
+_PREFIX = 2
+
+
+class _PrefixTrie(object):
+
+    """
+    Byte-wise trie of exact and prefix (trailing '*') callsign patterns.
+    """
+
+    __slots__ = ['root']
+
+    def __init__(self) -> None:
+        self.root: dict = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.root)
+
+    def add(self, pattern: bytes, prefix: bool=False) -> None:
+        if pattern.endswith(b'*'):
+            pattern = pattern[:-1]
+            prefix = True
+        node = self.root
+        for char in pattern.upper():
+            node = node.setdefault(char, {})
+        node[None] = node.get(None, 0) | (_PREFIX if prefix else _EXACT)
+
+    def match(self, word: bytes) -> bool:
+        node = self.root
+        for char in word:
+            if node.get(None, 0) & _PREFIX:
+                return True
+            node = node.get(char)
+            if node is None:
+                return False
+        return bool(node.get(None, 0))
+
+
+class _FrameContext(object):
+
+    """
+    Lazily extracted fields of a Frame, shared by all clauses of a Filter
+    while checking that Frame.
+    """
+
+    __slots__ = ['frame', '_info', '_position']
+
+    _UNSET = object()
+
+    def __init__(self, frame: 'aprs.Frame') -> None:
+        self.frame = frame
+        self._info = None
+        self._position = self._UNSET
+
+    @property
+    def info(self) -> bytes:
+        if self._info is None:
+            self._info = bytes(self.frame.info)
+        return self._info
+
+    @property
+    def data_type(self) -> int:
+        info = self.info
+        return info[0] if info else -1
+
+    @property
+    def source(self) -> bytes:
+        return bytes(self.frame.source).rstrip(b'*')
+
+    @property
+    def position(self) -> 'aprs.Position':
+        if self._position is self._UNSET:
+            try:
+                self._position = aprs.Position.parse(
+                    self.info, self.frame.destination.callsign)
+            except (aprs.BadPositionError, ValueError, IndexError):
+                self._position = None
+        return self._position
+
+    def path_calls(self) -> typing.Iterator[typing.Tuple[bytes, bool]]:
+        for call in self.frame.path:
+            text = bytes(call).rstrip(b'*')
+            yield text, call.digi or bytes(call).endswith(b'*')
+
+    def digipeaters(self) -> typing.List[bytes]:
+        """
+        The path calls that have digipeated the Frame: in TNC2 notation,
+        every hop up to and including the last one flagged with '*'.
+        """
+        calls = list(self.path_calls())
+        used = 0
+        for idx, (_, digi) in enumerate(calls):
+            if digi:
+                used = idx + 1
+        return [text for text, _ in calls[:used]]
+
+    @property
+    def entry(self) -> bytes:
+        """
+        The station that gated the Frame into APRS-IS: the call following
+        the q-construct in the path.
+        """
+        after_q = False
+        for text, _ in self.path_calls():
+            if after_q:
+                return text
+            after_q = len(text) == 3 and text.startswith(b'q')
+        return None
+
+    @property
+    def object_name(self) -> bytes:
+        info = self.info
+        if info.startswith(b';'):
+            return info[1:10].rstrip()
+        elif info.startswith(b')'):
+            ends = [idx for idx in (info.find(b'!', 4), info.find(b'_', 4))
+                    if idx != -1]
+            return info[1:min(ends)] if ends else None
+        return None
+
+
+class Filter(object):
+
+    """
+    Filter Class.
+
+    Compiles an APRS-IS filter expression into a single predicate over
+    `aprs.Frame` objects (or raw plain-text Frames), so one broad APRS-IS
+    feed can be re-filtered several ways in-process.
+
+    Supported filters, each optionally negated with a leading '-':
+
+        r/lat/lon/dist      Range (km) from a point.
+        a/latN/lonW/latS/lonE  Area.
+        p/aa/bb             Source Callsign prefix.
+        b/call1/call2       Source Callsign (budlist), '*' wildcard.
+        o/obj1/obj2         Object or Item name, '*' wildcard.
+        t/poimqstunw        Data Type.
+        d/digi1/digi2       Digipeated-by Callsign, '*' wildcard.
+        e/call1/call2       Entry (iGate) Callsign, '*' wildcard.
+
+    A Frame passes if any positive filter matches and no negated filter
+    does.
+    """
+
+    __slots__ = ['expression', '_positive', '_negative']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, expression: typing.Union[bytes, str]) -> None:
+        if isinstance(expression, bytes):
+            expression = expression.decode('UTF-8')
+        self.expression: str = expression
+
+        positive = {}
+        negative = {}
+        for term in expression.split():
+            clauses = negative if term.startswith('-') else positive
+            self._add_term(clauses, term.lstrip('-'))
+
+        self._positive = self._compile(positive)
+        self._negative = self._compile(negative)
+
+    @classmethod
+    def compile(cls, expression: typing.Union[bytes, str]) -> AprsFilter:
+        """
+        Compiles an APRS-IS filter expression.
+        """
+        return cls(expression)
+
+    def __repr__(self) -> str:
+        return '<Filter %s>' % self.expression
+
+    def __call__(self, frame) -> bool:
+        """
+        Returns True if `frame` passes this Filter.
+        """
+        if not isinstance(frame, aprs.Frame):
+            frame = aprs.Frame.parse(frame, lazy=True)
+        ctx = _FrameContext(frame)
+        for clause in self._negative:
+            if clause(ctx):
+                return False
+        for clause in self._positive:
+            if clause(ctx):
+                return True
+        return False
+
+    @staticmethod
+    def _add_term(clauses: dict, term: str) -> None:
+        """
+        Parses one filter term into `clauses`, grouped by filter type.
+        """
+        kind, _, args = term.partition('/')
+        args = [arg for arg in args.split('/') if arg]
+        if not args:
+            raise aprs.BadFilterError('Filter "%s" has no arguments.' % term)
+
+        try:
+            if kind == 'r':
+                if len(args) != 3:
+                    raise aprs.BadFilterError('Expected r/lat/lon/dist.')
+                clauses.setdefault('r', []).append(
+                    tuple(float(arg) for arg in args))
+            elif kind == 'a':
+                if len(args) != 4:
+                    raise aprs.BadFilterError(
+                        'Expected a/latN/lonW/latS/lonE.')
+                clauses.setdefault('a', []).append(
+                    tuple(float(arg) for arg in args))
+            elif kind in ('p', 'b', 'o', 'd', 'e'):
+                clauses.setdefault(kind, []).extend(
+                    bytes(arg, 'UTF-8') for arg in args)
+            elif kind == 't':
+                if len(args) != 1:
+                    raise aprs.BadFilterError(
+                        'Station-relative t/ filters are not supported.')
+                unknown = set(args[0]) - set(TYPE_FILTER_MAP) - {'n'}
+                if unknown:
+                    raise aprs.BadFilterError(
+                        'Unknown t/ types: %s' % ''.join(sorted(unknown)))
+                clauses.setdefault('t', set()).update(args[0])
+            else:
+                raise aprs.BadFilterError('Unsupported filter "%s".' % term)
+        except ValueError:
+            raise aprs.BadFilterError('Bad filter "%s".' % term)
+
+    @classmethod
+    def _compile(cls, clauses: dict) -> typing.List:
+        """
+        Turns the grouped terms into a list of predicates over a
+        `_FrameContext`, cheapest first.
+        """
+        predicates = []
+
+        if 'p' in clauses or 'b' in clauses:
+            source_trie = _PrefixTrie()
+            for prefix in clauses.get('p', []):
+                source_trie.add(prefix, prefix=True)
+            for call in clauses.get('b', []):
+                source_trie.add(call)
+            predicates.append(
+                lambda ctx: source_trie.match(ctx.source.upper()))
+
+        if 't' in clauses:
+            predicates.append(cls._compile_types(clauses['t']))
+
+        if 'o' in clauses:
+            object_trie = _PrefixTrie()
+            for name in clauses['o']:
+                object_trie.add(name)
+
+            def match_object(ctx):
+                name = ctx.object_name
+                return name is not None and object_trie.match(name.upper())
+            predicates.append(match_object)
+
+        if 'd' in clauses:
+            digi_trie = _PrefixTrie()
+            for call in clauses['d']:
+                digi_trie.add(call)
+            predicates.append(lambda ctx: any(
+                digi_trie.match(call.upper()) for call in ctx.digipeaters()))
+
+        if 'e' in clauses:
+            entry_trie = _PrefixTrie()
+            for call in clauses['e']:
+                entry_trie.add(call)
+
+            def match_entry(ctx):
+                entry = ctx.entry
+                return entry is not None and entry_trie.match(entry.upper())
+            predicates.append(match_entry)
+
+        for lat_n, lng_w, lat_s, lng_e in clauses.get('a', []):
+            predicates.append(cls._compile_area(lat_n, lng_w, lat_s, lng_e))
+
+        for lat, lng, dist in clauses.get('r', []):
+            predicates.append(cls._compile_range(lat, lng, dist))
+
+        return predicates
+
+    @staticmethod
+    def _compile_types(types: set):
+        data_types = set()
+        for kind in types:
+            data_types.update(TYPE_FILTER_MAP.get(kind, ()))
+        nws = 'n' in types
+        weather_symbol = 'w' in types
+
+        def match_type(ctx):
+            if ctx.data_type in data_types:
+                return True
+            if nws and ctx.data_type == 0x3A and ctx.info[1:4] == b'NWS':
+                return True
+            if weather_symbol:
+                position = ctx.position
+                return position is not None and position.symbol == b'_'
+            return False
+        return match_type
+
+    @staticmethod
+    def _compile_area(lat_n: float, lng_w: float, lat_s: float,
+                      lng_e: float):
+        def match_area(ctx):
+            position = ctx.position
+            return (position is not None and
+                    lat_s <= position.lat <= lat_n and
+                    lng_w <= position.lng <= lng_e)
+        return match_area
+
+    @staticmethod
+    def _compile_range(lat: float, lng: float, dist: float):
+        """
+        Range filter: a precomputed bounding box rejects most positions
+        before the haversine check.
+        """
+        distance = aprs.geo_util.distance
+        dlat = dist / KM_PER_DEGREE
+        lat_min = lat - dlat
+        lat_max = lat + dlat
+        widest = max(abs(lat_min), abs(lat_max))
+        if widest >= 90.0:
+            dlng = 180.0
+        else:
+            dlng = dlat / math.cos(math.radians(widest))
+
+        def match_range(ctx):
+            position = ctx.position
+            if position is None:
+                return False
+            if not lat_min <= position.lat <= lat_max:
+                return False
+            if dlng < 180.0 and abs(
+                    (position.lng - lng + 180.0) % 360.0 - 180.0) > dlng:
+                return False
+            return distance(lat, lng, position.lat, position.lng) <= dist
+        return match_range
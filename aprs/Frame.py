@@ -36,20 +36,38 @@ class Frame(object):
         self.info = aprs.InformationField.parse(info)
 
     @classmethod
-    def parse(cls, raw_frame: typing.Union[bytes, str]) -> AprsFrame:
+    def parse(cls, raw_frame: typing.Union[bytes, str],
+              lazy: bool=False) -> AprsFrame:
         """
         Parses an AX.25/APRS Frame from either plain-text or AX.25.
+
+        With `lazy`, plain-text Frames are returned as an `aprs.LazyFrame`,
+        which only decodes each field on first access.
         """
-        if isinstance(raw_frame, cls):
+        if isinstance(raw_frame, Frame):
             return raw_frame
         elif isinstance(raw_frame, str):
-            return cls.from_text(bytes(raw_frame, 'UTF-8'))
-        elif isinstance(raw_frame, (bytearray, bytes)):
+            raw_frame = bytes(raw_frame, 'UTF-8')
+
+        if isinstance(raw_frame, (bytearray, bytes)):
             if aprs.ADDR_INFO_DELIM in raw_frame:
                 return cls.from_ax25(raw_frame)
+            elif lazy:
+                return aprs.LazyFrame(raw_frame)
             else:
                 return cls.from_text(raw_frame)
 
+    @staticmethod
+    def find_delimiters(raw_frame: bytes) -> typing.Tuple[int, int]:
+        """
+        Finds the Source>Destination and Path:Info delimiters of a plain-text
+        Frame.
+
+        :returns: Offsets of the '>' and ':' delimiters.
+        :rtype: tuple
+        """
+        return raw_frame.index(b'>'), raw_frame.index(b':')
+
 
     @classmethod
     def from_text(cls, raw_frame: bytes) -> AprsFrame:
@@ -59,14 +77,11 @@ class Frame(object):
         parsed_frame = cls()
         _path = []
 
-        # Source>Destination
-        sd_delim = raw_frame.index(b'>')
+        # Source>Destination, Path:Info
+        sd_delim, pi_delim = cls.find_delimiters(raw_frame)
 
         parsed_frame.set_source(raw_frame[:sd_delim])
 
-        # Path:Info
-        pi_delim = raw_frame.index(b':')
-
         parsed_path = raw_frame[sd_delim + 1:pi_delim]
         if b',' in parsed_path:
             for path in parsed_path.split(b','):
@@ -86,8 +101,21 @@ class Frame(object):
         Parses and Extracts the components of an AX.25-Encoded Frame.
         """
         kiss_call = False
+        has_fcs = False
+
+        # Only strip a single Flag from each end, the FCS may contain 0x7E.
+        _frame = raw_frame
+        if _frame.startswith(aprs.AX25_FLAG):
+            _frame = _frame[1:]
+            has_fcs = True
+        if _frame.endswith(aprs.AX25_FLAG):
+            _frame = _frame[:-1]
+
+        if has_fcs:
+            if not aprs.FCS.validate(_frame):
+                cls._logger.warning('Bad FCS for frame="%s"', raw_frame)
+            _frame = _frame[:-2]
 
-        _frame = raw_frame.strip(aprs.AX25_FLAG)
         if (_frame.startswith(aprs.KISS_DATA_FRAME) or
                 _frame.endswith(aprs.KISS_DATA_FRAME)):
             _frame = _frame.lstrip(aprs.KISS_DATA_FRAME)
@@ -97,7 +125,7 @@ class Frame(object):
         # Use these two fields as the address/information delimiter
         frame_addressing, frame_information = _frame.split(aprs.ADDR_INFO_DELIM)
 
-        info_field = frame_information.rstrip(b'\xFF\x07')
+        info_field = frame_information
 
         destination = aprs.Callsign.from_ax25(frame_addressing, kiss_call)
         source = aprs.Callsign.from_ax25(frame_addressing[7:], kiss_call)
@@ -164,9 +192,10 @@ class Frame(object):
         encoded_frame.append(aprs.ADDR_INFO_DELIM)
         encoded_frame.append(bytes(self.info))
 
+        # The FCS covers everything between the opening & closing Flags.
         fcs = aprs.FCS()
-        for bit in encoded_frame:
-            fcs.update_bit(bit)
+        for chunk in encoded_frame[1:]:
+            fcs.update(chunk)
 
         encoded_frame.append(fcs.digest())
         encoded_frame.append(aprs.AX25_FLAG)
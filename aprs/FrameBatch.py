@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import array
+import logging
+import typing
+
+import aprs  # pylint: disable=R0801
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+AprsFrameBatch = typing.TypeVar('AprsFrameBatch', bound='aprs.FrameBatch')
+
+# Offset columns, in the order they're stored.
+OFFSET_COLUMNS = ('starts', 'sd_delims', 'dest_ends', 'pi_delims', 'ends')
+
+
+class FrameBatch(object):
+
+    """
+    FrameBatch Class.
+
+    Columnar store of many plain-text APRS Frames.
+
+    Every Frame lives in one shared bytes `buffer`. Each field is located by
+    offset columns (`array.array`): `starts`, `sd_delims` ('>'), `dest_ends`
+    (end of the destination), `pi_delims` (':') and `ends`. The `data_types`
+    column holds the first info byte of each Frame.
+
+    Filters are vectorized with NumPy when it's installed, and return a new
+    FrameBatch that shares the same buffer. Real `aprs.Frame` objects are
+    only built on demand.
+    """
+
+    __slots__ = ['buffer', 'starts', 'sd_delims', 'dest_ends', 'pi_delims',
+                 'ends', 'data_types', 'skipped']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, buffer: bytes=b'', columns: typing.Dict=None,
+                 skipped: int=0) -> None:
+        columns = columns or {}
+        self.buffer: bytes = buffer
+        for name in OFFSET_COLUMNS:
+            setattr(self, name, columns.get(name, array.array('q')))
+        self.data_types: array.array = columns.get(
+            'data_types', array.array('B'))
+        # Number of lines that weren't plain-text Frames:
+        self.skipped: int = skipped
+
+    @classmethod
+    def from_lines(cls, lines: typing.Iterable[bytes]) -> AprsFrameBatch:
+        """
+        Builds a FrameBatch from an iterable of raw plain-text Frames.
+
+        Empty lines, APRS-IS comment ('#') lines and lines without the
+        Source>Destination and Path:Info delimiters are skipped.
+        """
+        find_delimiters = aprs.Frame.find_delimiters
+        chunks = []
+        columns = {name: array.array('q') for name in OFFSET_COLUMNS}
+        starts = columns['starts']
+        sd_delims = columns['sd_delims']
+        dest_ends = columns['dest_ends']
+        pi_delims = columns['pi_delims']
+        ends = columns['ends']
+        data_types = columns['data_types'] = array.array('B')
+        offset = 0
+        skipped = 0
+
+        for line in lines:
+            if isinstance(line, str):
+                line = bytes(line, 'UTF-8')
+            elif not isinstance(line, bytes):
+                line = bytes(line)
+            line = line.rstrip(b'\r\n')
+
+            if not line or line.startswith(b'#'):
+                skipped += 1
+                continue
+
+            try:
+                sd_delim, pi_delim = find_delimiters(line)
+            except ValueError:
+                skipped += 1
+                continue
+
+            dest_end = line.find(b',', sd_delim + 1, pi_delim)
+            if dest_end == -1:
+                dest_end = pi_delim
+
+            starts.append(offset)
+            sd_delims.append(offset + sd_delim)
+            dest_ends.append(offset + dest_end)
+            pi_delims.append(offset + pi_delim)
+            ends.append(offset + len(line))
+            if len(line) > pi_delim + 1:
+                data_types.append(line[pi_delim + 1])
+            else:
+                data_types.append(0)
+
+            chunks.append(line)
+            offset += len(line)
+
+        return cls(b''.join(chunks), columns, skipped)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> 'aprs.Frame':
+        return self.frame(index)
+
+    def __iter__(self) -> typing.Iterator['aprs.Frame']:
+        for index in range(len(self)):
+            yield self.frame(index)
+
+    def __repr__(self) -> str:
+        return '<FrameBatch frames=%d bytes=%d>' % (
+            len(self), len(self.buffer))
+
+    def line(self, index: int) -> bytes:
+        """
+        Returns the raw plain-text Frame at `index`.
+        """
+        return self.buffer[self.starts[index]:self.ends[index]]
+
+    def frame(self, index: int, lazy: bool=False) -> 'aprs.Frame':
+        """
+        Materializes the Frame at `index`.
+        """
+        return aprs.Frame.parse(self.line(index), lazy=lazy)
+
+    def source(self, index: int) -> bytes:
+        return self.buffer[self.starts[index]:self.sd_delims[index]]
+
+    def destination(self, index: int) -> bytes:
+        return self.buffer[self.sd_delims[index] + 1:self.dest_ends[index]]
+
+    def path(self, index: int) -> typing.List[bytes]:
+        dest_end = self.dest_ends[index]
+        pi_delim = self.pi_delims[index]
+        if dest_end == pi_delim:
+            return []
+        return self.buffer[dest_end + 1:pi_delim].split(b',')
+
+    def info(self, index: int) -> bytes:
+        return self.buffer[self.pi_delims[index] + 1:self.ends[index]]
+
+    def column(self, name: str):
+        """
+        Returns column `name` as a zero-copy NumPy array, or as the underlying
+        `array.array` if NumPy isn't installed.
+        """
+        col = getattr(self, name)
+        if numpy is None:
+            return col
+        if not len(col):
+            return numpy.zeros(0, dtype=numpy.int64 if col.typecode == 'q'
+                               else numpy.uint8)
+        return numpy.frombuffer(col, dtype=numpy.int64 if col.typecode == 'q'
+                                else numpy.uint8)
+
+    def take(self, indices: typing.Iterable[int]) -> AprsFrameBatch:
+        """
+        Returns a FrameBatch of the Frames at `indices`, sharing this buffer.
+        """
+        columns = {}
+        if numpy is not None:
+            indices = numpy.asarray(indices, dtype=numpy.intp)
+            for name in OFFSET_COLUMNS + ('data_types',):
+                col = array.array(getattr(self, name).typecode)
+                col.frombytes(self.column(name)[indices].tobytes())
+                columns[name] = col
+        else:
+            indices = list(indices)
+            for name in OFFSET_COLUMNS + ('data_types',):
+                col = getattr(self, name)
+                columns[name] = array.array(
+                    col.typecode, [col[idx] for idx in indices])
+        return self.__class__(self.buffer, columns)
+
+    def select(self, mask) -> AprsFrameBatch:
+        """
+        Returns a FrameBatch of the Frames where `mask` is true.
+        """
+        if numpy is not None:
+            return self.take(
+                numpy.flatnonzero(numpy.asarray(mask, dtype=bool)))
+        return self.take(idx for idx, keep in enumerate(mask) if keep)
+
+    def data_type_mask(self, *data_types):
+        """
+        Returns a mask of the Frames whose data type identifier is any of
+        `data_types`, e.g. `b'!'` or `'='`.
+        """
+        wanted = set()
+        for data_type in data_types:
+            if isinstance(data_type, str):
+                data_type = bytes(data_type, 'UTF-8')
+            wanted.update(data_type)
+
+        if numpy is not None:
+            return numpy.isin(self.column('data_types'), list(wanted))
+        return [data_type in wanted for data_type in self.data_types]
+
+    def prefix_mask(self, prefix: bytes, field: str='source'):
+        """
+        Returns a mask of the Frames whose `field` ('source' or
+        'destination') starts with `prefix`.
+        """
+        if isinstance(prefix, str):
+            prefix = bytes(prefix, 'UTF-8')
+        if field == 'source':
+            starts, ends = self.starts, self.sd_delims
+            offset = 0
+        elif field == 'destination':
+            starts, ends = self.sd_delims, self.dest_ends
+            offset = 1
+        else:
+            raise ValueError('Unsupported field: %s' % field)
+
+        if numpy is not None and len(self):
+            col_starts = numpy.frombuffer(starts, dtype=numpy.int64) + offset
+            col_ends = numpy.frombuffer(ends, dtype=numpy.int64)
+            buffer = numpy.frombuffer(self.buffer, dtype=numpy.uint8)
+            mask = (col_ends - col_starts) >= len(prefix)
+            last = len(buffer) - 1
+            for pos, char in enumerate(prefix):
+                mask &= buffer[numpy.minimum(col_starts + pos, last)] == char
+            return mask
+
+        startswith = self.buffer.startswith
+        return [startswith(prefix, start + offset, end)
+                for start, end in zip(starts, ends)]
+
+    def filter_data_type(self, *data_types) -> AprsFrameBatch:
+        """
+        Returns the Frames whose data type identifier is any of `data_types`.
+        """
+        return self.select(self.data_type_mask(*data_types))
+
+    def filter_prefix(self, prefix: bytes,
+                      field: str='source') -> AprsFrameBatch:
+        """
+        Returns the Frames whose `field` starts with `prefix`.
+        """
+        return self.select(self.prefix_mask(prefix, field))
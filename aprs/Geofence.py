@@ -0,0 +1,455 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+AprsGeofence = typing.TypeVar('AprsGeofence', bound='aprs.Geofence')
+
+_EMPTY = frozenset()
+
+
+def _ranges(starts, counts):
+    """
+    Concatenates `range(start, start + count)` for each start & count.
+    """
+    ends = numpy.cumsum(counts)
+    total = int(ends[-1]) if len(ends) else 0
+    return numpy.arange(total, dtype=numpy.int64) + numpy.repeat(
+        starts - (ends - counts), counts)
+
+
+class Fence(object):
+
+    """
+    Fence Class.
+
+    A polygon of `(lat, lng)` vertices, implicitly closed. Polygons must not
+    cross the antimeridian; split those that do into two Fences.
+    """
+
+    __slots__ = ['fence_id', 'lats', 'lngs', 'south', 'west', 'north',
+                 'east']
+
+    def __init__(self, fence_id, points: typing.Sequence[
+            typing.Tuple[float, float]]) -> None:
+        if len(points) < 3:
+            raise aprs.BadPositionError(
+                'Fence %s needs at least 3 points.' % (fence_id,))
+        for lat, lng in points:
+            if not -90.0 <= lat <= 90.0 or not -180.0 <= lng <= 180.0:
+                raise aprs.BadPositionError(
+                    'Fence %s point out of range: %s, %s' % (
+                        fence_id, lat, lng))
+        self.fence_id = fence_id
+        self.lats: typing.Tuple[float, ...] = tuple(
+            float(lat) for lat, _ in points)
+        self.lngs: typing.Tuple[float, ...] = tuple(
+            float(lng) for _, lng in points)
+        self.south: float = min(self.lats)
+        self.north: float = max(self.lats)
+        self.west: float = min(self.lngs)
+        self.east: float = max(self.lngs)
+
+    def __repr__(self) -> str:
+        return '<Fence %s points=%d>' % (self.fence_id, len(self.lats))
+
+    def _edges(self) -> typing.Iterator[tuple]:
+        lats = self.lats
+        lngs = self.lngs
+        last = len(lats) - 1
+        for idx in range(len(lats)):
+            yield lats[idx], lngs[idx], lats[last], lngs[last]
+            last = idx
+
+    def contains(self, lat: float, lng: float) -> bool:
+        """
+        Returns True if `lat`, `lng` is inside the Fence (even-odd rule).
+        """
+        if not (self.south <= lat <= self.north and
+                self.west <= lng <= self.east):
+            return False
+        inside = False
+        for lat_i, lng_i, lat_j, lng_j in self._edges():
+            if (lat_i > lat) != (lat_j > lat) and lng < (
+                    (lng_j - lng_i) * (lat - lat_i) / (lat_j - lat_i) + lng_i):
+                inside = not inside
+        return inside
+
+
+class Transition(object):
+
+    """
+    Transition Class.
+
+    A station entering (`entered`) or leaving a Fence.
+    """
+
+    __slots__ = ['callsign', 'fence_id', 'entered', 'lat', 'lng',
+                 'timestamp']
+
+    def __init__(self, callsign, fence_id, entered: bool, lat: float,
+                 lng: float, timestamp: float) -> None:
+        self.callsign = callsign
+        self.fence_id = fence_id
+        self.entered: bool = entered
+        self.lat: float = lat
+        self.lng: float = lng
+        self.timestamp: float = timestamp
+
+    def __repr__(self) -> str:
+        return '<Transition %s %s %s>' % (
+            self.callsign, 'entered' if self.entered else 'left',
+            self.fence_id)
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, Transition) and
+                (self.callsign, self.fence_id, self.entered) ==
+                (other.callsign, other.fence_id, other.entered))
+
+    def __hash__(self) -> int:
+        return hash((self.callsign, self.fence_id, self.entered))
+
+
+class Geofence(object):
+
+    """
+    Geofence Class.
+
+    Tracks which Fences each station is inside, and reports only the
+    Transitions: entering or leaving a Fence.
+
+    Fences are indexed in a uniform lat/lng grid of `cell_size` degrees:
+    each cell lists the Fences whose bounding box overlaps it, so a position
+    is only tested against the few Fences near it. Stations that are inside
+    no Fence keep no state.
+
+    `update_many` takes columns of positions (e.g. from
+    `aprs.Position.decode_batch`), grouping them by grid cell and testing
+    each nearby Fence against all of a cell's points at once with NumPy.
+    """
+
+    __slots__ = ['cell_size', 'callback', 'clock', 'fences', 'updates',
+                 'transitions', '_columns', '_max_row', '_grid', '_state',
+                 '_packed']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, cell_size: float=0.1, callback=None,
+                 clock=time.time) -> None:
+        self.cell_size: float = cell_size
+        self.callback = callback
+        self.clock = clock
+        self.fences: typing.Dict[typing.Hashable, Fence] = {}
+        self.updates: int = 0
+        self.transitions: int = 0
+        self._columns: int = int(360.0 // cell_size) + 1
+        self._max_row: int = int(180.0 // cell_size)
+        # Grid cell -> Fences whose bounding box overlaps it:
+        self._grid: typing.Dict[int, typing.List[Fence]] = {}
+        # Callsign -> ids of the Fences it's inside:
+        self._state: typing.Dict[typing.Hashable, frozenset] = {}
+        # NumPy arrays of the Fences, see `_pack`:
+        self._packed: typing.Optional[typing.Dict[str, typing.Any]] = None
+
+    def __len__(self) -> int:
+        return len(self.fences)
+
+    def __repr__(self) -> str:
+        return '<Geofence fences=%d stations_inside=%d>' % (
+            len(self.fences), len(self._state))
+
+    def _cell(self, lat: float, lng: float) -> int:
+        row = min(int((lat + 90.0) // self.cell_size), self._max_row)
+        return row * self._columns + int((lng + 180.0) // self.cell_size)
+
+    def _cells(self, fence: Fence) -> typing.Iterator[int]:
+        first = self._cell(fence.south, fence.west)
+        last = self._cell(fence.north, fence.east)
+        first_row, first_col = divmod(first, self._columns)
+        last_row, last_col = divmod(last, self._columns)
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                yield row * self._columns + col
+
+    def add(self, fence_id, points: typing.Sequence[
+            typing.Tuple[float, float]]) -> Fence:
+        """
+        Adds (or replaces) the Fence `fence_id`, a polygon of `(lat, lng)`
+        points.
+        """
+        fence = Fence(fence_id, points)
+        if fence_id in self.fences:
+            self.remove(fence_id)
+        self.fences[fence_id] = fence
+        self._packed = None
+        for cell in self._cells(fence):
+            self._grid.setdefault(cell, []).append(fence)
+        return fence
+
+    def remove(self, fence_id) -> None:
+        """
+        Removes the Fence `fence_id`. Stations inside it are forgotten
+        without a Transition.
+        """
+        fence = self.fences.pop(fence_id)
+        self._packed = None
+        for cell in self._cells(fence):
+            fences = self._grid[cell]
+            fences.remove(fence)
+            if not fences:
+                del self._grid[cell]
+        for callsign, inside in list(self._state.items()):
+            if fence_id in inside:
+                inside = inside - {fence_id}
+                if inside:
+                    self._state[callsign] = inside
+                else:
+                    del self._state[callsign]
+
+    def fences_at(self, lat: float, lng: float) -> frozenset:
+        """
+        Returns the ids of the Fences containing `lat`, `lng`.
+        """
+        fences = self._grid.get(self._cell(lat, lng))
+        if not fences:
+            return _EMPTY
+        return frozenset(fence.fence_id for fence in fences
+                         if fence.contains(lat, lng))
+
+    def inside(self, callsign) -> frozenset:
+        """
+        Returns the ids of the Fences `callsign` was last seen inside.
+        """
+        return self._state.get(callsign, _EMPTY)
+
+    def _transition(self, callsign, inside: frozenset, lat: float,
+                    lng: float, timestamp: float,
+                    transitions: typing.List[Transition]) -> None:
+        """
+        Records that `callsign` is now `inside`, appending any Transitions.
+        """
+        state = self._state
+        was_inside = state.get(callsign, _EMPTY)
+        if inside == was_inside:
+            return
+        if inside:
+            state[callsign] = inside
+        else:
+            del state[callsign]
+        start = len(transitions)
+        for fence_id in was_inside - inside:
+            transitions.append(
+                Transition(callsign, fence_id, False, lat, lng, timestamp))
+        for fence_id in inside - was_inside:
+            transitions.append(
+                Transition(callsign, fence_id, True, lat, lng, timestamp))
+        self.transitions += len(transitions) - start
+        if self.callback is not None:
+            for transition in transitions[start:]:
+                self.callback(transition)
+
+    def update(self, callsign, lat: float, lng: float,
+               timestamp: float=None) -> typing.List[Transition]:
+        """
+        Records a station's position.
+
+        :returns: The Transitions it caused, if any.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        self.updates += 1
+        transitions = []
+        self._transition(callsign, self.fences_at(lat, lng), lat, lng,
+                         timestamp, transitions)
+        return transitions
+
+    def _pack(self) -> typing.Dict[str, typing.Any]:
+        """
+        Packs the grid, bounding boxes and edges of the Fences into NumPy
+        arrays for `update_many`. Cached until the Fences change.
+        """
+        if self._packed is not None:
+            return self._packed
+        fences = list(self.fences.values())
+        numbers = {id(fence): number for number, fence in enumerate(fences)}
+        grid = self._grid
+        cells = sorted(grid)
+        edge_counts = numpy.array([len(fence.lats) for fence in fences],
+                                  dtype=numpy.int64)
+        self._packed = {
+            'fence_ids': [fence.fence_id for fence in fences],
+            'cells': numpy.array(cells, dtype=numpy.int64),
+            'offsets': numpy.cumsum(
+                [0] + [len(grid[cell]) for cell in cells], dtype=numpy.int64),
+            'members': numpy.array(
+                [numbers[id(fence)] for cell in cells for fence in grid[cell]],
+                dtype=numpy.int64),
+            'boxes': numpy.array(
+                [(fence.south, fence.north, fence.west, fence.east)
+                 for fence in fences], dtype=numpy.float64).reshape(-1, 4),
+            'edge_counts': edge_counts,
+            'edge_starts': numpy.cumsum(edge_counts) - edge_counts,
+            'edges': numpy.array(
+                [edge for fence in fences for edge in fence._edges()],
+                dtype=numpy.float64).reshape(-1, 4)
+        }
+        return self._packed
+
+    def _hits(self, valid, lats, lngs) -> typing.Dict[int, set]:
+        """
+        Returns the ids of the Fences containing each of the `valid` points,
+        keyed by point, only for the points inside some Fence.
+
+        Every (point, nearby Fence) pair, then every (pair, edge), is
+        expanded into flat arrays so the whole batch is tested in a handful
+        of NumPy operations, however few points share a grid cell.
+        """
+        packed = self._pack()
+        hits: typing.Dict[int, set] = {}
+        cell_keys = packed['cells']
+        if not len(valid) or not len(cell_keys):
+            return hits
+
+        rows = numpy.minimum((lats[valid] + 90.0) // self.cell_size,
+                             self._max_row).astype(numpy.int64)
+        cells = rows * self._columns + (
+            (lngs[valid] + 180.0) // self.cell_size).astype(numpy.int64)
+        found = numpy.minimum(numpy.searchsorted(cell_keys, cells),
+                              len(cell_keys) - 1)
+        indexed = cell_keys[found] == cells
+        points = valid[indexed]
+        found = found[indexed]
+
+        # (point, Fence) pairs, narrowed to the Fence's bounding box:
+        offsets = packed['offsets']
+        starts = offsets[found]
+        counts = offsets[found + 1] - starts
+        pair_points = numpy.repeat(points, counts)
+        pair_fences = packed['members'][_ranges(starts, counts)]
+        pair_lats = lats[pair_points]
+        pair_lngs = lngs[pair_points]
+        boxes = packed['boxes'][pair_fences]
+        in_box = numpy.flatnonzero(
+            (pair_lats >= boxes[:, 0]) & (pair_lats <= boxes[:, 1]) &
+            (pair_lngs >= boxes[:, 2]) & (pair_lngs <= boxes[:, 3]))
+        if not len(in_box):
+            return hits
+        pair_points = pair_points[in_box]
+        pair_fences = pair_fences[in_box]
+
+        # (pair, edge) crossings, as in `Fence.contains`:
+        edge_counts = packed['edge_counts'][pair_fences]
+        lat = numpy.repeat(pair_lats[in_box], edge_counts)
+        lng = numpy.repeat(pair_lngs[in_box], edge_counts)
+        lat_i, lng_i, lat_j, lng_j = packed['edges'][_ranges(
+            packed['edge_starts'][pair_fences], edge_counts)].T
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            crossings = ((lat_i > lat) != (lat_j > lat)) & (
+                lng < (lng_j - lng_i) * (lat - lat_i) / (lat_j - lat_i) +
+                lng_i)
+        inside = numpy.add.reduceat(
+            crossings, numpy.cumsum(edge_counts) - edge_counts,
+            dtype=numpy.int64) & 1 == 1
+
+        fence_ids = packed['fence_ids']
+        for point, fence in zip(pair_points[inside].tolist(),
+                                pair_fences[inside].tolist()):
+            hits.setdefault(point, set()).add(fence_ids[fence])
+        return hits
+
+    def update_many(self, callsigns: typing.Sequence, lats, lngs,
+                    timestamp: float=None) -> typing.List[Transition]:
+        """
+        Records many positions, in order: columns of callsigns, latitudes
+        and longitudes (sequences or NumPy arrays). NaN positions are
+        skipped.
+
+        :returns: The Transitions they caused, in order.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        if numpy is None:
+            transitions = []
+            for callsign, lat, lng in zip(callsigns, lats, lngs):
+                if lat == lat:  # Not NaN
+                    self.updates += 1
+                    self._transition(callsign, self.fences_at(lat, lng),
+                                     lat, lng, timestamp, transitions)
+            return transitions
+
+        lats = numpy.asarray(lats, dtype=numpy.float64)
+        lngs = numpy.asarray(lngs, dtype=numpy.float64)
+        valid = numpy.flatnonzero(~numpy.isnan(lats) & ~numpy.isnan(lngs))
+        hits = self._hits(valid, lats, lngs)
+
+        transitions = []
+        state = self._state
+        for point in valid.tolist():
+            callsign = callsigns[point]
+            inside = hits.get(point)
+            if inside is None:
+                # Most stations: outside every Fence, before & after.
+                if callsign not in state:
+                    continue
+                inside = _EMPTY
+            self._transition(callsign, frozenset(inside), float(lats[point]),
+                             float(lngs[point]), timestamp, transitions)
+        self.updates += len(valid)
+        return transitions
+
+    def update_frames(self, frames: typing.Iterable['aprs.Frame'],
+                      timestamp: float=None) -> typing.List[Transition]:
+        """
+        Records the positions of many `aprs.Frame`s, or of an
+        `aprs.FrameBatch`. Frames without a position are skipped.
+
+        :returns: The Transitions they caused, in order.
+        """
+        if isinstance(frames, aprs.FrameBatch):
+            columns = aprs.Position.decode_batch(frames)
+            callsigns = [frames.source(idx) for idx in range(len(frames))]
+            return self.update_many(callsigns, columns['lat'],
+                                    columns['lng'], timestamp)
+
+        callsigns = []
+        lats = []
+        lngs = []
+        for frame in frames:
+            try:
+                position = aprs.Position.from_frame(frame)
+            except (aprs.BadPositionError, ValueError, IndexError):
+                continue
+            if position is None:
+                continue
+            callsigns.append(bytes(frame.source))
+            lats.append(position.lat)
+            lngs.append(position.lng)
+        return self.update_many(callsigns, lats, lngs, timestamp)
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the Geofence counters.
+        """
+        return {
+            'fences': len(self.fences),
+            'cells': len(self._grid),
+            'stations_inside': len(self._state),
+            'updates': self.updates,
+            'transitions': self.transitions
+        }
@@ -0,0 +1,403 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import collections
+import logging
+import threading
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+
+AprsSubscription = typing.TypeVar(
+    'AprsSubscription', bound='aprs.Subscription')
+
+# What a full Subscription does with a new Frame.
+DROP_POLICIES = ('oldest', 'newest', 'block')
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class Subscription(object):
+
+    """
+    Subscription Class.
+
+    One consumer of an `aprs.Hub`: a bounded queue of shared Frames, with a
+    drop policy for when the consumer falls behind, and an optional filter
+    (any predicate, e.g. an `aprs.Filter`).
+
+    Drop policies:
+
+        oldest  Drop the oldest queued Frame to make room (default).
+        newest  Drop the incoming Frame.
+        block   Wait for room, which stalls the Hub and every other
+                Subscription.
+
+    Threads consume with `get` or by iterating, coroutines with `get_async`
+    or `async for`, from any thread or event loop. Under `Hub.run_async`,
+    a 'block' Subscription awaits room, so its consumer can share the
+    Hub's event loop.
+    """
+
+    __slots__ = ['maxsize', 'policy', 'frame_filter', 'delivered', 'dropped',
+                 'filtered', 'max_lag', 'closed', '_queue', '_cond',
+                 '_waiters']
+
+    def __init__(self, maxsize: int=1024, policy: str='oldest',
+                 frame_filter=None) -> None:
+        if policy not in DROP_POLICIES:
+            raise ValueError('Unsupported drop policy: %s' % policy)
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1.')
+        self.maxsize: int = maxsize
+        self.policy: str = policy
+        self.frame_filter = frame_filter
+        self.delivered: int = 0
+        self.dropped: int = 0
+        self.filtered: int = 0
+        self.max_lag: int = 0
+        self.closed: bool = False
+        self._queue: collections.deque = collections.deque()
+        self._cond: threading.Condition = threading.Condition()
+        # Futures of coroutines waiting for a Frame or for room:
+        self._waiters: typing.List[asyncio.Future] = []
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self) -> typing.Iterator['aprs.Frame']:
+        while 1:
+            frame = self.get()
+            if frame is None:
+                return
+            yield frame
+
+    async def __aiter__(self) -> typing.AsyncIterator['aprs.Frame']:
+        while 1:
+            frame = await self.get_async()
+            if frame is None:
+                return
+            yield frame
+
+    def __repr__(self) -> str:
+        return '<Subscription policy=%s lag=%d/%d dropped=%d>' % (
+            self.policy, len(self._queue), self.maxsize, self.dropped)
+
+    @property
+    def lag(self) -> int:
+        """
+        Number of Frames waiting to be consumed.
+        """
+        return len(self._queue)
+
+    def _notify(self) -> None:
+        """
+        Wakes every waiting thread & coroutine. Called with `_cond` held.
+        """
+        self._cond.notify_all()
+        if self._waiters:
+            for future in self._waiters:
+                try:
+                    future.get_loop().call_soon_threadsafe(_wake, future)
+                except RuntimeError:  # Its event loop is closed.
+                    pass
+            self._waiters = []
+
+    def _waiter(self) -> asyncio.Future:
+        """
+        Returns a Future resolved by the next `_notify`. Called with `_cond`
+        held.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        return future
+
+    def _accepts(self, frame: 'aprs.Frame') -> bool:
+        if self.closed:
+            return False
+        if self.frame_filter is not None and not self.frame_filter(frame):
+            self.filtered += 1
+            return False
+        return True
+
+    def _append(self, frame: 'aprs.Frame') -> None:
+        queue = self._queue
+        queue.append(frame)
+        self.delivered += 1
+        if len(queue) > self.max_lag:
+            self.max_lag = len(queue)
+        self._notify()
+
+    def put(self, frame: 'aprs.Frame') -> bool:
+        """
+        Offers `frame` to this Subscription, applying its filter and drop
+        policy.
+
+        :returns: True if `frame` was queued.
+        :rtype: bool
+        """
+        if not self._accepts(frame):
+            return False
+
+        with self._cond:
+            queue = self._queue
+            if len(queue) >= self.maxsize:
+                if self.policy == 'newest':
+                    self.dropped += 1
+                    return False
+                elif self.policy == 'oldest':
+                    queue.popleft()
+                    self.dropped += 1
+                else:
+                    while len(queue) >= self.maxsize and not self.closed:
+                        self._cond.wait()
+                    if self.closed:
+                        return False
+            self._append(frame)
+        return True
+
+    async def put_async(self, frame: 'aprs.Frame') -> bool:
+        """
+        As `put`, but a full 'block' Subscription awaits room instead of
+        blocking the thread.
+
+        :returns: True if `frame` was queued.
+        :rtype: bool
+        """
+        if self.policy != 'block':
+            return self.put(frame)
+        if not self._accepts(frame):
+            return False
+        while 1:
+            with self._cond:
+                if self.closed:
+                    return False
+                if len(self._queue) < self.maxsize:
+                    self._append(frame)
+                    return True
+                future = self._waiter()
+            await future
+
+    def get(self, timeout: float=None) -> 'aprs.Frame':
+        """
+        Returns the next Frame, waiting up to `timeout` seconds (forever if
+        None).
+
+        :returns: The next Frame, or None on timeout or once this
+                  Subscription is closed and drained.
+        """
+        with self._cond:
+            if timeout is not None:
+                deadline = time.monotonic() + timeout
+            while not self._queue:
+                if self.closed:
+                    return None
+                if timeout is None:
+                    self._cond.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self._cond.wait(remaining)
+
+            frame = self._queue.popleft()
+            self._notify()
+            return frame
+
+    async def get_async(self, timeout: float=None) -> 'aprs.Frame':
+        """
+        As `get`, but awaits the next Frame instead of blocking the thread.
+
+        :returns: The next Frame, or None on timeout or once this
+                  Subscription is closed and drained.
+        """
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        while 1:
+            with self._cond:
+                if self._queue:
+                    frame = self._queue.popleft()
+                    self._notify()
+                    return frame
+                if self.closed:
+                    return None
+                future = self._waiter()
+            if timeout is None:
+                await future
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
+                return None
+
+    def close(self) -> None:
+        """
+        Stops queueing Frames. Queued Frames can still be consumed.
+        """
+        with self._cond:
+            self.closed = True
+            self._notify()
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the Subscription counters.
+        """
+        return {
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'filtered': self.filtered,
+            'lag': len(self._queue),
+            'max_lag': self.max_lag,
+            'maxsize': self.maxsize
+        }
+
+
+class Hub(object):
+
+    """
+    Hub Class.
+
+    Owns a single `aprs.TCP` or `aprs.AsyncTCP` upstream, parses each Frame
+    once and fans it out to every `aprs.Subscription`, so many consumers
+    share one APRS-IS connection and one parse.
+
+    Frames are shared between Subscriptions and must be treated as
+    read-only by consumers.
+    """
+
+    __slots__ = ['upstream', 'frame_handler', 'dupe_filter', 'received',
+                 '_subscriptions', '_lock']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, upstream: 'aprs.TCP'=None,
+                 frame_handler=aprs.Frame.parse, dupe_filter=None) -> None:
+        self.upstream = upstream
+        self.frame_handler = frame_handler
+        self.dupe_filter = dupe_filter
+        self.received: int = 0
+        # Replaced, never mutated, so publish() can iterate without locking:
+        self._subscriptions: typing.Tuple[Subscription, ...] = ()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def __repr__(self) -> str:
+        return '<Hub subscriptions=%d received=%d>' % (
+            len(self._subscriptions), self.received)
+
+    def subscribe(self, maxsize: int=1024, policy: str='oldest',
+                  frame_filter=None) -> AprsSubscription:
+        """
+        Registers a new Subscription.
+
+        :param maxsize: Queue bound.
+        :param policy: Drop policy: 'oldest', 'newest' or 'block'.
+        :param frame_filter: Optional predicate, Frames it rejects are not
+                             queued. An expression is compiled into an
+                             `aprs.Filter`.
+        """
+        if isinstance(frame_filter, (bytes, str)):
+            frame_filter = aprs.Filter(frame_filter)
+        subscription = Subscription(maxsize, policy, frame_filter)
+        with self._lock:
+            self._subscriptions = self._subscriptions + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Removes and closes `subscription`.
+        """
+        with self._lock:
+            self._subscriptions = tuple(
+                sub for sub in self._subscriptions if sub is not subscription)
+        subscription.close()
+
+    def publish(self, frame: 'aprs.Frame') -> int:
+        """
+        Fans `frame` out to every Subscription.
+
+        :returns: Number of Subscriptions that queued `frame`.
+        :rtype: int
+        """
+        self.received += 1
+        queued = 0
+        for subscription in self._subscriptions:
+            if subscription.put(frame):
+                queued += 1
+        return queued
+
+    async def publish_async(self, frame: 'aprs.Frame') -> int:
+        """
+        As `publish`, but awaits room in 'block' Subscriptions.
+
+        :returns: Number of Subscriptions that queued `frame`.
+        :rtype: int
+        """
+        self.received += 1
+        queued = 0
+        for subscription in self._subscriptions:
+            if await subscription.put_async(frame):
+                queued += 1
+        return queued
+
+    def close(self) -> None:
+        """
+        Closes every Subscription, ending their iterators once drained.
+        """
+        for subscription in self._subscriptions:
+            subscription.close()
+
+    def run(self) -> None:
+        """
+        Receives from the upstream `aprs.TCP` until it disconnects, then
+        closes every Subscription.
+        """
+        try:
+            self.upstream.receive(
+                callback=self.publish, frame_handler=self.frame_handler,
+                dupe_filter=self.dupe_filter)
+        finally:
+            self.close()
+
+    async def run_async(self) -> None:
+        """
+        Receives from the upstream `aprs.AsyncTCP` until it disconnects, then
+        closes every Subscription.
+
+        A full 'block' Subscription holds up the Hub, but not the event
+        loop, until its consumer makes room.
+        """
+        self.upstream.frame_handler = self.frame_handler
+        if self.dupe_filter is not None:
+            self.upstream.dupe_filter = self.dupe_filter
+        try:
+            async for frame in self.upstream:
+                await self.publish_async(frame)
+        finally:
+            self.close()
+
+    def info(self) -> typing.Dict[str, typing.Any]:
+        """
+        Returns the Hub counters, with the counters of each Subscription.
+        """
+        return {
+            'received': self.received,
+            'subscriptions': [sub.info() for sub in self._subscriptions]
+        }
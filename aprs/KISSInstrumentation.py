@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+
+
+class KISSInstrumentation(object):
+
+    """
+    KISSInstrumentation Class.
+
+    Metrics & latency tracing of a KISS interface. `aprs.kiss_classes`
+    mixes it in ahead of the `kiss` package's classes. It relies only on
+    their read API: `_read_handler` does each device read, and `read`
+    decodes KISS frames from it and passes each to a callback, or returns
+    them with `readmode=False`.
+
+    Counts Frames & bytes received and sent, parse errors, and parse &
+    callback times, labelled by `transport`.
+
+    Like `aprs.TCP`, `read_ns` holds the `time.monotonic_ns()` of the last
+    device read that returned data. Each Frame decoded from that read is
+    stamped with it as its `received` time when traced.
+    """
+
+    # `transport` label of this class's metrics.
+    _transport = 'kiss'
+
+    def _start_metrics(self, metrics: 'aprs.Metrics'=None) -> None:
+        # time.monotonic_ns() of the last device read:
+        self.read_ns = 0
+        self.metrics = aprs.METRICS if metrics is None else metrics
+        labels = {'transport': self._transport}
+        self._received = self.metrics.counter(
+            'aprs_kiss_frames_received_total',
+            'Frames received from a KISS device.', labels)
+        self._received_bytes = self.metrics.counter(
+            'aprs_kiss_bytes_received_total',
+            'Bytes read from a KISS device, including KISS framing.', labels)
+        self._sent = self.metrics.counter(
+            'aprs_kiss_frames_sent_total', 'Frames sent to a KISS device.',
+            labels)
+        self._sent_bytes = self.metrics.counter(
+            'aprs_kiss_bytes_sent_total',
+            'Bytes of encoded Frames sent to a KISS device.', labels)
+        self._parse_errors = self.metrics.counter(
+            'aprs_parse_errors_total', 'Frames that failed to parse.',
+            labels)
+        self._parse_seconds = self.metrics.histogram(
+            'aprs_parse_seconds', 'Time spent parsing each Frame.', labels)
+        self._callback_seconds = self.metrics.histogram(
+            'aprs_callback_seconds', 'Time spent in the receive callback.',
+            labels)
+
+    def _read_handler(self, read_bytes=None):
+        read_data = super(KISSInstrumentation, self)._read_handler(read_bytes)
+        if read_data:
+            self.read_ns = time.monotonic_ns()
+            self._received_bytes.inc(len(read_data))
+        return read_data
+
+    def _deliver(self, frame, callback, frame_handler, tracer):
+        """
+        Parses a decoded KISS frame with `frame_handler`, passes it to
+        `callback` and, with a `tracer`, records its stages in an
+        `aprs.Envelope`.
+
+        :returns: The Frame, or its Envelope if `tracer.envelopes`.
+        """
+        self._received.inc()
+        clock = time.monotonic_ns
+        framed = clock()
+        if frame_handler:
+            try:
+                frame = frame_handler(frame)
+            except Exception:
+                self._parse_errors.inc()
+                raise
+        parsed = clock()
+        if frame_handler:
+            self._parse_seconds.observe((parsed - framed) / 1e9)
+
+        envelope = None
+        if tracer is not None:
+            envelope = aprs.Envelope(frame, self.read_ns, framed)
+            envelope.parsed = envelope.filtered = parsed
+            if tracer.envelopes:
+                frame = envelope
+        if callback is not None:
+            callback(frame)
+        delivered = clock()
+        if callback is not None:
+            self._callback_seconds.observe((delivered - parsed) / 1e9)
+        if envelope is not None:
+            envelope.delivered = delivered
+            tracer.trace(envelope)
+        return frame
+
+    def read(self, read_bytes=None, callback=None, readmode=True,
+             frame_handler=None, tracer: 'aprs.Tracer'=None) -> \
+            typing.Optional[list]:
+        """
+        Reads Frames from the KISS device, see `kiss.KISS.read`.
+
+        :param frame_handler: Optional function to parse each KISS frame
+                              with before it's delivered.
+        :param tracer: Optional `aprs.Tracer`, each delivered Frame's stage
+                       timings are recorded by it. With `readmode=False`, a
+                       Frame is delivered when `read` returns it.
+        :type tracer: aprs.Tracer
+
+        :returns: List of Frames (if readmode=False).
+        """
+        if callback is not None:
+            user_callback = callback
+
+            def callback(frame):  # pylint: disable=E0102
+                self._deliver(frame, user_callback, frame_handler, tracer)
+
+        frames = super(KISSInstrumentation, self).read(
+            read_bytes, callback, readmode)
+        if frames:
+            frames = [self._deliver(frame, None, frame_handler, tracer)
+                      for frame in frames]
+        return frames
+
+    def _count_sent(self, frame) -> None:
+        self._sent.inc()
+        self._sent_bytes.inc(len(frame))
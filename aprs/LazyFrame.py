@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import typing
+
+import aprs  # pylint: disable=R0801
+
+
+class LazyFrame(aprs.Frame):
+
+    """
+    LazyFrame Class.
+
+    A plain-text APRS Frame that keeps the raw bytes and delimiter offsets,
+    and only decodes each field on first access.
+
+    Until a field is set or changed in place, `bytes(frame)` returns the
+    original buffer without re-serializing it. In-place changes are found
+    by comparing each decoded field's attributes with a snapshot taken when
+    it was decoded, which costs no encoding.
+    """
+
+    __slots__ = ['_raw', '_sd_delim', '_pi_delim', '_source', '_destination',
+                 '_path', '_info', '_modified', '_decoded']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, raw_frame: bytes=b'') -> None:  # pylint: disable=W0231
+        if not isinstance(raw_frame, bytes):
+            raw_frame = bytes(raw_frame)
+        self._raw: bytes = raw_frame
+        self._sd_delim, self._pi_delim = self.find_delimiters(raw_frame)
+        self._source = None
+        self._destination = None
+        self._path = None
+        self._info = None
+        self._modified: bool = False
+        # Snapshot of each decoded field, by attribute name:
+        self._decoded: typing.Dict[str, typing.Any] = {}
+
+    @classmethod
+    def from_text(cls, raw_frame: bytes) -> 'aprs.LazyFrame':
+        """
+        Wraps a plain-text Frame without decoding any fields.
+        """
+        return cls(raw_frame)
+
+    @property
+    def raw(self) -> bytes:
+        """
+        The original plain-text Frame.
+        """
+        return self._raw
+
+    @property
+    def modified(self) -> bool:
+        """
+        True once any field has been set, or a decoded field no longer matches
+        the original Frame.
+        """
+        if not self._modified and self._changed():
+            self._modified = True
+        return self._modified
+
+    @staticmethod
+    def _snapshot(value) -> typing.Any:
+        """
+        Returns the attributes of a decoded Callsign, path or Information
+        Field, in a form that's compared by value.
+        """
+        if isinstance(value, list):
+            return [LazyFrame._snapshot(item) for item in value]
+        if isinstance(value, aprs.Callsign):
+            return (value.callsign, value.ssid, value.digi)
+        if isinstance(value, aprs.InformationField):
+            return (value.data_type, value.data, value.safe)
+        return value
+
+    def _decode(self, name: str, value) -> typing.Any:
+        self._decoded[name] = self._snapshot(value)
+        return value
+
+    def _changed(self) -> bool:
+        """
+        True if a decoded field was changed in place, e.g. by
+        `frame.path.append(...)` or `frame.source.set_ssid(...)`.
+        """
+        snapshot = self._snapshot
+        for name, decoded in self._decoded.items():
+            if snapshot(getattr(self, name)) != decoded:
+                return True
+        return False
+
+    @property
+    def source(self):
+        if self._source is None:
+            self._source = self._decode('_source', aprs.Callsign.parse(
+                self._raw[:self._sd_delim]))
+        return self._source
+
+    @source.setter
+    def source(self, source) -> None:
+        self._source = source
+        self._modified = True
+
+    @property
+    def destination(self):
+        if self._destination is None:
+            raw_destination = self._raw[self._sd_delim + 1:self._pi_delim]
+            if b',' in raw_destination:
+                raw_destination = raw_destination[:raw_destination.index(b',')]
+            self._destination = self._decode(
+                '_destination', aprs.Callsign.parse(raw_destination))
+        return self._destination
+
+    @destination.setter
+    def destination(self, destination) -> None:
+        self._destination = destination
+        self._modified = True
+
+    @property
+    def path(self):
+        if self._path is None:
+            self._path = self._decode('_path', aprs.Callsign.parse_many(
+                self._raw[self._sd_delim + 1:self._pi_delim].split(b',')[1:]))
+        return self._path
+
+    @path.setter
+    def path(self, path) -> None:
+        self._path = path
+        self._modified = True
+
+    @property
+    def info(self):
+        if self._info is None:
+            self._info = self._decode('_info', aprs.InformationField.parse(
+                self._raw[self._pi_delim + 1:]))
+        return self._info
+
+    @info.setter
+    def info(self, info) -> None:
+        self._info = info
+        self._modified = True
+
+    def update_path(self, update: bytes) -> None:
+        super(LazyFrame, self).update_path(update)
+        self._modified = True
+
+    def __repr__(self) -> str:
+        if self.modified:
+            return super(LazyFrame, self).__repr__()
+        return self._raw.decode('UTF-8', 'backslashreplace')
+
+    def __bytes__(self) -> bytes:
+        if self.modified:
+            return super(LazyFrame, self).__bytes__()
+        return self._raw
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import typing
+
+import aprs  # pylint: disable=R0801
+
+AprsLineFramer = typing.TypeVar('AprsLineFramer', bound='aprs.LineFramer')
+
+
+class LineFramer(object):
+
+    """
+    LineFramer Class.
+
+    Splits a stream of APRS-IS data into CRLF terminated lines without
+    re-copying the receive buffer on every read.
+
+    Data is read with `recv_into` into a preallocated, growable `bytearray`.
+    Lines are handed out as `memoryview` slices of that buffer, and are only
+    valid until the next call to `recv_into` or `feed`.
+    """
+
+    __slots__ = ['_buffer', '_view', '_start', '_end', '_scan', 'delimiter']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, size: int=0, delimiter: bytes=b'\r\n') -> None:
+        size = size or aprs.RECV_BUFFER * 4
+        self._buffer: bytearray = bytearray(size)
+        self._view: memoryview = memoryview(self._buffer)
+        # Start of the first unconsumed line:
+        self._start: int = 0
+        # End of valid data in the buffer:
+        self._end: int = 0
+        # Position from which to resume the delimiter search:
+        self._scan: int = 0
+        self.delimiter: bytes = delimiter
+
+    def __len__(self) -> int:
+        """
+        Returns the number of buffered, unconsumed bytes.
+        """
+        return self._end - self._start
+
+    def _reserve(self, nbytes: int) -> None:
+        """
+        Makes room for at least `nbytes` after the end of the buffered data.
+        """
+        if len(self._buffer) - self._end >= nbytes:
+            return
+
+        pending = self._end - self._start
+        size = len(self._buffer)
+        while size - pending < nbytes:
+            size *= 2
+
+        # Always move into a fresh buffer: memoryview slices handed out
+        # earlier may still be alive, and they'd pin the old one.
+        buffer = bytearray(size)
+        buffer[:pending] = self._view[self._start:self._end]
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._scan -= self._start
+        self._start = 0
+        self._end = pending
+
+    def _compact(self) -> None:
+        """
+        Moves any partial line to the front of the buffer.
+        """
+        if not self._start:
+            return
+        pending = self._end - self._start
+        if pending:
+            self._buffer[:pending] = self._view[self._start:self._end]
+        self._scan -= self._start
+        self._start = 0
+        self._end = pending
+
+    def recv_into(self, sock, nbytes: int=0) -> int:
+        """
+        Reads up to `nbytes` from `sock` directly into the line buffer.
+
+        :returns: Number of bytes read, 0 on EOF.
+        :rtype: int
+        """
+        nbytes = nbytes or aprs.RECV_BUFFER
+        self._compact()
+        self._reserve(nbytes)
+        recvd = sock.recv_into(self._view[self._end:self._end + nbytes])
+        self._end += recvd
+        return recvd
+
+    def feed(self, data: bytes) -> None:
+        """
+        Appends already-received `data` to the line buffer.
+        """
+        self._compact()
+        self._reserve(len(data))
+        self._buffer[self._end:self._end + len(data)] = data
+        self._end += len(data)
+
+    def lines(self) -> typing.Iterator[memoryview]:
+        """
+        Yields each complete, non-empty line in the buffer as a `memoryview`,
+        without the trailing delimiter.
+        """
+        find = self._buffer.find
+        view = self._view
+        delimiter = self.delimiter
+        delim_len = len(delimiter)
+        end = self._end
+        start = self._start
+        idx = find(delimiter, self._scan, end)
+
+        try:
+            while idx != -1:
+                if idx > start:
+                    line = view[start:idx]
+                    start = idx + delim_len
+                    yield line
+                else:
+                    start = idx + delim_len
+                idx = find(delimiter, start, end)
+        finally:
+            self._start = start
+            if idx == -1:
+                # Resume just before the end next time, in case the
+                # delimiter is split across reads:
+                self._scan = max(start, end - delim_len + 1)
+            else:
+                # The consumer stopped early, the rest is still unscanned:
+                self._scan = start
@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import bisect
+import http.server
+import logging
+import threading
+import typing
+
+import aprs  # pylint: disable=R0801
+
+AprsMetrics = typing.TypeVar('AprsMetrics', bound='aprs.Metrics')
+
+# Upper bounds, in seconds, of the default latency Histogram buckets.
+LATENCY_BUCKETS = (0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025,
+                   0.0005, 0.001, 0.0025, 0.01, 0.1, 1.0)
+
+
+def _labels(labels: typing.Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{%s}' % ','.join(
+        '%s="%s"' % (key, str(value).replace('\\', r'\\').replace('"', r'\"'))
+        for key, value in sorted(labels.items()))
+
+
+class Counter(object):
+
+    """
+    Counter Class.
+
+    A monotonically increasing value. Increments aren't locked, so
+    concurrent writers rely on the GIL.
+    """
+
+    __slots__ = ['name', 'help', 'labels', 'value']
+
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str='',
+                 labels: typing.Dict[str, str]=None) -> None:
+        self.name: str = name
+        self.help: str = help_text
+        self.labels: typing.Dict[str, str] = labels or {}
+        self.value: float = 0
+
+    def __repr__(self) -> str:
+        return '<Counter %s%s %s>' % (self.name, _labels(self.labels),
+                                      self.value)
+
+    def inc(self, amount: float=1) -> None:
+        """
+        Increments the Counter by `amount`.
+        """
+        self.value += amount
+
+    def samples(self) -> typing.List[typing.Tuple[str, str, float]]:
+        """
+        Returns the `(name, labels, value)` samples of the Counter.
+        """
+        return [(self.name, _labels(self.labels), self.value)]
+
+
+class Gauge(Counter):
+
+    """
+    Gauge Class.
+
+    A value that goes up & down, either `set` directly or read from a
+    function at export time (e.g. a queue's `qsize`).
+    """
+
+    __slots__ = ['function']
+
+    kind = 'gauge'
+
+    def __init__(self, name: str, help_text: str='',
+                 labels: typing.Dict[str, str]=None) -> None:
+        super(Gauge, self).__init__(name, help_text, labels)
+        self.function: typing.Callable[[], float] = None
+
+    def set(self, value: float) -> None:
+        """
+        Sets the Gauge to `value`.
+        """
+        self.value = value
+
+    def dec(self, amount: float=1) -> None:
+        """
+        Decrements the Gauge by `amount`.
+        """
+        self.value -= amount
+
+    def set_function(self, function: typing.Callable[[], float]) -> None:
+        """
+        Reads the Gauge from `function` at export time.
+        """
+        self.function = function
+
+    def samples(self) -> typing.List[typing.Tuple[str, str, float]]:
+        """
+        Returns the `(name, labels, value)` samples of the Gauge.
+        """
+        if self.function is not None:
+            self.value = self.function()
+        return [(self.name, _labels(self.labels), self.value)]
+
+
+class Histogram(object):
+
+    """
+    Histogram Class.
+
+    Counts observations into fixed, cumulative-on-export buckets. An
+    observation is a `bisect` and two additions, no locking.
+    """
+
+    __slots__ = ['name', 'help', 'labels', 'buckets', 'counts', 'sum',
+                 'count']
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str='',
+                 labels: typing.Dict[str, str]=None,
+                 buckets: typing.Sequence[float]=LATENCY_BUCKETS) -> None:
+        self.name: str = name
+        self.help: str = help_text
+        self.labels: typing.Dict[str, str] = labels or {}
+        self.buckets: typing.Tuple[float, ...] = tuple(sorted(buckets))
+        # One count per bucket, plus +Inf:
+        self.counts: typing.List[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0
+        self.count: int = 0
+
+    def __repr__(self) -> str:
+        return '<Histogram %s%s count=%d>' % (
+            self.name, _labels(self.labels), self.count)
+
+    def observe(self, value: float) -> None:
+        """
+        Records an observation of `value`.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Returns the upper bound of the bucket holding the `fraction`
+        quantile, e.g. 0.99 for p99.
+        """
+        target = fraction * self.count
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            if total >= target and total:
+                return bound
+        return float('inf')
+
+    def samples(self) -> typing.List[typing.Tuple[str, str, float]]:
+        """
+        Returns the `_bucket`, `_sum` & `_count` samples of the Histogram.
+        """
+        samples = []
+        total = 0
+        bounds = [repr(float(bound)) for bound in self.buckets] + ['+Inf']
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            labels = dict(self.labels, le=bound)
+            samples.append((self.name + '_bucket', _labels(labels), total))
+        samples.append((self.name + '_sum', _labels(self.labels), self.sum))
+        samples.append(
+            (self.name + '_count', _labels(self.labels), self.count))
+        return samples
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+
+    """Serves `Metrics.export` on every GET."""
+
+    def do_GET(self) -> None:  # pylint: disable=C0103
+        body = self.server.metrics.export().encode('UTF-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:  # pylint: disable=W0221
+        pass
+
+
+class Metrics(object):
+
+    """
+    Metrics Class.
+
+    A registry of Counters, Gauges & Histograms, exported in the Prometheus
+    text format. Asking for a metric that's already registered, by name &
+    labels, returns the existing one.
+
+    `aprs.METRICS` is the default registry updated by `aprs.TCP`,
+    `aprs.UDP`, `aprs.HTTP` and the KISS interfaces in `aprs.kiss_classes`.
+    """
+
+    __slots__ = ['_metrics', '_lock']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self) -> None:
+        self._metrics: typing.Dict[tuple, typing.Any] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def __iter__(self) -> typing.Iterator:
+        return iter(list(self._metrics.values()))
+
+    def __len__(self) -> int:
+        return len(self._metrics)
+
+    def __repr__(self) -> str:
+        return '<Metrics metrics=%d>' % len(self._metrics)
+
+    def _get(self, metric_class, name: str, help_text: str,
+             labels: typing.Dict[str, str], **kwargs):
+        key = (name, tuple(sorted((labels or {}).items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = metric_class(name, help_text, labels, **kwargs)
+                    self._metrics[key] = metric
+        # Exact type: a Gauge is a Counter subclass, but not a Counter.
+        if type(metric) is not metric_class:  # pylint: disable=C0123
+            raise ValueError('%s is already registered as a %s.' % (
+                name, metric.kind))
+        return metric
+
+    def unregister(self, metric) -> None:
+        """
+        Removes `metric` from the registry, if it's registered.
+        """
+        key = (metric.name, tuple(sorted(metric.labels.items())))
+        with self._lock:
+            if self._metrics.get(key) is metric:
+                del self._metrics[key]
+
+    def counter(self, name: str, help_text: str='',
+                labels: typing.Dict[str, str]=None) -> Counter:
+        """
+        Returns the Counter `name` with `labels`, registering it if needed.
+        """
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str='',
+              labels: typing.Dict[str, str]=None) -> Gauge:
+        """
+        Returns the Gauge `name` with `labels`, registering it if needed.
+        """
+        return self._get(Gauge, name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str='',
+                  labels: typing.Dict[str, str]=None,
+                  buckets: typing.Sequence[float]=LATENCY_BUCKETS) -> \
+            Histogram:
+        """
+        Returns the Histogram `name` with `labels`, registering it if
+        needed.
+        """
+        return self._get(Histogram, name, help_text, labels, buckets=buckets)
+
+    def export(self) -> str:
+        """
+        Returns every metric in the Prometheus text exposition format.
+        """
+        lines = []
+        seen = set()
+        for metric in sorted(self, key=lambda metric: metric.name):
+            if metric.name not in seen:
+                seen.add(metric.name)
+                if metric.help:
+                    lines.append('# HELP %s %s' % (metric.name, metric.help))
+                lines.append('# TYPE %s %s' % (metric.name, metric.kind))
+            for name, labels, value in metric.samples():
+                lines.append('%s%s %s' % (name, labels, repr(float(value))))
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int=9100, host: str='127.0.0.1') -> \
+            http.server.HTTPServer:
+        """
+        Serves `export` over HTTP from a daemon thread. Call `shutdown()`
+        on the returned server to stop it.
+        """
+        server = http.server.ThreadingHTTPServer((host, port),
+                                                 _MetricsHandler)
+        server.daemon_threads = True
+        server.metrics = self
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self._logger.info('Serving metrics on %s:%d', *server.server_address)
+        return server
+
+    def info(self) -> typing.Dict[str, float]:
+        """
+        Returns the value of each Counter & Gauge, and the count of each
+        Histogram, by name & labels.
+        """
+        info = {}
+        for metric in self:
+            key = metric.name + _labels(metric.labels)
+            if isinstance(metric, Histogram):
+                info[key] = metric.count
+            else:
+                info[key] = metric.samples()[0][2]
+        return info
@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import array
+import itertools
+import logging
+import typing
+
+import aprs  # pylint: disable=R0801
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+AprsPosition = typing.TypeVar('AprsPosition', bound='aprs.Position')
+
+FEET_PER_METER = 3.28084
+
+# Base-91 digit value of each byte, -1 if it isn't a base-91 digit.
+BASE91 = tuple(byte - 33 if 33 <= byte <= 123 else -1 for byte in range(256))
+
+
+def _mice_destination_table() -> tuple:
+    """
+    Builds the Mic-E destination address lookup table: for each byte, a
+    (latitude digit, N/+100/W flag) tuple, or None if the byte is invalid.
+    """
+    table = [None] * 256
+    for offset in range(10):
+        table[ord('0') + offset] = (ord('0') + offset, False)
+        table[ord('A') + offset] = (ord('0') + offset, False)
+        table[ord('P') + offset] = (ord('0') + offset, True)
+    table[ord('K')] = (ord(' '), False)
+    table[ord('L')] = (ord(' '), False)
+    table[ord('Z')] = (ord(' '), True)
+    return tuple(table)
+
+
+MICE_DESTINATION = _mice_destination_table()
+
+# Data Type Identifiers of Frames that carry a position.
+UNCOMPRESSED_TYPES = frozenset(b'!=/@;)')
+MICE_TYPES = frozenset(b'`\'\x1c\x1d')
+POSITION_TYPES = UNCOMPRESSED_TYPES | MICE_TYPES
+
+# Columns returned by `Position.decode_batch`.
+BATCH_COLUMNS = ('lat', 'lng', 'course', 'speed', 'altitude')
+
+
+class Position(object):
+
+    """
+    Position Class.
+
+    Decodes the position in an APRS Information Field: uncompressed and
+    base-91 compressed ('!', '=', '/', '@', Objects & Items) and Mic-E.
+
+    `course` is in degrees, `speed` in knots and `altitude` in feet. Each is
+    None when the Frame doesn't carry it.
+    """
+
+    __slots__ = ['lat', 'lng', 'table', 'symbol', 'course', 'speed',
+                 'altitude', 'ambiguity', 'format', 'comment']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, lat: float=0.0, lng: float=0.0, table: bytes=b'/',
+                 symbol: bytes=b'', course: int=None, speed: float=None,
+                 altitude: float=None, ambiguity: int=0,
+                 format: str='uncompressed', comment: bytes=b'') -> None:  # NOQA pylint: disable=W0622
+        self.lat = lat
+        self.lng = lng
+        self.table = table
+        self.symbol = symbol
+        self.course = course
+        self.speed = speed
+        self.altitude = altitude
+        self.ambiguity = ambiguity
+        self.format = format
+        self.comment = comment
+
+    def __repr__(self) -> str:
+        return '<Position %s lat=%.6f lng=%.6f symbol=%s%s>' % (
+            self.format, self.lat, self.lng, self.table.decode(),
+            self.symbol.decode())
+
+    @classmethod
+    def parse(cls, info: bytes, destination: bytes=b'') -> AprsPosition:
+        """
+        Decodes the position in an APRS Information Field.
+
+        :param info: Information Field, including the Data Type Identifier.
+        :param destination: Destination Callsign, only used by Mic-E.
+
+        :returns: Position, or None if this Data Type has no position.
+        :raises: aprs.BadPositionError if the position is malformed.
+        """
+        if not isinstance(info, bytes):
+            info = bytes(info)
+        if not info:
+            return None
+
+        data_type = info[0]
+        if data_type in (0x21, 0x3D):  # '!', '='
+            body = info[1:]
+        elif data_type in (0x2F, 0x40):  # '/', '@' have a timestamp.
+            body = info[8:]
+        elif data_type == 0x3B:  # ';' Object: name, state & timestamp.
+            body = info[18:]
+        elif data_type == 0x29:  # ')' Item: name ends at '!' or '_'.
+            end = min(idx for idx in (info.find(b'!', 4), info.find(b'_', 4),
+                                      len(info)) if idx != -1)
+            body = info[end + 1:]
+        elif data_type in MICE_TYPES:
+            return cls.from_mice(info, destination)
+        else:
+            return None
+
+        if not body:
+            raise aprs.BadPositionError('Missing position.')
+        elif 0x30 <= body[0] <= 0x39 or body[0] == 0x20:
+            return cls.from_uncompressed(body)
+        else:
+            return cls.from_compressed(body)
+
+    @classmethod
+    def from_frame(cls, frame: 'aprs.Frame') -> AprsPosition:
+        """
+        Decodes the position of an `aprs.Frame`.
+        """
+        return cls.parse(bytes(frame.info), frame.destination.callsign)
+
+    @classmethod
+    def parse_many(cls, infos: typing.Iterable[bytes],
+                   destinations: typing.Iterable[bytes]=None) -> typing.List:
+        """
+        Decodes many Information Fields, see `parse`.
+
+        Fields without a valid position decode to None.
+        """
+        parse = cls.parse
+        if destinations is None:
+            destinations = itertools.repeat(b'')
+        positions = []
+        append = positions.append
+        for info, destination in zip(infos, destinations):
+            try:
+                append(parse(info, destination))
+            except (aprs.BadPositionError, ValueError, IndexError):
+                append(None)
+        return positions
+
+    @classmethod
+    def decode_batch(cls, frames, destinations: typing.Iterable[bytes]=None):
+        """
+        Decodes the positions of an `aprs.FrameBatch`, or of a list of
+        Information Fields, into columns.
+
+        :returns: dict of float 'lat', 'lng', 'course', 'speed' & 'altitude'
+                  columns (NaN where missing) and a bool 'valid' column.
+                  NumPy arrays when NumPy is installed, `array.array`s
+                  otherwise.
+        """
+        if isinstance(frames, aprs.FrameBatch):
+            batch = frames
+            types = batch.data_types
+            infos = [batch.info(idx) if types[idx] in POSITION_TYPES else b''
+                     for idx in range(len(batch))]
+            destinations = [batch.destination(idx)
+                            if types[idx] in MICE_TYPES else b''
+                            for idx in range(len(batch))]
+        else:
+            infos = frames
+
+        positions = cls.parse_many(infos, destinations)
+
+        nan = float('nan')
+        columns = {name: array.array('d', [nan]) * len(positions)
+                   for name in BATCH_COLUMNS}
+        valid = array.array('B', [0]) * len(positions)
+        for idx, position in enumerate(positions):
+            if position is None:
+                continue
+            valid[idx] = 1
+            for name in BATCH_COLUMNS:
+                value = getattr(position, name)
+                if value is not None:
+                    columns[name][idx] = value
+
+        if numpy is not None:
+            columns = {name: numpy.array(col, dtype=numpy.float64)
+                       for name, col in columns.items()}
+            columns['valid'] = numpy.array(valid, dtype=bool)
+        else:
+            columns['valid'] = valid
+        return columns
+
+    @classmethod
+    def from_uncompressed(cls, body: bytes) -> AprsPosition:
+        """
+        Decodes an uncompressed position: `DDMM.hhN/DDDMM.hhW$`, optionally
+        followed by a `CCC/SSS` course/speed extension.
+        """
+        if len(body) < 19:
+            raise aprs.BadPositionError('Uncompressed position too short.')
+
+        raw_lat = body[0:8]
+        ambiguity = raw_lat.count(b' ')
+        if ambiguity:
+            raw_lat = raw_lat.replace(b' ', b'0')
+        raw_lng = body[9:18].replace(b' ', b'0')
+
+        try:
+            lat = int(raw_lat[0:2]) + float(raw_lat[2:7]) / 60.0
+            lng = int(raw_lng[0:3]) + float(raw_lng[3:8]) / 60.0
+        except ValueError:
+            raise aprs.BadPositionError('Bad uncompressed position.')
+
+        lat_hemisphere = raw_lat[7]
+        lng_hemisphere = raw_lng[8]
+        if lat_hemisphere == 0x53:  # 'S'
+            lat = -lat
+        elif lat_hemisphere != 0x4E:  # 'N'
+            raise aprs.BadPositionError('Bad latitude hemisphere.')
+        if lng_hemisphere == 0x57:  # 'W'
+            lng = -lng
+        elif lng_hemisphere != 0x45:  # 'E'
+            raise aprs.BadPositionError('Bad longitude hemisphere.')
+
+        position = cls(lat, lng, body[8:9], body[18:19], ambiguity=ambiguity,
+                       format='uncompressed')
+
+        comment = body[19:]
+        if (len(comment) >= 7 and comment[3] == 0x2F and
+                comment[0:3].isdigit() and comment[4:7].isdigit()):
+            position.course = int(comment[0:3])
+            position.speed = float(comment[4:7])
+            comment = comment[7:]
+
+        position.comment = comment
+        position._comment_altitude()
+        position._check()
+        return position
+
+    @classmethod
+    def from_compressed(cls, body: bytes) -> AprsPosition:
+        """
+        Decodes a base-91 compressed position: `/YYYYXXXX$csT`.
+        """
+        if len(body) < 13:
+            raise aprs.BadPositionError('Compressed position too short.')
+
+        base91 = BASE91
+        digits = [base91[byte] for byte in body[1:9]]
+        if min(digits) < 0:
+            raise aprs.BadPositionError('Bad base-91 digit.')
+
+        lat_val = ((digits[0] * 91 + digits[1]) * 91 +
+                   digits[2]) * 91 + digits[3]
+        lng_val = ((digits[4] * 91 + digits[5]) * 91 +
+                   digits[6]) * 91 + digits[7]
+
+        position = cls(90.0 - lat_val / 380926.0, -180.0 + lng_val / 190463.0,
+                       body[0:1], body[9:10], format='compressed',
+                       comment=body[13:])
+
+        c_byte, s_byte, t_byte = body[10], body[11], body[12]
+        if c_byte != 0x20:
+            c_val, s_val = base91[c_byte], base91[s_byte]
+            t_val = base91[t_byte]
+            if min(c_val, s_val, t_val) < 0:
+                raise aprs.BadPositionError('Bad compressed cs or type byte.')
+            if ((t_val >> 3) & 0x03) == 0x02:
+                # GGA sourced: cs is altitude.
+                position.altitude = 1.002 ** (c_val * 91 + s_val)
+            elif 0 <= c_val <= 89:
+                position.course = c_val * 4
+                position.speed = 1.08 ** s_val - 1
+
+        position._comment_altitude()
+        position._check()
+        return position
+
+    @classmethod
+    def from_mice(cls, info: bytes, destination: bytes) -> AprsPosition:
+        """
+        Decodes a Mic-E position from the Information Field and the
+        Destination Callsign it's encoded in.
+        """
+        if not isinstance(destination, bytes):
+            destination = bytes(destination)
+        if b'-' in destination:
+            destination = destination[:destination.index(b'-')]
+        if len(destination) < 6 or len(info) < 9:
+            raise aprs.BadPositionError('Mic-E Frame too short.')
+
+        decoded = [MICE_DESTINATION[byte] for byte in destination[:6]]
+        if None in decoded:
+            raise aprs.BadPositionError('Bad Mic-E destination.')
+
+        raw_lat = bytes(digit for digit, _ in decoded)
+        ambiguity = raw_lat.count(b' ')
+        if ambiguity:
+            raw_lat = raw_lat.replace(b' ', b'0')
+        lat = int(raw_lat[0:2]) + int(raw_lat[2:6]) / 6000.0
+        if not decoded[3][1]:
+            lat = -lat
+
+        lng_deg = info[1] - 28
+        if decoded[4][1]:
+            lng_deg += 100
+        if 180 <= lng_deg <= 189:
+            lng_deg -= 80
+        elif 190 <= lng_deg <= 199:
+            lng_deg -= 190
+        lng_min = info[2] - 28
+        if lng_min >= 60:
+            lng_min -= 60
+        lng = lng_deg + (lng_min + (info[3] - 28) / 100.0) / 60.0
+        if decoded[5][1]:
+            lng = -lng
+
+        speed = (info[4] - 28) * 10 + (info[5] - 28) // 10
+        if speed >= 800:
+            speed -= 800
+        course = ((info[5] - 28) % 10) * 100 + (info[6] - 28)
+        if course >= 400:
+            course -= 400
+
+        position = cls(lat, lng, info[8:9], info[7:8], course=course,
+                       speed=float(speed), ambiguity=ambiguity,
+                       format='mice')
+
+        comment = info[9:]
+        # Optional altitude: 3 base-91 digits (meters above -10km) then '}',
+        # possibly after a 1 byte Mic-E type indicator.
+        for start in (0, 1):
+            if len(comment) >= start + 4 and comment[start + 3] == 0x7D:
+                digits = [BASE91[byte] for byte in comment[start:start + 3]]
+                if min(digits) >= 0:
+                    meters = (digits[0] * 91 + digits[1]) * 91 + digits[2]
+                    position.altitude = (meters - 10000) * FEET_PER_METER
+                    comment = comment[:start] + comment[start + 4:]
+                    break
+
+        position.comment = comment
+        position._check()
+        return position
+
+    def _comment_altitude(self) -> None:
+        """
+        Extracts a `/A=aaaaaa` altitude (feet) from the comment.
+        """
+        idx = self.comment.find(b'/A=')
+        if idx != -1:
+            try:
+                self.altitude = float(int(self.comment[idx + 3:idx + 9]))
+            except ValueError:
+                pass
+
+    def _check(self) -> None:
+        if not (-90.0 <= self.lat <= 90.0 and -180.0 <= self.lng <= 180.0):
+            raise aprs.BadPositionError('Position out of range.')
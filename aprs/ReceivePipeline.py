@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import itertools
+import logging
+import queue
+import socket
+import threading
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+
+# Marks the end of the stream on both queues, and failed parses.
+_DONE = object()
+
+
+class ReceivePipeline(object):
+
+    """
+    ReceivePipeline Class.
+
+    Receives from an `aprs.TCP` connection in three stages, so socket reads
+    never wait on parsing or on the callback:
+
+        1. A reader thread fills a bounded queue of raw lines.
+        2. A pool of worker threads runs `frame_handler` on each line.
+        3. The dispatcher (the thread calling `run()`) delivers Frames to
+           `callback` in the order they were received.
+
+    Lines that fail to parse are logged and skipped. Both queues hold up to
+    `queue_size` items, which absorbs bursts and slow callbacks; only a
+    callback that stays slower than the feed eventually stalls the reader.
+
+    As with an inline `aprs.TCP.receive`, a socket error or an exception
+    raised by `callback` ends the receive: the pipeline shuts down and
+    `run()` re-raises the first one. Frames read before a socket error are
+    still delivered. After a callback error, reads on the connection are
+    shut down to stop the reader, so the connection has to be restarted.
+
+    Frames `frame_filter` rejects are dropped by the dispatcher. With a
+    `tracer`, each Frame's stages are stamped into an `aprs.Envelope` as it
+    moves through the pipeline.
+
+    Queue depths are exported as gauges labelled with the pipeline's
+    `number` while `run()` is running, and parse & callback times as
+    histograms, in the `metrics` of `aprs_conn`.
+    """
+
+    __slots__ = ['aprs_conn', 'callback', 'frame_handler', 'dupe_filter',
+                 'frame_filter', 'tracer', 'workers', 'lines', 'results',
+                 'read', 'errors', 'dispatched', 'max_pending', 'number',
+                 '_pending', '_error', '_stop', '_lock']
+
+    # `pipeline` label of each ReceivePipeline's gauges:
+    _numbers = itertools.count()
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, aprs_conn: 'aprs.TCP', callback=None,
+                 frame_handler=aprs.Frame.parse, dupe_filter=None,
+                 workers: int=2, queue_size: int=1024, frame_filter=None,
+                 tracer: 'aprs.Tracer'=None) -> None:
+        if workers < 1:
+            raise ValueError('workers must be at least 1.')
+        self.aprs_conn = aprs_conn
+        self.callback = callback
+        self.frame_handler = frame_handler
+        self.dupe_filter = dupe_filter
+        self.frame_filter = frame_filter
+        self.tracer = tracer
+        self.workers: int = workers
+        self.lines: queue.Queue = queue.Queue(queue_size)
+        self.results: queue.Queue = queue.Queue(queue_size)
+        self.read: int = 0
+        self.errors: int = 0
+        self.dispatched: int = 0
+        self.max_pending: int = 0
+        self.number: int = next(self._numbers)
+        # Parsed Frames waiting for an earlier Frame, by sequence number:
+        self._pending: typing.Dict[int, typing.Any] = {}
+        # First reader or dispatcher exception, re-raised by `run()`:
+        self._error: typing.Optional[Exception] = None
+        self._stop: threading.Event = threading.Event()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return '<ReceivePipeline workers=%d lines=%d pending=%d>' % (
+            self.workers, self.lines.qsize(), len(self._pending))
+
+    def _gauges(self) -> typing.List['aprs.Gauge']:
+        """
+        Registers the queue depth gauges of this pipeline.
+        """
+        metrics = self.aprs_conn.metrics
+        labels = {'pipeline': str(self.number)}
+        gauges = []
+        for name, help_text, function in (
+                ('aprs_pipeline_lines_queued',
+                 'Lines waiting for a parse worker.', self.lines.qsize),
+                ('aprs_pipeline_results_queued',
+                 'Parsed Frames waiting for the dispatcher.',
+                 self.results.qsize),
+                ('aprs_pipeline_pending',
+                 'Parsed Frames waiting for an earlier Frame.',
+                 self._pending.__len__)):
+            gauge = metrics.gauge(name, help_text, labels)
+            gauge.set_function(function)
+            gauges.append(gauge)
+        return gauges
+
+    def _read(self) -> None:
+        aprs_conn = self.aprs_conn
+        tracing = self.tracer is not None
+        envelope = None
+        try:
+            for seq, line in enumerate(aprs_conn.lines(self.dupe_filter)):
+                if tracing:
+                    envelope = aprs.Envelope(
+                        line, aprs_conn.read_ns, time.monotonic_ns())
+                self.lines.put((seq, line, envelope))
+                self.read += 1
+                if self._stop.is_set():
+                    break
+        except Exception as ex:  # pylint: disable=W0703
+            self._logger.warning('Reader stopped: %s', ex)
+            self._fail(ex)
+        finally:
+            for _ in range(self.workers):
+                self.lines.put(_DONE)
+
+    def _parse(self) -> None:
+        frame_handler = self.frame_handler
+        clock = time.perf_counter
+        parse_seconds = self.aprs_conn._parse_seconds.observe
+        while 1:
+            item = self.lines.get()
+            if item is _DONE:
+                self.results.put(_DONE)
+                return
+            seq, line, envelope = item
+            if frame_handler:
+                start = clock()
+                try:
+                    line = frame_handler(line)
+                    parse_seconds(clock() - start)
+                except Exception as ex:  # pylint: disable=W0703
+                    self._logger.warning('Unable to parse "%s": %s', line, ex)
+                    line = _DONE
+            if envelope is not None:
+                envelope.frame = line
+                envelope.parsed = time.monotonic_ns()
+            self.results.put((seq, line, envelope))
+
+    def _dispatch(self, frame, envelope) -> None:
+        # Failed parses arrive as _DONE, to keep their place in the order.
+        if frame is _DONE:
+            self.errors += 1
+            self.aprs_conn._parse_errors.inc()
+            return
+        if self.frame_filter is not None and not self.frame_filter(frame):
+            return
+        if envelope is not None:
+            envelope.filtered = time.monotonic_ns()
+            if self.tracer.envelopes:
+                frame = envelope
+        self.dispatched += 1
+        if self.callback:
+            start = time.perf_counter()
+            self.callback(frame)
+            self.aprs_conn._callback_seconds.observe(
+                time.perf_counter() - start)
+        else:
+            self._logger.info('No callback set?')
+        if envelope is not None:
+            envelope.delivered = time.monotonic_ns()
+            self.tracer.trace(envelope)
+
+    def _fail(self, ex: Exception) -> None:
+        """
+        Records the first error, for `run()` to re-raise.
+        """
+        with self._lock:
+            if self._error is None:
+                self._error = ex
+
+    def _deliver(self, frame, envelope) -> None:
+        """
+        Dispatches a Frame, unless the pipeline is stopping. A dispatch error
+        stops it, and shuts down reads so the reader isn't left waiting on
+        the socket.
+        """
+        if self._stop.is_set():
+            return
+        try:
+            self._dispatch(frame, envelope)
+        except Exception as ex:  # pylint: disable=W0703
+            self._logger.exception(ex)
+            self._fail(ex)
+            self._stop.set()
+            try:
+                self.aprs_conn.interface.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+
+    def run(self) -> None:
+        """
+        Starts the reader & workers, and dispatches Frames until the
+        connection closes.
+
+        :raises: The first socket or callback error, once the pipeline has
+                 shut down.
+        """
+        self._stop.clear()
+        self._error = None
+        gauges = self._gauges()
+        try:
+            self._run()
+        finally:
+            for gauge in gauges:
+                self.aprs_conn.metrics.unregister(gauge)
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        threads = [threading.Thread(target=self._read, daemon=True)]
+        threads.extend(
+            threading.Thread(target=self._parse, daemon=True)
+            for _ in range(self.workers))
+        for thread in threads:
+            thread.start()
+
+        pending = self._pending
+        next_seq = 0
+        running = self.workers
+        while running:
+            item = self.results.get()
+            if item is _DONE:
+                running -= 1
+                continue
+            seq, frame, envelope = item
+            if seq != next_seq:
+                pending[seq] = (frame, envelope)
+                if len(pending) > self.max_pending:
+                    self.max_pending = len(pending)
+                continue
+            self._deliver(frame, envelope)
+            next_seq += 1
+            while next_seq in pending:
+                self._deliver(*pending.pop(next_seq))
+                next_seq += 1
+
+        for thread in threads:
+            thread.join()
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the ReceivePipeline queue depths and counters.
+        """
+        return {
+            'workers': self.workers,
+            'lines_queued': self.lines.qsize(),
+            'results_queued': self.results.qsize(),
+            'pending': len(self._pending),
+            'max_pending': self.max_pending,
+            'read': self.read,
+            'errors': self.errors,
+            'dispatched': self.dispatched
+        }
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import typing
+import zlib
+
+import aprs  # pylint: disable=R0801
+
+# Fields of each record returned by ShardedIngest, in order. `path` is the
+# comma separated path, `decoded` the result of the decode stage (or None).
+RECORD_FIELDS = ('source', 'destination', 'path', 'info', 'decoded')
+
+# Seconds between checks for a stop while waiting on a full inbox.
+_PUT_INTERVAL = 0.1
+
+
+def _shard_worker(shard: int, inbox, outbox, decode) -> None:
+    """
+    Parses batches of raw lines from `inbox` and puts batches of records on
+    `outbox`, followed by `(shard, errors)` once `inbox` is exhausted.
+    """
+    parse = aprs.Frame.parse
+    errors = 0
+    while 1:
+        lines = inbox.get()
+        if lines is None:
+            break
+        records = []
+        for line in lines:
+            try:
+                frame = parse(line)
+                records.append((
+                    bytes(frame.source),
+                    bytes(frame.destination),
+                    b','.join(bytes(call) for call in frame.path),
+                    bytes(frame.info),
+                    decode(frame) if decode is not None else None
+                ))
+            except Exception:  # pylint: disable=W0703
+                errors += 1
+        if records:
+            outbox.put(records)
+    outbox.put((shard, errors))
+
+
+class ShardedIngest(object):
+
+    """
+    ShardedIngest Class.
+
+    Parses raw plain-text Frames across worker processes, to use more than
+    one core.
+
+    Lines are sharded by a CRC-32 of the source Callsign, so all Frames from
+    one station go to the same worker and stay in order. Each worker runs
+    `aprs.Frame.parse` plus an optional `decode` stage, and returns batches
+    of compact tuple records (see `RECORD_FIELDS`) rather than pickled
+    Frames. `to_frame` turns a record back into an `aprs.Frame`.
+
+    `decode` runs in the workers, so it must be picklable, e.g. a
+    module-level function or `aprs.Position.from_frame`.
+    """
+
+    __slots__ = ['workers', 'decode', 'batch_size', 'queue_size', 'read',
+                 'records', 'errors']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, workers: int=0, decode=None, batch_size: int=256,
+                 queue_size: int=64) -> None:
+        self.workers: int = workers or os.cpu_count() or 1
+        self.decode = decode
+        self.batch_size: int = batch_size
+        # Batches in flight per shard:
+        self.queue_size: int = queue_size
+        self.read: int = 0
+        self.records: int = 0
+        self.errors: int = 0
+
+    def __repr__(self) -> str:
+        return '<ShardedIngest workers=%d read=%d records=%d errors=%d>' % (
+            self.workers, self.read, self.records, self.errors)
+
+    def shard(self, line: bytes) -> int:
+        """
+        Returns the worker index for raw plain-text Frame `line`.
+        """
+        sd_delim = line.find(b'>')
+        if sd_delim == -1:
+            return 0
+        return zlib.crc32(line[:sd_delim]) % self.workers
+
+    @staticmethod
+    def _put(inbox, item, stop: threading.Event) -> bool:
+        """
+        Puts `item` on `inbox`, waiting for room until `stop` is set.
+
+        :returns: False if stopped first.
+        :rtype: bool
+        """
+        while not stop.is_set():
+            try:
+                inbox.put(item, timeout=_PUT_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _feed(self, lines: typing.Iterable[bytes], inboxes: list,
+              stop: threading.Event) -> None:
+        batch_size = self.batch_size
+        batches = [[] for _ in inboxes]
+        try:
+            for line in lines:
+                if stop.is_set():
+                    break
+                if isinstance(line, str):
+                    line = bytes(line, 'UTF-8')
+                elif not isinstance(line, bytes):
+                    line = bytes(line)
+                line = line.rstrip(b'\r\n')
+                if not line or line.startswith(b'#'):
+                    continue
+                self.read += 1
+                shard = self.shard(line)
+                batch = batches[shard]
+                batch.append(line)
+                if len(batch) >= batch_size:
+                    if not self._put(inboxes[shard], batch, stop):
+                        break
+                    batches[shard] = []
+        finally:
+            # Once stopped, the workers are gone and nothing is delivered:
+            for shard, inbox in enumerate(inboxes):
+                if batches[shard]:
+                    self._put(inbox, batches[shard], stop)
+                self._put(inbox, None, stop)
+
+    def map(self, lines: typing.Iterable[bytes]) -> typing.Iterator[tuple]:
+        """
+        Parses `lines` in the worker processes, yielding records as their
+        batches arrive.
+
+        Records of one source Callsign are yielded in input order; records
+        of different Callsigns may be interleaved differently. Lines that
+        fail to parse or decode are counted in `errors`.
+
+        Closing the iterator early stops the workers, and the feeder thread
+        once it's done with the line it's reading.
+        """
+        inboxes = [multiprocessing.Queue(self.queue_size)
+                   for _ in range(self.workers)]
+        outbox = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=_shard_worker,
+                args=(shard, inbox, outbox, self.decode), daemon=True)
+            for shard, inbox in enumerate(inboxes)]
+        for process in processes:
+            process.start()
+
+        stop = threading.Event()
+        feeder = threading.Thread(
+            target=self._feed, args=(lines, inboxes, stop),
+            name='ShardedIngest feeder', daemon=True)
+        feeder.start()
+
+        try:
+            running = self.workers
+            while running:
+                batch = outbox.get()
+                if isinstance(batch, tuple):
+                    self.errors += batch[1]
+                    running -= 1
+                    continue
+                self.records += len(batch)
+                yield from batch
+        finally:
+            # Also reached when the consumer stops iterating early:
+            stop.set()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            feeder.join(1)
+            if feeder.is_alive():
+                self._logger.warning('Feeder still waiting on `lines`.')
+            # Drop undelivered batches rather than wait to flush them:
+            for inbox in inboxes:
+                inbox.cancel_join_thread()
+                inbox.close()
+            outbox.close()
+
+    def map_frames(self, lines: typing.Iterable[bytes]) -> \
+            typing.Iterator['aprs.Frame']:
+        """
+        Like `map`, but yields `aprs.Frame` objects.
+        """
+        for record in self.map(lines):
+            yield self.to_frame(record)
+
+    @staticmethod
+    def to_frame(record: tuple) -> 'aprs.Frame':
+        """
+        Builds an `aprs.Frame` from a record.
+        """
+        source, destination, path, info = record[:4]
+        return aprs.Frame(
+            source, destination,
+            aprs.Callsign.parse_many(path.split(b',')) if path else [], info)
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the ShardedIngest counters.
+        """
+        return {
+            'workers': self.workers,
+            'read': self.read,
+            'records': self.records,
+            'errors': self.errors
+        }
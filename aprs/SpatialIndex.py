@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import array
+import logging
+import math
+import typing
+
+import aprs  # pylint: disable=R0801
+import aprs.geo_util
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+AprsSpatialIndex = typing.TypeVar(
+    'AprsSpatialIndex', bound='aprs.SpatialIndex')
+
+KM_PER_DEGREE = math.radians(aprs.geo_util.EARTH_RADIUS)
+
+# Half the Earth's circumference: no two points are farther apart.
+MAX_DISTANCE = math.pi * aprs.geo_util.EARTH_RADIUS
+
+
+class SpatialIndex(object):
+
+    """
+    SpatialIndex Class.
+
+    Uniform lat/lng grid of points (e.g. station positions), for radius,
+    bounding-box and k-nearest queries.
+
+    Points are keyed by any hashable (usually the callsign) and stored in
+    `array.array` columns. Each grid cell of `cell_size` degrees holds the
+    set of slots inside it, so `insert` (which also moves) and `delete` are
+    O(1). Queries gather the candidate slots of the overlapping cells and
+    refine them with NumPy when it's installed.
+    """
+
+    __slots__ = ['cell_size', 'lats', 'lngs', '_columns', '_slots', '_keys',
+                 '_cells', '_cell_of', '_free']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, cell_size: float=0.5) -> None:
+        self.cell_size: float = cell_size
+        self.lats: array.array = array.array('d')
+        self.lngs: array.array = array.array('d')
+        # Number of grid columns around the globe:
+        self._columns: int = int(math.ceil(360.0 / cell_size))
+        self._slots: typing.Dict[typing.Hashable, int] = {}
+        self._keys: typing.List[typing.Hashable] = []
+        self._cells: typing.Dict[int, typing.Set[int]] = {}
+        self._cell_of: array.array = array.array('q')
+        self._free: typing.List[int] = []
+
+    @classmethod
+    def from_station_table(cls, table: 'aprs.StationTable',
+                           cell_size: float=0.5) -> AprsSpatialIndex:
+        """
+        Indexes the positions of an `aprs.StationTable`, by callsign.
+        """
+        index = cls(cell_size)
+        for station in table:
+            position = station.position
+            if position is not None:
+                index.insert(station.callsign, *position)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key) -> bool:
+        return key in self._slots
+
+    def __repr__(self) -> str:
+        return '<SpatialIndex points=%d cells=%d cell_size=%s>' % (
+            len(self), len(self._cells), self.cell_size)
+
+    def _row(self, lat: float) -> int:
+        return min(int((lat + 90.0) // self.cell_size),
+                   int(180.0 // self.cell_size))
+
+    def _column(self, lng: float) -> int:
+        return int(((lng + 180.0) % 360.0) // self.cell_size) % self._columns
+
+    def position(self, key) -> typing.Tuple[float, float]:
+        """
+        Returns the `(lat, lng)` of `key`.
+        """
+        slot = self._slots[key]
+        return self.lats[slot], self.lngs[slot]
+
+    def insert(self, key, lat: float, lng: float) -> None:
+        """
+        Inserts `key` at `lat`, `lng`, or moves it there if it's already
+        indexed.
+        """
+        if not -90.0 <= lat <= 90.0 or not -180.0 <= lng <= 180.0:
+            raise aprs.BadPositionError(
+                'Position out of range: %s, %s' % (lat, lng))
+        cell = self._row(lat) * self._columns + self._column(lng)
+        slot = self._slots.get(key)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+                self._keys[slot] = key
+                self.lats[slot] = lat
+                self.lngs[slot] = lng
+                self._cell_of[slot] = cell
+            else:
+                slot = len(self._keys)
+                self._keys.append(key)
+                self.lats.append(lat)
+                self.lngs.append(lng)
+                self._cell_of.append(cell)
+            self._slots[key] = slot
+        else:
+            self.lats[slot] = lat
+            self.lngs[slot] = lng
+            old_cell = self._cell_of[slot]
+            if old_cell == cell:
+                return
+            self._discard(old_cell, slot)
+            self._cell_of[slot] = cell
+        members = self._cells.get(cell)
+        if members is None:
+            members = self._cells[cell] = set()
+        members.add(slot)
+
+    move = insert
+
+    def _discard(self, cell: int, slot: int) -> None:
+        members = self._cells[cell]
+        members.discard(slot)
+        if not members:
+            del self._cells[cell]
+
+    def delete(self, key) -> None:
+        """
+        Removes `key` from the index.
+        """
+        slot = self._slots.pop(key)
+        self._discard(self._cell_of[slot], slot)
+        self._keys[slot] = None
+        self._free.append(slot)
+
+    def _candidates(self, lat_min: float, lat_max: float, lng_min: float,
+                    lng_max: float) -> typing.List[int]:
+        """
+        Returns the slots in every cell overlapping the box. The box may
+        cross the antimeridian (`lng_min > lng_max`).
+        """
+        cells = self._cells
+        columns = self._columns
+        rows = range(self._row(max(lat_min, -90.0)),
+                     self._row(min(lat_max, 90.0)) + 1)
+        if lng_max - lng_min >= 360.0:
+            cols = range(columns)
+        else:
+            first = self._column(lng_min)
+            last = self._column(lng_max)
+            if last < first or (last == first and lng_min > lng_max):
+                last += columns
+            cols = [col % columns for col in range(first, last + 1)]
+
+        slots = []
+        # Sparse grids: walking the occupied cells beats walking the box.
+        if len(rows) * len(cols) > len(cells):
+            cols = set(cols)
+            for cell, members in cells.items():
+                row, col = divmod(cell, columns)
+                if row in rows and col in cols:
+                    slots.extend(members)
+        else:
+            for row in rows:
+                base = row * columns
+                for col in cols:
+                    members = cells.get(base + col)
+                    if members:
+                        slots.extend(members)
+        return slots
+
+    def _distances(self, slots: typing.List[int], lat: float, lng: float):
+        """
+        Returns the great-circle distances (km) of `slots` from `lat`,
+        `lng`, see `aprs.geo_util.distance_many`.
+        """
+        if numpy is None:
+            lats = self.lats
+            lngs = self.lngs
+            return aprs.geo_util.distance_many(
+                lat, lng, [lats[slot] for slot in slots],
+                [lngs[slot] for slot in slots])
+        index = numpy.asarray(slots, dtype=numpy.intp)
+        return aprs.geo_util.distance_many(
+            lat, lng, numpy.frombuffer(self.lats)[index],
+            numpy.frombuffer(self.lngs)[index])
+
+    def radius(self, lat: float, lng: float, km: float) -> \
+            typing.List[typing.Tuple[typing.Hashable, float]]:
+        """
+        Returns the `(key, km)` of every point within `km` of `lat`, `lng`,
+        nearest first.
+        """
+        dlat = km / KM_PER_DEGREE
+        lat_min = lat - dlat
+        lat_max = lat + dlat
+        widest = max(abs(lat_min), abs(lat_max))
+        if widest >= 90.0:
+            dlng = 180.0
+        else:
+            dlng = min(180.0, dlat / math.cos(math.radians(widest)))
+        slots = self._candidates(lat_min, lat_max, lng - dlng, lng + dlng)
+        if not slots:
+            return []
+
+        keys = self._keys
+        distances = self._distances(slots, lat, lng)
+        if numpy is None:
+            return sorted(
+                ((keys[slot], dist) for slot, dist in zip(slots, distances)
+                 if dist <= km), key=lambda result: result[1])
+        within = numpy.flatnonzero(distances <= km)
+        within = within[numpy.argsort(distances[within], kind='stable')]
+        return [(keys[slots[idx]], float(distances[idx])) for idx in within]
+
+    def bbox(self, south: float, west: float, north: float,
+             east: float) -> typing.List[typing.Hashable]:
+        """
+        Returns the keys of every point inside the box, e.g. a map viewport.
+        `west > east` means the box crosses the antimeridian.
+        """
+        slots = self._candidates(south, north, west, east)
+        if not slots:
+            return []
+        keys = self._keys
+        if numpy is None:
+            lats = self.lats
+            lngs = self.lngs
+            if west <= east:
+                return [keys[slot] for slot in slots
+                        if south <= lats[slot] <= north and
+                        west <= lngs[slot] <= east]
+            return [keys[slot] for slot in slots
+                    if south <= lats[slot] <= north and
+                    (lngs[slot] >= west or lngs[slot] <= east)]
+        index = numpy.asarray(slots, dtype=numpy.intp)
+        lats = numpy.frombuffer(self.lats)[index]
+        lngs = numpy.frombuffer(self.lngs)[index]
+        if west <= east:
+            in_lng = (lngs >= west) & (lngs <= east)
+        else:
+            in_lng = (lngs >= west) | (lngs <= east)
+        inside = numpy.flatnonzero((lats >= south) & (lats <= north) & in_lng)
+        return [keys[slots[idx]] for idx in inside]
+
+    def nearest(self, lat: float, lng: float, count: int=1) -> \
+            typing.List[typing.Tuple[typing.Hashable, float]]:
+        """
+        Returns the `(key, km)` of the `count` points nearest to `lat`,
+        `lng`, nearest first.
+
+        Runs `radius` queries of doubling size, starting at one cell, until
+        one holds `count` points: every point outside it is farther.
+        """
+        count = min(count, len(self))
+        if count < 1:
+            return []
+        km = self.cell_size * KM_PER_DEGREE
+        while 1:
+            results = self.radius(lat, lng, km)
+            if len(results) >= count or km >= MAX_DISTANCE:
+                return results[:count]
+            km *= 2
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the SpatialIndex counters.
+        """
+        return {
+            'points': len(self._slots),
+            'slots': len(self._keys),
+            'free': len(self._free),
+            'cells': len(self._cells)
+        }
@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import array
+import logging
+import math
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+
+AprsStationTable = typing.TypeVar(
+    'AprsStationTable', bound='aprs.StationTable')
+
+# Number of buckets the TTL is divided into by default.
+WHEEL_BUCKETS = 64
+
+_NAN = float('nan')
+
+
+def _heard_via(path) -> bytes:
+    """
+    Returns the iGate (after a q construct) or the last used digipeater of
+    `path`, or b'' if the Frame was heard directly.
+    """
+    via = None
+    for idx, hop in enumerate(path):
+        if hop.callsign.startswith(b'qA'):
+            if idx + 1 < len(path):
+                return bytes(path[idx + 1])
+            break
+        if hop.digi:
+            via = hop
+    if via is None:
+        return b''
+    return bytes(via).rstrip(b'*')
+
+
+class Station(object):
+
+    """
+    Station Class.
+
+    A row view of one station in a `StationTable`. Views read the table's
+    columns on access, and are invalid once the station is evicted.
+    """
+
+    __slots__ = ['table', 'slot']
+
+    def __init__(self, table: AprsStationTable, slot: int) -> None:
+        self.table: AprsStationTable = table
+        self.slot: int = slot
+
+    def __repr__(self) -> str:
+        return '<Station %s lat=%.6f lng=%.6f heard=%.3f>' % (
+            self.callsign.decode(), self.lat, self.lng, self.heard)
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, Station) and self.table is other.table and
+                self.slot == other.slot)
+
+    def __hash__(self) -> int:
+        return hash((id(self.table), self.slot))
+
+    @property
+    def callsign(self) -> bytes:
+        """Callsign of the station."""
+        return self.table._callsigns[self.slot]
+
+    @property
+    def lat(self) -> float:
+        """Last latitude, NaN if never heard with a position."""
+        return self.table.lats[self.slot]
+
+    @property
+    def lng(self) -> float:
+        """Last longitude, NaN if never heard with a position."""
+        return self.table.lngs[self.slot]
+
+    @property
+    def heard(self) -> float:
+        """Timestamp the station was last heard."""
+        return self.table.heard[self.slot]
+
+    @property
+    def symbol(self) -> bytes:
+        """Symbol table & code, b'' if never heard with a position."""
+        symbol = self.table.symbols[self.slot]
+        return bytes((symbol >> 8, symbol & 0xFF)) if symbol else b''
+
+    @property
+    def info(self) -> bytes:
+        """Last Information Field."""
+        return self.table._infos[self.slot]
+
+    @property
+    def heard_via(self) -> bytes:
+        """iGate or digipeater the station was last heard via."""
+        return self.table._via_names[self.table.vias[self.slot]]
+
+    @property
+    def position(self) -> typing.Optional[typing.Tuple[float, float]]:
+        """`(lat, lng)`, or None if never heard with a position."""
+        lat = self.lat
+        if lat != lat:  # NaN
+            return None
+        return lat, self.lng
+
+
+class StationTable(object):
+
+    """
+    StationTable Class.
+
+    "Last heard" table of stations, built straight from received Frames.
+
+    Each station has a slot in array-backed columns: `lats`, `lngs` &
+    `heard` (doubles), `symbols` (table & code packed in 16 bits) and `vias`
+    (index of an interned heard-via callsign), plus a list of last
+    Information Fields. Slots of evicted stations are reused. Lookups by
+    callsign return `Station` row views.
+
+    Stations not heard for `ttl` seconds are evicted through a timing wheel
+    of `ttl / resolution` buckets: `update` moves a station between buckets
+    in O(1), and `expire` drops whole buckets once they're older than
+    `ttl`, so eviction is exact to within `resolution`.
+    """
+
+    __slots__ = ['ttl', 'resolution', 'clock', 'lats', 'lngs', 'heard',
+                 'symbols', 'vias', 'ticks', 'updates', 'evictions',
+                 '_slots', '_callsigns', '_infos', '_via_names', '_via_ids',
+                 '_free', '_wheel', '_expired_tick']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, ttl: float=3600.0, resolution: float=None,
+                 clock=time.time) -> None:
+        self.ttl: float = ttl
+        self.resolution: float = resolution or ttl / WHEEL_BUCKETS
+        self.clock = clock
+
+        self.lats: array.array = array.array('d')
+        self.lngs: array.array = array.array('d')
+        self.heard: array.array = array.array('d')
+        self.symbols: array.array = array.array('H')
+        self.vias: array.array = array.array('I')
+        # Wheel tick each slot is filed under:
+        self.ticks: array.array = array.array('q')
+        self.updates: int = 0
+        self.evictions: int = 0
+
+        self._slots: typing.Dict[bytes, int] = {}
+        self._callsigns: typing.List[bytes] = []
+        self._infos: typing.List[bytes] = []
+        self._via_names: typing.List[bytes] = [b'']
+        self._via_ids: typing.Dict[bytes, int] = {b'': 0}
+        self._free: typing.List[int] = []
+
+        # Enough buckets that a live tick never wraps onto an expiring one:
+        self._wheel: typing.List[typing.Set[int]] = [
+            set() for _ in range(int(math.ceil(ttl / self.resolution)) + 2)]
+        self._expired_tick: int = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, callsign) -> bool:
+        return self._key(callsign) in self._slots
+
+    def __getitem__(self, callsign) -> Station:
+        return Station(self, self._slots[self._key(callsign)])
+
+    def __iter__(self) -> typing.Iterator[Station]:
+        for slot in list(self._slots.values()):
+            yield Station(self, slot)
+
+    def __repr__(self) -> str:
+        return '<StationTable stations=%d ttl=%s>' % (len(self), self.ttl)
+
+    @staticmethod
+    def _key(callsign) -> bytes:
+        if isinstance(callsign, str):
+            return bytes(callsign, 'UTF-8')
+        return bytes(callsign)
+
+    def get(self, callsign, default=None) -> typing.Optional[Station]:
+        """
+        Returns the Station for `callsign`, or `default`.
+        """
+        slot = self._slots.get(self._key(callsign))
+        if slot is None:
+            return default
+        return Station(self, slot)
+
+    def _allocate(self, callsign: bytes) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._callsigns[slot] = callsign
+            self.lats[slot] = self.lngs[slot] = _NAN
+            self.symbols[slot] = 0
+        else:
+            slot = len(self._callsigns)
+            self._callsigns.append(callsign)
+            self._infos.append(b'')
+            self.lats.append(_NAN)
+            self.lngs.append(_NAN)
+            self.heard.append(0.0)
+            self.symbols.append(0)
+            self.vias.append(0)
+            self.ticks.append(-1)
+        self._slots[callsign] = slot
+        return slot
+
+    def update(self, frame, timestamp: float=None) -> Station:
+        """
+        Records a received `aprs.Frame` (or `aprs.LazyFrame`): last heard,
+        Information Field, heard-via and, if the Frame has one, position &
+        symbol.
+
+        A Frame older than the station's last heard (a late or replayed
+        one) is counted, but changes nothing.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        callsign = bytes(frame.source)
+        slot = self._slots.get(callsign)
+        if slot is None:
+            slot = self._allocate(callsign)
+        elif timestamp < self.heard[slot]:
+            self._file(slot, timestamp)
+            self.updates += 1
+            return Station(self, slot)
+
+        info = bytes(frame.info)
+        self._infos[slot] = info
+        self.heard[slot] = timestamp
+
+        via = _heard_via(frame.path)
+        via_id = self._via_ids.get(via)
+        if via_id is None:
+            via_id = self._via_ids[via] = len(self._via_names)
+            self._via_names.append(via)
+        self.vias[slot] = via_id
+
+        try:
+            position = aprs.Position.parse(info, bytes(frame.destination))
+        except (aprs.BadPositionError, ValueError, IndexError):
+            position = None
+        if position is not None:
+            self.lats[slot] = position.lat
+            self.lngs[slot] = position.lng
+            self.symbols[slot] = (
+                position.table[0] << 8 | position.symbol[0]
+                if position.table and position.symbol else 0)
+
+        self._file(slot, timestamp)
+        self.updates += 1
+        return Station(self, slot)
+
+    def update_many(self, frames: typing.Iterable,
+                    timestamp: float=None) -> int:
+        """
+        Records many received Frames.
+
+        :returns: Number of Frames recorded.
+        :rtype: int
+        """
+        count = 0
+        for frame in frames:
+            self.update(frame, timestamp)
+            count += 1
+        return count
+
+    def _file(self, slot: int, timestamp: float) -> None:
+        """
+        Files `slot` in the wheel bucket of `timestamp`, unless it's already
+        in a later one, expiring any buckets that have aged out on the way.
+        """
+        if self._expired_tick is None:
+            self._expired_tick = int(
+                (timestamp - self.ttl) // self.resolution) - 1
+        else:
+            self.expire(timestamp)
+        # Late (replayed) timestamps go in the oldest live bucket:
+        tick = max(int(timestamp // self.resolution), self._expired_tick + 1)
+        old_tick = self.ticks[slot]
+        if old_tick < tick:
+            wheel = self._wheel
+            if old_tick >= 0:
+                wheel[old_tick % len(wheel)].discard(slot)
+            wheel[tick % len(wheel)].add(slot)
+            self.ticks[slot] = tick
+
+    def expire(self, now: float=None) -> int:
+        """
+        Evicts stations not heard for `ttl` seconds.
+
+        :returns: Number of stations evicted.
+        :rtype: int
+        """
+        if now is None:
+            now = self.clock()
+        if self._expired_tick is None:
+            return 0
+        # Last tick whose bucket lies entirely before `now - ttl`:
+        last_tick = int((now - self.ttl) // self.resolution) - 1
+        evicted = 0
+        wheel = self._wheel
+        # After a long idle gap, every bucket has aged out:
+        self._expired_tick = max(self._expired_tick, last_tick - len(wheel))
+        while self._expired_tick < last_tick:
+            self._expired_tick += 1
+            bucket = wheel[self._expired_tick % len(wheel)]
+            for slot in bucket:
+                self._evict(slot)
+                evicted += 1
+            bucket.clear()
+        if evicted:
+            self.evictions += evicted
+            self._logger.debug('Evicted %d stations', evicted)
+        return evicted
+
+    def _evict(self, slot: int) -> None:
+        del self._slots[self._callsigns[slot]]
+        self._callsigns[slot] = None
+        self._infos[slot] = b''
+        self.ticks[slot] = -1
+        self._free.append(slot)
+
+    def remove(self, callsign) -> None:
+        """
+        Removes the station `callsign`.
+        """
+        slot = self._slots[self._key(callsign)]
+        self._wheel[self.ticks[slot] % len(self._wheel)].discard(slot)
+        self._evict(slot)
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the StationTable counters.
+        """
+        return {
+            'stations': len(self._slots),
+            'slots': len(self._callsigns),
+            'free': len(self._free),
+            'vias': len(self._via_names),
+            'updates': self.updates,
+            'evictions': self.evictions
+        }
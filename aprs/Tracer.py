@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import collections
+import logging
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+
+AprsEnvelope = typing.TypeVar('AprsEnvelope', bound='aprs.Envelope')
+
+# Receive stages stamped after the socket read, in order.
+STAGES = ('framed', 'parsed', 'filtered', 'delivered')
+
+
+class Envelope(object):
+
+    """
+    Envelope Class.
+
+    A received Frame with the `time.monotonic_ns()` stamps of each receive
+    stage: `received` (socket read), `framed` (split into a line, after
+    dupe filtering), `parsed`, `filtered` and `delivered` (callback
+    returned).
+    """
+
+    __slots__ = ['frame', 'received', 'framed', 'parsed', 'filtered',
+                 'delivered']
+
+    def __init__(self, frame=None, received: int=0, framed: int=0) -> None:
+        self.frame = frame
+        self.received: int = received
+        self.framed: int = framed
+        self.parsed: int = 0
+        self.filtered: int = 0
+        self.delivered: int = 0
+
+    def __repr__(self) -> str:
+        return '<Envelope %s latency=%dns>' % (self.frame, self.latency)
+
+    @property
+    def latency(self) -> int:
+        """
+        Nanoseconds from socket read to delivery.
+        """
+        return self.delivered - self.received
+
+    def stages(self) -> typing.Dict[str, int]:
+        """
+        Returns the nanoseconds spent reaching each stage from the previous.
+        """
+        stages = {}
+        last = self.received
+        for stage in STAGES:
+            stamp = getattr(self, stage)
+            stages[stage] = stamp - last
+            last = stamp
+        return stages
+
+
+class Tracer(object):
+
+    """
+    Tracer Class.
+
+    Records the stage latencies of traced Envelopes into the
+    `aprs_trace_stage_seconds` and `aprs_trace_latency_seconds` histograms
+    of `metrics`, and samples slow Frames: the last `sample_size` Envelopes
+    slower than `slow_ms` are kept in `slow`, and logged at most once per
+    `sample_interval` seconds.
+
+    With `envelopes`, `aprs.TCP.receive` delivers Envelopes instead of
+    Frames to its callback.
+    """
+
+    __slots__ = ['metrics', 'envelopes', 'slow_ns', 'sample_interval', 'slow',
+                 'traced', 'slow_count', '_stage_seconds', '_latency_seconds',
+                 '_last_logged']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, metrics: 'aprs.Metrics'=None, envelopes: bool=False,
+                 slow_ms: float=100.0, sample_size: int=100,
+                 sample_interval: float=1.0) -> None:
+        self.metrics = aprs.METRICS if metrics is None else metrics
+        self.envelopes: bool = envelopes
+        self.slow_ns: int = int(slow_ms * 1000000)
+        self.sample_interval: float = sample_interval
+        self.slow: typing.Deque[Envelope] = collections.deque(
+            maxlen=sample_size)
+        self.traced: int = 0
+        self.slow_count: int = 0
+        self._stage_seconds = [
+            self.metrics.histogram(
+                'aprs_trace_stage_seconds',
+                'Time to reach each receive stage from the previous.',
+                {'stage': stage}).observe
+            for stage in STAGES]
+        self._latency_seconds = self.metrics.histogram(
+            'aprs_trace_latency_seconds',
+            'Time from socket read to callback return.').observe
+        self._last_logged: float = 0
+
+    def __repr__(self) -> str:
+        return '<Tracer traced=%d slow=%d>' % (self.traced, self.slow_count)
+
+    def trace(self, envelope: Envelope) -> None:
+        """
+        Records a delivered Envelope.
+        """
+        self.traced += 1
+        last = envelope.received
+        for observe, stamp in zip(self._stage_seconds, (
+                envelope.framed, envelope.parsed, envelope.filtered,
+                envelope.delivered)):
+            observe((stamp - last) / 1e9)
+            last = stamp
+        latency = last - envelope.received
+        self._latency_seconds(latency / 1e9)
+
+        if latency >= self.slow_ns:
+            self.slow_count += 1
+            self.slow.append(envelope)
+            now = time.monotonic()
+            if now - self._last_logged >= self.sample_interval:
+                self._last_logged = now
+                self._logger.warning(
+                    'Slow frame, %.3fms: %s %s', latency / 1e6,
+                    envelope.stages(), envelope.frame)
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the Tracer counters.
+        """
+        return {
+            'traced': self.traced,
+            'slow': self.slow_count,
+            'sampled': len(self.slow)
+        }
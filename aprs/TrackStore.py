@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import array
+import logging
+import math
+import time
+import typing
+
+import aprs  # pylint: disable=R0801
+import aprs.geo_util
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+AprsTrackStore = typing.TypeVar('AprsTrackStore', bound='aprs.TrackStore')
+
+KM_PER_DEGREE = math.radians(aprs.geo_util.EARTH_RADIUS)
+
+# Columns of a trail, in slab order:
+TRACK_COLUMNS = ('time', 'lat', 'lng', 'speed', 'course')
+
+_NAN = float('nan')
+
+
+class TrackStore(object):
+
+    """
+    TrackStore Class.
+
+    Recent positions of each station, for trail rendering.
+
+    Each station's track is a ring buffer of its last `capacity` points in
+    preallocated NumPy slabs of `slab_size` stations: float64
+    `[station, column, 2 * capacity]`, one column per `TRACK_COLUMNS`.
+    Station slots are handed out from the slabs, reused once freed, and a
+    new slab is added when they run out, so no track is ever moved.
+
+    Every point is written twice, at `i` and `i + capacity`, so the last
+    `capacity` points are always one contiguous run and `trail` returns
+    zero-copy array slices, oldest first.
+    """
+
+    __slots__ = ['capacity', 'slab_size', 'clock', 'appends', '_slabs',
+                 '_slots', '_callsigns', '_written', '_free']
+
+    _logger = logging.getLogger(__name__)  # pylint: disable=R0801
+    if not _logger.handlers:  # pylint: disable=R0801
+        _logger.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler = logging.StreamHandler()  # pylint: disable=R0801
+        _console_handler.setLevel(aprs.LOG_LEVEL)  # pylint: disable=R0801
+        _console_handler.setFormatter(aprs.LOG_FORMAT)  # pylint: disable=R0801
+        _logger.addHandler(_console_handler)  # pylint: disable=R0801
+        _logger.propagate = False  # pylint: disable=R0801
+
+    def __init__(self, capacity: int=128, slab_size: int=256,
+                 clock=time.time) -> None:
+        if numpy is None:
+            raise ValueError('numpy is not available.')
+        self.capacity: int = capacity
+        self.slab_size: int = slab_size
+        self.clock = clock
+        self.appends: int = 0
+        self._slabs: typing.List[typing.Any] = []
+        self._slots: typing.Dict[bytes, int] = {}
+        self._callsigns: typing.List[bytes] = []
+        # Points ever appended to each slot's track:
+        self._written: array.array = array.array('q')
+        self._free: typing.List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, callsign) -> bool:
+        return self._key(callsign) in self._slots
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        return iter(list(self._slots))
+
+    def __repr__(self) -> str:
+        return '<TrackStore stations=%d capacity=%d>' % (
+            len(self), self.capacity)
+
+    @staticmethod
+    def _key(callsign) -> bytes:
+        if isinstance(callsign, str):
+            return bytes(callsign, 'UTF-8')
+        return bytes(callsign)
+
+    def _allocate(self, callsign: bytes) -> int:
+        if not self._free:
+            base = len(self._callsigns)
+            self._slabs.append(numpy.empty(
+                (self.slab_size, len(TRACK_COLUMNS), 2 * self.capacity),
+                dtype=numpy.float64))
+            self._callsigns.extend([None] * self.slab_size)
+            self._written.extend([0] * self.slab_size)
+            # Hand out the new slab's slots in order:
+            self._free.extend(range(base + self.slab_size - 1, base - 1, -1))
+            self._logger.debug('Added slab %d', len(self._slabs))
+        slot = self._free.pop()
+        self._callsigns[slot] = callsign
+        self._written[slot] = 0
+        self._slots[callsign] = slot
+        return slot
+
+    def append(self, callsign, lat: float, lng: float,
+               timestamp: float=None, speed: float=None,
+               course: float=None) -> None:
+        """
+        Appends a point to the track of `callsign`, overwriting its oldest
+        point once the track holds `capacity` points. Timestamps are
+        expected in order.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        callsign = self._key(callsign)
+        slot = self._slots.get(callsign)
+        if slot is None:
+            slot = self._allocate(callsign)
+        written = self._written[slot]
+        slab, row = divmod(slot, self.slab_size)
+        point = (timestamp, lat, lng,
+                 _NAN if speed is None else speed,
+                 _NAN if course is None else course)
+        track = self._slabs[slab][row]
+        index = written % self.capacity
+        track[:, index] = point
+        track[:, index + self.capacity] = point
+        self._written[slot] = written + 1
+        self.appends += 1
+
+    def append_frame(self, frame: 'aprs.Frame',
+                     timestamp: float=None) -> bool:
+        """
+        Appends the position of an `aprs.Frame` to its source's track.
+
+        :returns: False if the Frame has no position.
+        """
+        try:
+            position = aprs.Position.from_frame(frame)
+        except (aprs.BadPositionError, ValueError, IndexError):
+            return False
+        if position is None:
+            return False
+        self.append(frame.source, position.lat, position.lng, timestamp,
+                    position.speed, position.course)
+        return True
+
+    def append_frames(self, frames: typing.Iterable['aprs.Frame'],
+                      timestamp: float=None) -> int:
+        """
+        Appends the positions of many `aprs.Frame`s, or of an
+        `aprs.FrameBatch`.
+
+        :returns: Number of positions appended.
+        :rtype: int
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        if not isinstance(frames, aprs.FrameBatch):
+            return sum(self.append_frame(frame, timestamp) for frame in frames)
+
+        columns = aprs.Position.decode_batch(frames)
+        valid = numpy.flatnonzero(columns['valid']).tolist()
+        lats = columns['lat'][valid].tolist()
+        lngs = columns['lng'][valid].tolist()
+        speeds = columns['speed'][valid].tolist()
+        courses = columns['course'][valid].tolist()
+        for idx, lat, lng, speed, course in zip(valid, lats, lngs, speeds,
+                                                courses):
+            self.append(frames.source(idx), lat, lng, timestamp, speed,
+                        course)
+        return len(valid)
+
+    def trail(self, callsign, since: float=None) -> \
+            typing.Dict[str, typing.Any]:
+        """
+        Returns the track of `callsign`, oldest first, as read-only
+        zero-copy slices keyed by `TRACK_COLUMNS`. Only points at or after
+        `since`, if given.
+
+        The slices view the ring buffer itself: the station's next append
+        overwrites their oldest point, so copy a trail that has to outlive
+        it.
+        """
+        slot = self._slots[self._key(callsign)]
+        written = self._written[slot]
+        slab, row = divmod(slot, self.slab_size)
+        track = self._slabs[slab][row]
+        if written <= self.capacity:
+            start, stop = 0, written
+        else:
+            start = written % self.capacity
+            stop = start + self.capacity
+        if since is not None:
+            start += int(numpy.searchsorted(track[0, start:stop], since))
+        trail = {}
+        for column, name in enumerate(TRACK_COLUMNS):
+            view = track[column, start:stop]
+            view.flags.writeable = False
+            trail[name] = view
+        return trail
+
+    @staticmethod
+    def douglas_peucker(lats, lngs, tolerance: float):
+        """
+        Douglas-Peucker line simplification of a track: drops points within
+        `tolerance` km of the line through their neighbours that are kept.
+
+        Distances are taken in an equirectangular projection around the
+        track's mean latitude, plenty for trails of a few hundred km.
+
+        :returns: NumPy array of the indices of the points kept.
+        """
+        lats = numpy.asarray(lats, dtype=numpy.float64)
+        lngs = numpy.asarray(lngs, dtype=numpy.float64)
+        count = len(lats)
+        if count < 3:
+            return numpy.arange(count)
+        ys = lats * KM_PER_DEGREE
+        xs = lngs * (KM_PER_DEGREE * math.cos(math.radians(lats.mean())))
+
+        keep = numpy.zeros(count, dtype=bool)
+        keep[0] = keep[-1] = True
+        stack = [(0, count - 1)]
+        while stack:
+            first, last = stack.pop()
+            if last - first < 2:
+                continue
+            x_0 = xs[first]
+            y_0 = ys[first]
+            d_x = xs[last] - x_0
+            d_y = ys[last] - y_0
+            p_x = xs[first + 1:last] - x_0
+            p_y = ys[first + 1:last] - y_0
+            norm = math.hypot(d_x, d_y)
+            if norm:
+                distances = numpy.abs(p_x * d_y - p_y * d_x) / norm
+            else:
+                distances = numpy.hypot(p_x, p_y)
+            farthest = int(numpy.argmax(distances))
+            if distances[farthest] > tolerance:
+                middle = first + 1 + farthest
+                keep[middle] = True
+                stack.append((first, middle))
+                stack.append((middle, last))
+        return numpy.flatnonzero(keep)
+
+    @staticmethod
+    def time_buckets(times, interval: float):
+        """
+        Time-bucket downsampling of a track: keeps the last point of each
+        `interval` seconds.
+
+        :returns: NumPy array of the indices of the points kept.
+        """
+        buckets = numpy.floor_divide(
+            numpy.asarray(times, dtype=numpy.float64), interval)
+        if not len(buckets):
+            return numpy.arange(0)
+        return numpy.flatnonzero(
+            numpy.append(buckets[1:] != buckets[:-1], True))
+
+    def simplify(self, callsign, tolerance: float=None,
+                 interval: float=None, since: float=None) -> \
+            typing.Dict[str, typing.Any]:
+        """
+        Returns a downsampled copy of the trail of `callsign`: first one
+        point per `interval` seconds, then simplified to within `tolerance`
+        km, see `time_buckets` and `douglas_peucker`.
+        """
+        trail = self.trail(callsign, since)
+        index = numpy.arange(len(trail['time']))
+        if interval is not None:
+            index = index[self.time_buckets(trail['time'], interval)]
+        if tolerance is not None:
+            index = index[self.douglas_peucker(
+                trail['lat'][index], trail['lng'][index], tolerance)]
+        return {name: column[index] for name, column in trail.items()}
+
+    def remove(self, callsign) -> None:
+        """
+        Removes the track of `callsign`, freeing its slot.
+        """
+        slot = self._slots.pop(self._key(callsign))
+        self._callsigns[slot] = None
+        self._free.append(slot)
+
+    def info(self) -> typing.Dict[str, int]:
+        """
+        Returns the TrackStore counters.
+        """
+        capacity = self.capacity
+        written = self._written
+        return {
+            'stations': len(self._slots),
+            'slots': len(self._callsigns),
+            'free': len(self._free),
+            'slabs': len(self._slabs),
+            'points': sum(min(written[slot], capacity)
+                          for slot in self._slots.values()),
+            'appends': self.appends,
+            'bytes': sum(slab.nbytes for slab in self._slabs)
+        }
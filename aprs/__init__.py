@@ -22,21 +22,69 @@ from .constants import (LOG_FORMAT, LOG_LEVEL, APRSIS_SW_VERSION,  # NOQA
                         AX25_CONTROL_FIELD, AX25_PROTOCOL_ID, ADDR_INFO_DELIM,
                         DATA_TYPE_MAP, KISS_DATA_FRAME)
 
-from .exceptions import BadCallsignError  # NOQA
+from .exceptions import (BadCallsignError, BadPositionError,  # NOQA
+                         BadFilterError, BadCaptureError)
 
-from .util import valid_callsign  # NOQA
+from .util import valid_callsign, passcode  # NOQA
 
-from .geo_util import dec2dm_lat, dec2dm_lng, ambiguate  # NOQA
+from .geo_util import (dec2dm_lat, dec2dm_lng, dec2dm_lat_many,  # NOQA
+                       dec2dm_lng_many, ambiguate, distance, bearing,
+                       destination_point, latlng_to_maidenhead,
+                       maidenhead_to_latlng, distance_many, bearing_many,
+                       destination_point_many, latlng_to_maidenhead_many,
+                       maidenhead_to_latlng_many)
 
 from .fcs import FCS  # NOQA
 
 from .Frame import Frame, PositionFrame
 
-from .Callsign import Callsign
+from .Callsign import Callsign, FrozenCallsign
+
+from .CallsignCache import CallsignCache
 
 from .InformationField import InformationField
 
-from .classes import (APRS, TCP, UDP, HTTP) # NOQA
+from .LazyFrame import LazyFrame
+
+from .FrameBatch import FrameBatch
+
+from .Position import Position
+
+from .DupeFilter import DupeFilter
+
+from .Filter import Filter
+
+from .StationTable import StationTable, Station
+
+from .SpatialIndex import SpatialIndex
+
+from .Geofence import Geofence, Fence, Transition
+
+from .TrackStore import TrackStore
+
+from .LineFramer import LineFramer
+
+from .Metrics import Metrics, Counter, Gauge, Histogram
+
+from .Tracer import Envelope, Tracer
+
+from .KISSInstrumentation import KISSInstrumentation
+
+from .ReceivePipeline import ReceivePipeline
+
+from .ShardedIngest import ShardedIngest
+
+from .Capture import CaptureWriter, CaptureReader
+
+from .Archive import ArchiveWriter, ArchiveReader
+
+from .Emulator import Emulator
+
+from .classes import (APRS, TCP, AsyncTCP, UDP, HTTP) # NOQA
+
+from .Hub import Hub, Subscription
+
+METRICS = Metrics()
 
 
 __author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
@@ -3,6 +3,7 @@
 
 """Python APRS Module Class Definitions."""
 
+import asyncio
 import itertools
 import logging
 import socket
@@ -31,7 +32,11 @@ class APRS(object):
         _logger.addHandler(_console_handler)  # pylint: disable=R0801
         _logger.propagate = False  # pylint: disable=R0801
 
-    def __init__(self, user: bytes, password: bytes=b'-1') -> None:
+    # `transport` label of this class's metrics.
+    _transport = 'aprs'
+
+    def __init__(self, user: bytes, password: bytes=b'-1',
+                 metrics: 'aprs.Metrics'=None) -> None:
         if isinstance(user, str):
             user = bytes(user, 'UTF-8')
         if isinstance(password, str):
@@ -52,6 +57,16 @@ class APRS(object):
         self.interface = None
         self.use_i_construct = False
 
+        self.metrics = aprs.METRICS if metrics is None else metrics
+        labels = {'transport': self._transport}
+        self._sent = self.metrics.counter(
+            'aprs_frames_sent_total', 'Frames sent to APRS-IS.', labels)
+        self._sent_bytes = self.metrics.counter(
+            'aprs_bytes_sent_total', 'Bytes sent to APRS-IS.', labels)
+        self._send_errors = self.metrics.counter(
+            'aprs_send_errors_total', 'Frames APRS-IS did not accept.',
+            labels)
+
     def start(self):
         """
         Abstract method for starting connection to APRS-IS.
@@ -75,9 +90,11 @@ class TCP(APRS):
 
     """APRS-IS TCP Class."""
 
+    _transport = 'tcp'
+
     def __init__(self, user: bytes, password: bytes, servers: bytes=b'',
-                 aprs_filter: bytes=b'') -> None:
-        super(TCP, self).__init__(user, password)
+                 aprs_filter: bytes=b'', metrics: 'aprs.Metrics'=None) -> None:
+        super(TCP, self).__init__(user, password, metrics)
         servers = servers or aprs.APRSIS_SERVERS  # Unicode
         aprs_filter = aprs_filter or b'/'.join([b'p', user])  # Unicode
         if isinstance(aprs_filter, str):
@@ -89,6 +106,37 @@ class TCP(APRS):
         self.servers = itertools.cycle(servers)
         self.use_i_construct = True
         self._connected = False
+        self._framer = None
+        # time.monotonic_ns() of the last socket read:
+        self.read_ns = 0
+
+        labels = {'transport': self._transport}
+        metrics = self.metrics
+        self._received = metrics.counter(
+            'aprs_lines_received_total',
+            'Frames received from APRS-IS, before parsing.', labels)
+        self._received_bytes = metrics.counter(
+            'aprs_bytes_received_total', 'Bytes received from APRS-IS.',
+            labels)
+        self._comments = metrics.counter(
+            'aprs_comments_received_total',
+            "Server comment ('#') lines received from APRS-IS.", labels)
+        self._duplicates = metrics.counter(
+            'aprs_duplicates_total', 'Duplicate Frames dropped.', labels)
+        self._parse_errors = metrics.counter(
+            'aprs_parse_errors_total', 'Frames that failed to parse.',
+            labels)
+        self._connects = metrics.counter(
+            'aprs_connects_total',
+            'Logins to APRS-IS, more than one means reconnects.', labels)
+        self._connect_errors = metrics.counter(
+            'aprs_connect_errors_total', 'Failed APRS-IS connections.',
+            labels)
+        self._parse_seconds = metrics.histogram(
+            'aprs_parse_seconds', 'Time spent parsing each Frame.', labels)
+        self._callback_seconds = metrics.histogram(
+            'aprs_callback_seconds', 'Time spent in the receive callback.',
+            labels)
 
     def start(self):
         """
@@ -114,7 +162,8 @@ class TCP(APRS):
 
                 self.interface.connect(addr_info[0][4])
 
-                server_hello = self.interface.recv(1024)
+                self._framer = aprs.LineFramer()
+                server_hello = self._read_line()
 
                 self._logger.info(
                     'Connect Result "%s"', server_hello.rstrip())
@@ -127,18 +176,38 @@ class TCP(APRS):
 
                 self.interface.sendall(_full_auth)
 
-                server_return = self.interface.recv(1024)
+                server_return = self._read_line()
                 self._logger.info(
                     'Auth Result "%s"', server_return.rstrip())
 
                 self._connected = True
+                self._connects.inc()
             except socket.error as ex:
+                self._connect_errors.inc()
                 self._logger.exception(ex)
                 self._logger.warn(
                     "Error when connecting to %s:%d: '%s'",
                     server, port, str(ex))
                 time.sleep(1)
 
+    def _read_line(self) -> bytes:
+        """
+        Reads one line of the login handshake. Frames that arrive in the same
+        read (e.g. right after logresp) stay buffered for `receive`.
+        """
+        framer = self._framer
+        while 1:
+            lines = framer.lines()
+            line = next(lines, None)
+            if line is not None:
+                line = bytes(line)
+            lines.close()
+            if line is not None:
+                return line
+            if not framer.recv_into(self.interface):
+                return b''
+            self.read_ns = time.monotonic_ns()
+
     def send(self, frame):
         """
         Sends frame to APRS-IS.
@@ -149,75 +218,321 @@ class TCP(APRS):
         self._logger.info('Sending frame="%s"', frame)
 
         # Unicode Sandwich: Send bytes.
-        _frame = bytes(frame + b'\n\r')
+        if isinstance(frame, str):
+            frame = bytes(frame, 'UTF-8')
+        _frame = bytes(frame) + b'\n\r'
 
-        return self.interface.send(_frame)
+        sent = self.interface.send(_frame)
+        self._sent.inc()
+        self._sent_bytes.inc(sent)
+        return sent
 
-    def receive(self, callback=None, frame_handler=aprs.Frame.parse):
+    def lines(self, dupe_filter=None):
         """
-        Receives from APRS-IS.
+        Yields raw plain-text Frames received from APRS-IS, skipping server
+        comments ('#' lines).
 
-        :param callback: Optional callback to deliver frame to.
-        :type callback: func
-
-        :returns: Nothing, but calls a callback with an Frame object.
-        :rtype: None
+        :param dupe_filter: Optional `aprs.DupeFilter`, duplicate packets
+                            are skipped.
+        :type dupe_filter: aprs.DupeFilter
         """
-        self._logger.info(
-            'Receive started with callback="%s" and frame_handler="%s"',
-            callback, frame_handler)
-
         # Unicode Sandwich: Receive Bytes.
-        recvd_data = bytes()
+        if self._framer is None:
+            self._framer = aprs.LineFramer()
+        framer = self._framer
 
         try:
             while 1:
-                recv_data = self.interface.recv(aprs.RECV_BUFFER)
-
-                if not recv_data:
-                    break
-
-                recvd_data += recv_data
+                for _line in framer.lines():
+                    # memoryview lines are only valid until the next read:
+                    line = bytes(_line)
+                    self._received.inc()
 
-                self._logger.debug('recv_data="%s"', recv_data.strip())
-
-                if recvd_data.endswith(b'\r\n'):
-                    lines = recvd_data.strip().split(b'\r\n')
-                    recvd_data = bytes()
-                else:
-                    lines = recvd_data.split(b'\r\n')
-                    recvd_data = lines.pop(-1)
-
-                for line in lines:
                     if line.startswith(b'#'):
+                        self._comments.inc()
                         if b'logresp' in line:
                             self._logger.debug('logresp="%s"', line)
                         # We log all received data anyway, so no need to log
                         # it here again:
                         # else:
                         #    self._logger.debug('unknown response="%s"', line)
+                    elif (dupe_filter is not None and
+                          dupe_filter.is_duplicate(line)):
+                        self._duplicates.inc()
+                        self._logger.debug('duplicate="%s"', line)
                     else:
                         self._logger.debug('line="%s"', line)
-                        if callback:
-                            if frame_handler:
-                                callback(frame_handler(line))
-                            else:
-                                callback(line)
-                        else:
-                            self._logger.info('No callback set?')
+                        yield line
+
+                recvd = framer.recv_into(self.interface)
+                if not recvd:
+                    break
+                self.read_ns = time.monotonic_ns()
+                self._received_bytes.inc(recvd)
 
         except socket.error as sock_err:
             self._logger.exception(sock_err)
             raise
 
+    def receive(self, callback=None, frame_handler=aprs.Frame.parse,
+                dupe_filter=None, workers: int=0, queue_size: int=1024,
+                frame_filter=None, tracer=None):
+        """
+        Receives from APRS-IS.
+
+        :param callback: Optional callback to deliver frame to.
+        :param dupe_filter: Optional `aprs.DupeFilter`, duplicate packets
+                            are dropped before they're parsed.
+        :param workers: If set, receive through an `aprs.ReceivePipeline`
+                        with this many parse worker threads, so socket
+                        reads never wait on parsing or on `callback`.
+        :param queue_size: Bound of each `aprs.ReceivePipeline` queue.
+        :param frame_filter: Optional predicate (or `aprs.Filter` string),
+                             parsed Frames it rejects are not delivered.
+        :param tracer: Optional `aprs.Tracer`, each delivered Frame's stage
+                       timings are recorded by it.
+        :type callback: func
+        :type dupe_filter: aprs.DupeFilter
+        :type workers: int
+        :type queue_size: int
+        :type tracer: aprs.Tracer
+
+        :returns: Nothing, but calls a callback with an Frame object.
+        :rtype: None
+        """
+        self._logger.info(
+            'Receive started with callback="%s" and frame_handler="%s"',
+            callback, frame_handler)
+
+        if isinstance(frame_filter, (bytes, str)):
+            frame_filter = aprs.Filter(frame_filter)
+
+        if workers:
+            aprs.ReceivePipeline(
+                self, callback, frame_handler, dupe_filter, workers,
+                queue_size, frame_filter, tracer).run()
+            return
+
+        if tracer is not None:
+            self._receive_traced(callback, frame_handler, dupe_filter,
+                                 frame_filter, tracer)
+            return
+
+        clock = time.perf_counter
+        parse_seconds = self._parse_seconds.observe
+        callback_seconds = self._callback_seconds.observe
+        for line in self.lines(dupe_filter):
+            if callback:
+                start = clock()
+                if frame_handler:
+                    try:
+                        line = frame_handler(line)
+                    except Exception:
+                        self._parse_errors.inc()
+                        raise
+                    parsed = clock()
+                    parse_seconds(parsed - start)
+                    start = parsed
+                if frame_filter is not None and not frame_filter(line):
+                    continue
+                callback(line)
+                callback_seconds(clock() - start)
+            else:
+                self._logger.info('No callback set?')
+
+    def _receive_traced(self, callback, frame_handler, dupe_filter,
+                        frame_filter, tracer) -> None:
+        """
+        `receive`, stamping each Frame's stages into an `aprs.Envelope`.
+        """
+        clock = time.monotonic_ns
+        parse_seconds = self._parse_seconds.observe
+        callback_seconds = self._callback_seconds.observe
+        for line in self.lines(dupe_filter):
+            envelope = aprs.Envelope(line, self.read_ns, clock())
+            if frame_handler:
+                try:
+                    envelope.frame = frame_handler(line)
+                except Exception:
+                    self._parse_errors.inc()
+                    raise
+            envelope.parsed = clock()
+            parse_seconds((envelope.parsed - envelope.framed) / 1e9)
+            if frame_filter is not None and not frame_filter(envelope.frame):
+                continue
+            envelope.filtered = clock()
+            if callback:
+                callback(envelope if tracer.envelopes else envelope.frame)
+            else:
+                self._logger.info('No callback set?')
+            envelope.delivered = clock()
+            callback_seconds((envelope.delivered - envelope.filtered) / 1e9)
+            tracer.trace(envelope)
+
+
+class AsyncTCP(TCP):
+
+    """APRS-IS TCP Class driven by asyncio streams."""
+
+    def __init__(self, user: bytes, password: bytes, servers: bytes=b'',
+                 aprs_filter: bytes=b'', frame_handler=aprs.Frame.parse,
+                 dupe_filter=None, metrics: 'aprs.Metrics'=None) -> None:
+        super(AsyncTCP, self).__init__(user, password, servers, aprs_filter,
+                                       metrics)
+        self.frame_handler = frame_handler
+        self.dupe_filter = dupe_filter
+        self._reader = None
+
+    async def start(self):
+        """
+        Connects & logs in to APRS-IS.
+        """
+        while not self._connected:
+            servers = next(self.servers)
+            if b':' in servers:
+                server, port = servers.split(b':')
+                port = int(port)
+            else:
+                server = servers
+                port = aprs.APRSIS_FILTER_PORT
+
+            try:
+                # Connect
+                self._logger.info("Connect To %s:%i", server, port)
+
+                self._reader, self.interface = await asyncio.open_connection(
+                    server.decode(), port)
+
+                server_hello = await self._reader.readline()
+
+                self._logger.info(
+                    'Connect Result "%s"', server_hello.rstrip())
+
+                # Auth
+                self._logger.info("Auth To %s:%i", server, port)
+
+                self.interface.write(self._full_auth + b'\n\r')
+                await self.interface.drain()
+
+                server_return = await self._reader.readline()
+                self._logger.info(
+                    'Auth Result "%s"', server_return.rstrip())
+
+                self._connected = True
+                self._connects.inc()
+            except OSError as ex:
+                self._connect_errors.inc()
+                self._logger.exception(ex)
+                self._logger.warn(
+                    "Error when connecting to %s:%d: '%s'",
+                    server, port, str(ex))
+                await asyncio.sleep(1)
+
+    async def send(self, frame):
+        """
+        Sends frame to APRS-IS.
+
+        :param frame: Frame to send to APRS-IS.
+        :type frame: bytes
+        """
+        self._logger.info('Sending frame="%s"', frame)
+
+        # Unicode Sandwich: Send bytes.
+        if isinstance(frame, str):
+            frame = bytes(frame, 'UTF-8')
+        _frame = bytes(frame) + b'\n\r'
+        self.interface.write(_frame)
+        await self.interface.drain()
+        self._sent.inc()
+        self._sent_bytes.inc(len(_frame))
+
+    async def close(self):
+        """
+        Closes the connection to APRS-IS.
+        """
+        if self.interface is not None:
+            self.interface.close()
+            await self.interface.wait_closed()
+        self._connected = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while 1:
+            line = await self._reader.readline()
+
+            if not line:
+                raise StopAsyncIteration
+
+            self._received_bytes.inc(len(line))
+            line = line.rstrip(b'\r\n')
+
+            if not line:
+                continue
+            self._received.inc()
+            if line.startswith(b'#'):
+                self._comments.inc()
+                if b'logresp' in line:
+                    self._logger.debug('logresp="%s"', line)
+            elif (self.dupe_filter is not None and
+                  self.dupe_filter.is_duplicate(line)):
+                self._duplicates.inc()
+                self._logger.debug('duplicate="%s"', line)
+            else:
+                self._logger.debug('line="%s"', line)
+                if self.frame_handler:
+                    start = time.perf_counter()
+                    try:
+                        line = self.frame_handler(line)
+                    except Exception:
+                        self._parse_errors.inc()
+                        raise
+                    self._parse_seconds.observe(time.perf_counter() - start)
+                return line
+
+    async def receive(self, callback=None, frame_handler=aprs.Frame.parse,
+                      dupe_filter=None):
+        """
+        Receives from APRS-IS.
+
+        :param callback: Optional callback to deliver frame to.
+        :param dupe_filter: Optional `aprs.DupeFilter`, duplicate packets
+                            are dropped before they're parsed.
+        :type callback: func
+        :type dupe_filter: aprs.DupeFilter
+
+        :returns: Nothing, but calls a callback with an Frame object.
+        :rtype: None
+        """
+        self._logger.info(
+            'Receive started with callback="%s" and frame_handler="%s"',
+            callback, frame_handler)
+
+        self.frame_handler = frame_handler
+        if dupe_filter is not None:
+            self.dupe_filter = dupe_filter
+        async for frame in self:
+            if callback:
+                start = time.perf_counter()
+                callback(frame)
+                self._callback_seconds.observe(time.perf_counter() - start)
+            else:
+                self._logger.info('No callback set?')
+
 
 class UDP(APRS):
 
     """APRS-IS UDP Class."""
 
-    def __init__(self, user, password='-1', server=None, port=None):
-        super(UDP, self).__init__(user, password)
+    _transport = 'udp'
+
+    def __init__(self, user, password='-1', server=None, port=None,
+                 metrics=None):
+        super(UDP, self).__init__(user, password, metrics)
         server = server or aprs.APRSIS_SERVERS[0]
+        if isinstance(server, bytes):
+            server = server.decode('UTF-8')
         port = port or aprs.APRSIS_RX_PORT
         self._addr = (server, int(port))
         self.use_i_construct = True
@@ -236,17 +551,24 @@ class UDP(APRS):
         :type frame: str
         """
         self._logger.info('Sending frame="%s"', frame)
-        content = b"\n".join([self._auth, str(frame)])
-        return self.interface.sendto(content, self._addr)
+        if isinstance(frame, str):
+            frame = bytes(frame, 'UTF-8')
+        content = b"\n".join([self._auth, bytes(frame)])
+        sent = self.interface.sendto(content, self._addr)
+        self._sent.inc()
+        self._sent_bytes.inc(sent)
+        return sent
 
 
 class HTTP(APRS):
 
     """APRS-IS HTTP Class."""
 
+    _transport = 'http'
+
     def __init__(self, user: bytes, password: bytes=b'-1', url: bytes=b'',
-                 headers=None) -> None:
-        super(HTTP, self).__init__(user, password)
+                 headers=None, metrics: 'aprs.Metrics'=None) -> None:
+        super(HTTP, self).__init__(user, password, metrics)
         self.url = url or aprs.APRSIS_URL
         self.headers = headers or aprs.APRSIS_HTTP_HEADERS
         self.use_i_construct = True
@@ -271,4 +593,9 @@ class HTTP(APRS):
         self._logger.info('Sending frame="%s"', frame)
         content = b"\n".join([self._auth, frame])
         result = self.interface(self.url, data=content, headers=self.headers)
-        return result.status_code == 204
+        self._sent.inc()
+        self._sent_bytes.inc(len(content))
+        if result.status_code != 204:
+            self._send_errors.inc()
+            return False
+        return True
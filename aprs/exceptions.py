@@ -11,3 +11,18 @@ __license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
 class BadCallsignError(Exception):
     """Bad Callsign Error."""
     pass
+
+
+class BadPositionError(Exception):
+    """Bad Position Error."""
+    pass
+
+
+class BadFilterError(Exception):
+    """Bad Filter Error."""
+    pass
+
+
+class BadCaptureError(Exception):
+    """Bad Capture Error."""
+    pass
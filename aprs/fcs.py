@@ -32,6 +32,7 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+import binascii
 import struct
 
 import bitarray
@@ -41,6 +42,31 @@ __copyright__ = 'Copyright (c) 2013 Christopher H. Casebeer. All rights reserved
 __license__ = 'BSD 2-clause Simplified License'  # NOQA pylint: disable=R0801
 
 
+def _make_table() -> tuple:
+    """
+    Builds the 256-entry byte-wise table for the reflected CRC-16/X.25
+    polynomial (0x8408).
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ 0x8408
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC_TABLE = _make_table()
+
+# Bit-reversal of every byte value, used to run the reflected CRC through
+# binascii's (non-reflected) CRC-CCITT in bulk.
+_REVERSE_BITS = bytes(
+    int('{:08b}'.format(byte)[::-1], 2) for byte in range(256))
+
+
 class FCS(object):
 
     def __init__(self) -> None:
@@ -52,10 +78,16 @@ class FCS(object):
         if check != bit:
             self.fcs ^= 0x8408
 
-    def update(self, bytes) -> None:
-        for byte in (ord(b) for b in bytes):
-            for i in range(7,-1,-1):
-                self.update_bit((byte >> i) & 0x01 == 1)
+    def update(self, data: bytes) -> None:
+        """
+        Updates the FCS with `data` (bytes, bytearray or memoryview), a byte
+        at a time.
+        """
+        table = CRC_TABLE
+        fcs = self.fcs
+        for byte in data:
+            fcs = (fcs >> 8) ^ table[(fcs ^ byte) & 0xFF]
+        self.fcs = fcs
 
     def digest(self):
 #        print ~self.fcs
@@ -64,6 +96,54 @@ class FCS(object):
         # digest is two bytes, little endian
         return struct.pack("<H", ~self.fcs % 2**16)
 
+    @classmethod
+    def validate(cls, frame: bytes) -> bool:
+        """
+        Checks the trailing FCS of an AX.25 Frame, with or without the
+        surrounding AX.25 Flags.
+        """
+        return validate_many([frame])[0]
+
+
+def crc16(data: bytes) -> int:
+    """
+    Returns the CRC-16/X.25 (AX.25 FCS) of `data` in a single call.
+
+    >>> hex(crc16(b'123456789'))
+    '0x906e'
+    """
+    # X.25 is CRC-CCITT with reflected input & output, so reflect each byte,
+    # run the non-reflected CRC in C, then reflect the 16-bit result.
+    crc = binascii.crc_hqx(bytes(data).translate(_REVERSE_BITS), 0xFFFF)
+    crc = (_REVERSE_BITS[crc & 0xFF] << 8) | _REVERSE_BITS[crc >> 8]
+    return crc ^ 0xFFFF
+
+
+def validate_many(frames) -> list:
+    """
+    Checks the trailing FCS of many captured AX.25 Frames in one call.
+
+    :param frames: Iterable of AX.25 Frames, with or without AX.25 Flags.
+    :returns: A bool for each Frame, True if its FCS is valid.
+    :rtype: list
+    """
+    results = []
+    append = results.append
+    flag = 0x7E
+    for frame in frames:
+        start = 0
+        end = len(frame)
+        # Only strip a pair of Flags: the FCS itself may end in 0x7E.
+        if end > 1 and frame[0] == flag and frame[end - 1] == flag:
+            start = 1
+            end -= 1
+        if end - start < 3:
+            append(False)
+            continue
+        body = memoryview(frame)[start:end - 2]
+        append(crc16(body) == (frame[end - 2] | (frame[end - 1] << 8)))
+    return results
+
 
 def fcs(bits):
     """
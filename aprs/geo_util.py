@@ -3,13 +3,25 @@
 
 """Python APRS Module Geo Utility Function Definitions."""
 
+import math
+import typing
+
 import aprs.decimaldegrees
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 __author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
 __copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
 __license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
 
 
+# Mean Earth radius, in kilometers.
+EARTH_RADIUS = 6371.0
+
+
 def dec2dm_lat(dec: float) -> str:
     """
     Converts DecDeg to APRS Coord format.
@@ -28,17 +40,9 @@ def dec2dm_lat(dec: float) -> str:
         >>> aprs_lat
         '0800.60S'
     """
-    dec_min = aprs.decimaldegrees.decimal2dm(dec)
-
-    deg = dec_min[0]
-    abs_deg = abs(deg)
-
-    if not deg == abs_deg:
-        suffix = 'S'
-    else:
-        suffix = 'N'
-
-    return "%02d%05.2f%s" % (abs_deg, dec_min[1], suffix)
+    deg, hundredths = divmod(round(abs(dec) * 6000), 6000)
+    return "%02d%02d.%02d%s" % (
+        deg, hundredths // 100, hundredths % 100, 'S' if dec < 0 else 'N')
 
 
 def dec2dm_lng(dec: float) -> str:
@@ -57,17 +61,9 @@ def dec2dm_lng(dec: float) -> str:
         >>> aprs_lng
         '09900.60W'
     """
-    dec_min = aprs.decimaldegrees.decimal2dm(dec)
-
-    deg = dec_min[0]
-    abs_deg = abs(deg)
-
-    if not deg == abs_deg:
-        suffix = 'W'
-    else:
-        suffix = 'E'
-
-    return "%03d%05.2f%s" % (abs_deg, dec_min[1], suffix)
+    deg, hundredths = divmod(round(abs(dec) * 6000), 6000)
+    return "%03d%02d.%02d%s" % (
+        deg, hundredths // 100, hundredths % 100, 'W' if dec < 0 else 'E')
 
 
 def ambiguate(pos: float, ambiguity: int) -> str:
@@ -97,6 +93,345 @@ def ambiguate(pos: float, ambiguity: int) -> str:
     return num.decode()
 
 
+def _dec2dm_many(decs, deg_digits: int, positive: bytes, negative: bytes,
+                 ambiguity) -> list:
+    """
+    Vectorized `dec2dm_lat`/`dec2dm_lng` with `ambiguate` applied, built as
+    a NumPy array of ASCII digits.
+    """
+    decs = numpy.asarray(decs, dtype=numpy.float64)
+    deg, hundredths = numpy.divmod(
+        numpy.rint(numpy.abs(decs) * 6000).astype(numpy.int64), 6000)
+    minutes, hundredths = numpy.divmod(hundredths, 100)
+
+    width = deg_digits + 6
+    encoded = numpy.empty((len(decs), width), dtype=numpy.uint8)
+    for pos in range(deg_digits):
+        encoded[:, pos] = (deg // 10 ** (deg_digits - pos - 1)) % 10 + 48
+    encoded[:, deg_digits] = minutes // 10 + 48
+    encoded[:, deg_digits + 1] = minutes % 10 + 48
+    encoded[:, deg_digits + 2] = ord('.')
+    encoded[:, deg_digits + 3] = hundredths // 10 + 48
+    encoded[:, deg_digits + 4] = hundredths % 10 + 48
+    encoded[:, width - 1] = numpy.where(decs < 0, negative[0], positive[0])
+
+    # Same positions as `ambiguate`, skipping the dot & the direction:
+    ambiguity = numpy.broadcast_to(numpy.asarray(ambiguity), (len(decs),))
+    for level in range(int(ambiguity.max()) if len(decs) else 0):
+        column = width - (level + 2 if level < 2 else level + 3)
+        encoded[ambiguity > level, column] = ord(' ')
+
+    return encoded.view('S%d' % width).ravel().tolist()
+
+
+def dec2dm_lat_many(lats, ambiguity=0) -> list:
+    """
+    Converts many DecDeg latitudes to ambiguated APRS Coord format bytes.
+
+    :param lats: Sequence (or NumPy array) of latitudes.
+    :param ambiguity: Ambiguity for all latitudes, or a sequence of them.
+
+    >>> dec2dm_lat_many([37.7418096, -8.01], 1)
+    [b'3744.5 N', b'0800.6 S']
+    """
+    if numpy is not None:
+        return _dec2dm_many(lats, 2, b'N', b'S', ambiguity)
+    if isinstance(ambiguity, int):
+        ambiguity = [ambiguity] * len(lats)
+    return [bytes(ambiguate(dec2dm_lat(lat), amb), 'UTF-8')
+            for lat, amb in zip(lats, ambiguity)]
+
+
+def dec2dm_lng_many(lngs, ambiguity=0) -> list:
+    """
+    Converts many DecDeg longitudes to ambiguated APRS Coord format bytes.
+
+    :param lngs: Sequence (or NumPy array) of longitudes.
+    :param ambiguity: Ambiguity for all longitudes, or a sequence of them.
+
+    >>> dec2dm_lng_many([122.38833, -99.01], 2)
+    [b'12223.  E', b'09900.  W']
+    """
+    if numpy is not None:
+        return _dec2dm_many(lngs, 3, b'E', b'W', ambiguity)
+    if isinstance(ambiguity, int):
+        ambiguity = [ambiguity] * len(lngs)
+    return [bytes(ambiguate(dec2dm_lng(lng), amb), 'UTF-8')
+            for lng, amb in zip(lngs, ambiguity)]
+
+
+def distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    Great-circle (haversine) distance between two DecDeg points, in km.
+
+    >>> round(distance(37.7418096, -122.38833, 40.7128, -74.0060), 1)
+    4127.8
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    hav = (math.sin((phi2 - phi1) / 2) ** 2 +
+           math.cos(phi1) * math.cos(phi2) *
+           math.sin(math.radians(lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(hav)))
+
+
+def bearing(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    Initial great-circle bearing from the first DecDeg point to the second,
+    in degrees clockwise from true north.
+
+    >>> round(bearing(37.7418096, -122.38833, 40.7128, -74.0060), 1)
+    69.9
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dlng = math.radians(lng2 - lng1)
+    theta = math.atan2(
+        math.sin(dlng) * math.cos(phi2),
+        math.cos(phi1) * math.sin(phi2) -
+        math.sin(phi1) * math.cos(phi2) * math.cos(dlng))
+    return math.degrees(theta) % 360.0
+
+
+def destination_point(lat: float, lng: float, heading: float,
+                      km: float) -> tuple:
+    """
+    DecDeg point reached by travelling `km` from a point along the
+    great circle with initial bearing `heading`.
+
+    >>> [round(dec, 4) for dec in destination_point(0.0, 0.0, 90.0, 111.195)]
+    [0.0, 1.0]
+    """
+    phi1 = math.radians(lat)
+    theta = math.radians(heading)
+    delta = km / EARTH_RADIUS
+    phi2 = math.asin(
+        math.sin(phi1) * math.cos(delta) +
+        math.cos(phi1) * math.sin(delta) * math.cos(theta))
+    lng2 = math.radians(lng) + math.atan2(
+        math.sin(theta) * math.sin(delta) * math.cos(phi1),
+        math.cos(delta) - math.sin(phi1) * math.sin(phi2))
+    return (math.degrees(phi2),
+            (math.degrees(lng2) + 540.0) % 360.0 - 180.0)
+
+
+# Maidenhead locator pairs: (base, first character, degrees of longitude and
+# of latitude per step) for fields, squares, subsquares & extended squares.
+MAIDENHEAD_LEVELS = (
+    (18, 'A', 20.0, 10.0),
+    (10, '0', 2.0, 1.0),
+    (24, 'a', 2.0 / 24, 1.0 / 24),
+    (10, '0', 2.0 / 240, 1.0 / 240),
+)
+
+
+def latlng_to_maidenhead(lat: float, lng: float, precision: int=3) -> str:
+    """
+    Converts a DecDeg point to a Maidenhead locator of `precision` pairs
+    (1 to 4).
+
+    >>> latlng_to_maidenhead(37.7418096, -122.38833)
+    'CM87tr'
+    >>> latlng_to_maidenhead(37.7418096, -122.38833, 4)
+    'CM87tr38'
+    """
+    if not 1 <= precision <= len(MAIDENHEAD_LEVELS):
+        raise ValueError('precision must be 1 to %d.' % len(
+            MAIDENHEAD_LEVELS))
+    # Offsets from the South Pole & antimeridian, kept inside the grid:
+    lng = min((lng + 180.0) % 360.0, 359.9999999)
+    lat = min(max(lat + 90.0, 0.0), 179.9999999)
+    locator = []
+    for base, first, lng_step, lat_step in MAIDENHEAD_LEVELS[:precision]:
+        lng_idx = min(int(lng // lng_step), base - 1)
+        lat_idx = min(int(lat // lat_step), base - 1)
+        lng -= lng_idx * lng_step
+        lat -= lat_idx * lat_step
+        locator.append(chr(ord(first) + lng_idx))
+        locator.append(chr(ord(first) + lat_idx))
+    return ''.join(locator)
+
+
+def maidenhead_to_latlng(locator: typing.Union[str, bytes]) -> tuple:
+    """
+    Converts a Maidenhead locator to the DecDeg center of its square.
+
+    >>> [round(dec, 4) for dec in maidenhead_to_latlng('CM87tr')]
+    [37.7292, -122.375]
+
+    :raises: aprs.BadPositionError if the locator is malformed.
+    """
+    if isinstance(locator, bytes):
+        locator = locator.decode('ascii', 'replace')
+    pairs = len(locator) // 2
+    if len(locator) % 2 or not 1 <= pairs <= len(MAIDENHEAD_LEVELS):
+        raise aprs.BadPositionError(
+            'Bad Maidenhead locator: %s' % locator)
+    lng = -180.0
+    lat = -90.0
+    for pair, (base, first, lng_step, lat_step) in enumerate(
+            MAIDENHEAD_LEVELS[:pairs]):
+        lng_idx = ord(locator[pair * 2].upper() if first == 'A' else
+                      locator[pair * 2].lower()) - ord(first)
+        lat_idx = ord(locator[pair * 2 + 1].upper() if first == 'A' else
+                      locator[pair * 2 + 1].lower()) - ord(first)
+        if not (0 <= lng_idx < base and 0 <= lat_idx < base):
+            raise aprs.BadPositionError(
+                'Bad Maidenhead locator: %s' % locator)
+        lng += lng_idx * lng_step
+        lat += lat_idx * lat_step
+    _, _, lng_step, lat_step = MAIDENHEAD_LEVELS[pairs - 1]
+    return lat + lat_step / 2, lng + lng_step / 2
+
+
+def _broadcast(*args) -> list:
+    """
+    Pure-Python broadcasting of scalars against equal-length sequences.
+    """
+    size = max((len(arg) for arg in args if hasattr(arg, '__len__')),
+               default=1)
+    return [arg if hasattr(arg, '__len__') else [arg] * size for arg in args]
+
+
+def distance_many(lats1, lngs1, lats2, lngs2):
+    """
+    Vectorized `distance`. Each argument is a sequence (or NumPy array) or
+    a scalar broadcast against the others.
+
+    :returns: NumPy array of km, or a list without NumPy.
+    """
+    if numpy is None:
+        return [distance(*args) for args in zip(
+            *_broadcast(lats1, lngs1, lats2, lngs2))]
+    phi1 = numpy.radians(lats1)
+    phi2 = numpy.radians(lats2)
+    dlng = numpy.radians(numpy.subtract(lngs2, lngs1))
+    hav = (numpy.sin((phi2 - phi1) / 2) ** 2 +
+           numpy.cos(phi1) * numpy.cos(phi2) * numpy.sin(dlng / 2) ** 2)
+    return 2 * EARTH_RADIUS * numpy.arcsin(
+        numpy.sqrt(numpy.minimum(hav, 1.0)))
+
+
+def bearing_many(lats1, lngs1, lats2, lngs2):
+    """
+    Vectorized `bearing`, broadcasting like `distance_many`.
+
+    :returns: NumPy array of degrees, or a list without NumPy.
+    """
+    if numpy is None:
+        return [bearing(*args) for args in zip(
+            *_broadcast(lats1, lngs1, lats2, lngs2))]
+    phi1 = numpy.radians(lats1)
+    phi2 = numpy.radians(lats2)
+    dlng = numpy.radians(numpy.subtract(lngs2, lngs1))
+    cos_phi2 = numpy.cos(phi2)
+    theta = numpy.arctan2(
+        numpy.sin(dlng) * cos_phi2,
+        numpy.cos(phi1) * numpy.sin(phi2) -
+        numpy.sin(phi1) * cos_phi2 * numpy.cos(dlng))
+    return numpy.degrees(theta) % 360.0
+
+
+def destination_point_many(lats, lngs, headings, kms) -> tuple:
+    """
+    Vectorized `destination_point`, broadcasting like `distance_many`.
+
+    :returns: `(lats, lngs)` NumPy arrays, or lists without NumPy.
+    """
+    if numpy is None:
+        points = [destination_point(*args) for args in zip(
+            *_broadcast(lats, lngs, headings, kms))]
+        return [point[0] for point in points], [point[1] for point in points]
+    phi1 = numpy.radians(lats)
+    theta = numpy.radians(headings)
+    delta = numpy.asarray(kms, dtype=numpy.float64) / EARTH_RADIUS
+    sin_phi1 = numpy.sin(phi1)
+    cos_phi1 = numpy.cos(phi1)
+    sin_delta = numpy.sin(delta)
+    cos_delta = numpy.cos(delta)
+    sin_phi2 = numpy.clip(
+        sin_phi1 * cos_delta + cos_phi1 * sin_delta * numpy.cos(theta),
+        -1.0, 1.0)
+    lng2 = numpy.radians(lngs) + numpy.arctan2(
+        numpy.sin(theta) * sin_delta * cos_phi1,
+        cos_delta - sin_phi1 * sin_phi2)
+    return (numpy.degrees(numpy.arcsin(sin_phi2)),
+            (numpy.degrees(lng2) + 540.0) % 360.0 - 180.0)
+
+
+def latlng_to_maidenhead_many(lats, lngs, precision: int=3) -> list:
+    """
+    Converts many DecDeg points to Maidenhead locator bytes, built as a
+    NumPy array of ASCII characters.
+
+    >>> latlng_to_maidenhead_many([37.7418096, -33.9], [-122.38833, 151.2])
+    [b'CM87tr', b'QF56oc']
+    """
+    if numpy is None:
+        return [bytes(latlng_to_maidenhead(lat, lng, precision), 'ascii')
+                for lat, lng in zip(*_broadcast(lats, lngs))]
+    if not 1 <= precision <= len(MAIDENHEAD_LEVELS):
+        raise ValueError('precision must be 1 to %d.' % len(
+            MAIDENHEAD_LEVELS))
+    lngs, lats = numpy.broadcast_arrays(
+        numpy.minimum((numpy.asarray(lngs, dtype=numpy.float64) + 180.0) %
+                      360.0, 359.9999999),
+        numpy.clip(numpy.asarray(lats, dtype=numpy.float64) + 90.0,
+                   0.0, 179.9999999))
+    lngs = numpy.array(lngs, ndmin=1)
+    lats = numpy.array(lats, ndmin=1)
+    encoded = numpy.empty((len(lngs), precision * 2), dtype=numpy.uint8)
+    for pair, (base, first, lng_step, lat_step) in enumerate(
+            MAIDENHEAD_LEVELS[:precision]):
+        lng_idx = numpy.minimum(lngs // lng_step, base - 1)
+        lat_idx = numpy.minimum(lats // lat_step, base - 1)
+        lngs -= lng_idx * lng_step
+        lats -= lat_idx * lat_step
+        encoded[:, pair * 2] = lng_idx + ord(first)
+        encoded[:, pair * 2 + 1] = lat_idx + ord(first)
+    return encoded.view('S%d' % (precision * 2)).ravel().tolist()
+
+
+def maidenhead_to_latlng_many(locators) -> tuple:
+    """
+    Converts many Maidenhead locators of the same length to the DecDeg
+    centers of their squares.
+
+    :returns: `(lats, lngs)` NumPy arrays, or lists without NumPy.
+    :raises: aprs.BadPositionError if a locator is malformed.
+    """
+    if numpy is None:
+        points = [maidenhead_to_latlng(locator) for locator in locators]
+        return [point[0] for point in points], [point[1] for point in points]
+    locators = [locator if isinstance(locator, bytes) else
+                bytes(locator, 'ascii') for locator in locators]
+    width = len(locators[0]) if locators else 2
+    pairs = width // 2
+    if width % 2 or not 1 <= pairs <= len(MAIDENHEAD_LEVELS) or any(
+            len(locator) != width for locator in locators):
+        raise aprs.BadPositionError('Bad Maidenhead locators.')
+    chars = numpy.frombuffer(b''.join(locators), dtype=numpy.uint8).reshape(
+        len(locators), width).astype(numpy.int64)
+    lngs = numpy.full(len(locators), -180.0)
+    lats = numpy.full(len(locators), -90.0)
+    for pair, (base, first, lng_step, lat_step) in enumerate(
+            MAIDENHEAD_LEVELS[:pairs]):
+        indices = chars[:, pair * 2:pair * 2 + 2]
+        if first == 'A':
+            # Fields are upper case, fold lower case:
+            indices = numpy.where(indices >= ord('a'), indices - 32, indices)
+        elif first == 'a':
+            # Subsquares are lower case, fold upper case:
+            indices = numpy.where(indices < ord('a'), indices + 32, indices)
+        indices = indices - ord(first)
+        if ((indices < 0) | (indices >= base)).any():
+            raise aprs.BadPositionError('Bad Maidenhead locators.')
+        lngs += indices[:, 0] * lng_step
+        lats += indices[:, 1] * lat_step
+    _, _, lng_step, lat_step = MAIDENHEAD_LEVELS[pairs - 1]
+    return lats + lat_step / 2, lngs + lng_step / 2
+
+
 def run_doctest():  # pragma: no cover
     """Runs doctests for this module."""
     import doctest
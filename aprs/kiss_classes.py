@@ -191,15 +191,18 @@ class Frame(object):
                 self.path.append(path_call)
 
 
-class SerialKISS(kiss.SerialKISS):
+class SerialKISS(aprs.KISSInstrumentation, kiss.SerialKISS):
 
     """APRS interface for KISS serial devices."""
 
-    def __init__(self, port, speed, strip_df_start=False):
+    _transport = 'kiss_serial'
+
+    def __init__(self, port, speed, strip_df_start=False, metrics=None):
         super(SerialKISS, self).__init__(port, speed, strip_df_start)
         self.send = self.write
         self.receive = self.read
         self.use_i_construct = False
+        self._start_metrics(metrics)
 
     def write(self, frame):
         """Writes APRS-encoded frame to KISS device.
@@ -207,18 +210,23 @@ class SerialKISS(kiss.SerialKISS):
         :param frame: APRS frame to write to KISS device.
         :type frame: str
         """
-        super(SerialKISS, self).write(frame.encode_kiss())
+        encoded = frame.encode_kiss()
+        super(SerialKISS, self).write(encoded)
+        self._count_sent(encoded)
 
 
-class TCPKISS(kiss.TCPKISS):
+class TCPKISS(aprs.KISSInstrumentation, kiss.TCPKISS):
 
     """APRS interface for KISS serial devices."""
 
-    def __init__(self, host, port, strip_df_start=False):
+    _transport = 'kiss_tcp'
+
+    def __init__(self, host, port, strip_df_start=False, metrics=None):
         super(TCPKISS, self).__init__(host, port, strip_df_start)
         self.send = self.write
         self.receive = self.read
         self.use_i_construct = False
+        self._start_metrics(metrics)
 
     def write(self, frame):
         """
@@ -227,4 +235,6 @@ class TCPKISS(kiss.TCPKISS):
         :param frame: APRS frame to write to KISS device.
         :type frame: str
         """
-        super(TCPKISS, self).write(frame.encode_kiss())
+        encoded = frame.encode_kiss()
+        super(TCPKISS, self).write(encoded)
+        self._count_sent(encoded)
@@ -59,6 +59,30 @@ def valid_callsign(callsign):
     return True
 
 
+def passcode(callsign):
+    """
+    Computes the APRS-IS passcode of a callsign. The SSID is ignored.
+
+    >>> passcode('N0CALL-1')
+    13023
+    >>>
+
+    :param callsign: Callsign to compute the passcode of.
+    :type callsign: str
+
+    :returns: APRS-IS passcode.
+    :rtype: int
+    """
+    if isinstance(callsign, str):
+        callsign = bytes(callsign, 'UTF-8')
+    callsign = callsign.split(b'-')[0].upper()
+
+    code = 0x73E2
+    for idx, char in enumerate(callsign):
+        code ^= char << 8 if idx % 2 == 0 else char
+    return code & 0x7FFF
+
+
 def run_doctest():  # pragma: no cover
     """Runs doctests for this module."""
     import doctest
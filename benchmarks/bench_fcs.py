@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Python APRS Module FCS Benchmark.
+
+Compares the bitwise FCS path with the table-driven `FCS.update` and the
+bulk `aprs.fcs.validate_many`.
+"""
+
+import time
+
+import aprs  # pylint: disable=R0801
+import aprs.fcs  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+FRAME = aprs.Frame.parse(
+    'W2GMD-6>APRX24,WIDE1-1,WIDE2-1:!3745.75NI12228.05W#W2GMD-6 '
+    'Inner Sunset, SF iGate/Digipeater http://w2gmd.org').encode_ax25()
+
+
+def bitwise(frames: list) -> None:
+    """
+    One `update_bit` call per bit, as before.
+    """
+    for frame in frames:
+        fcs = aprs.FCS()
+        for byte in frame[1:-3]:
+            for i in range(8):
+                fcs.update_bit((byte >> i) & 0x01 == 1)
+
+
+def table(frames: list) -> None:
+    """
+    Table-driven `FCS.update`, a byte at a time.
+    """
+    for frame in frames:
+        fcs = aprs.FCS()
+        fcs.update(memoryview(frame)[1:-3])
+
+
+def bulk(frames: list) -> None:
+    """
+    `aprs.fcs.validate_many`.
+    """
+    aprs.fcs.validate_many(frames)
+
+
+def run(func, frames: list, rounds: int=3) -> float:
+    """
+    Returns the best frames/s of `rounds` runs of `func` over `frames`.
+    """
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(frames)
+        best = max(best, len(frames) / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    """Runs the benchmark."""
+    frames = [FRAME] * 2000
+    for func in (bitwise, table, bulk):
+        print("%-8s %12.0f frames/s" % (func.__name__, run(func, frames)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Python APRS Module Geo Utility Benchmark.
+
+Compares per-point scalar calls with the vectorized `_many` functions of
+`aprs.geo_util` over 1M random points.
+"""
+
+import random
+import time
+
+import aprs  # pylint: disable=R0801
+import aprs.geo_util  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+POINTS = 1000000
+
+# Reference point the distances & bearings are measured from.
+ORIGIN = (37.7418096, -122.38833)
+
+
+def scalar_cases(lats: list, lngs: list, locators: list) -> dict:
+    """
+    Per-point calls, as the pipeline makes them today.
+    """
+    lat0, lng0 = ORIGIN
+    return {
+        'distance': lambda: [aprs.distance(lat0, lng0, lat, lng)
+                             for lat, lng in zip(lats, lngs)],
+        'bearing': lambda: [aprs.bearing(lat0, lng0, lat, lng)
+                            for lat, lng in zip(lats, lngs)],
+        'destination_point': lambda: [
+            aprs.destination_point(lat, lng, 45.0, 10.0)
+            for lat, lng in zip(lats, lngs)],
+        'latlng_to_maidenhead': lambda: [
+            aprs.latlng_to_maidenhead(lat, lng)
+            for lat, lng in zip(lats, lngs)],
+        'maidenhead_to_latlng': lambda: [
+            aprs.maidenhead_to_latlng(locator) for locator in locators],
+    }
+
+
+def vector_cases(lats, lngs, locators: list) -> dict:
+    """
+    One call over the whole array.
+    """
+    lat0, lng0 = ORIGIN
+    return {
+        'distance': lambda: aprs.distance_many(lat0, lng0, lats, lngs),
+        'bearing': lambda: aprs.bearing_many(lat0, lng0, lats, lngs),
+        'destination_point': lambda: aprs.destination_point_many(
+            lats, lngs, 45.0, 10.0),
+        'latlng_to_maidenhead': lambda: aprs.latlng_to_maidenhead_many(
+            lats, lngs),
+        'maidenhead_to_latlng': lambda: aprs.maidenhead_to_latlng_many(
+            locators),
+    }
+
+
+def best(func, rounds: int=3) -> float:
+    """
+    Returns the best wall time of `rounds` calls of `func`.
+    """
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    """Runs the benchmark."""
+    rand = random.Random(42)
+    lats = [rand.uniform(-89.0, 89.0) for _ in range(POINTS)]
+    lngs = [rand.uniform(-180.0, 180.0) for _ in range(POINTS)]
+    locators = aprs.latlng_to_maidenhead_many(lats, lngs)
+
+    scalar = scalar_cases(lats, lngs, locators)
+    if aprs.geo_util.numpy is None:
+        print('NumPy is not installed, only timing the scalar path.')
+        vector = {}
+    else:
+        numpy = aprs.geo_util.numpy
+        vector = vector_cases(numpy.array(lats), numpy.array(lngs), locators)
+
+    print('%-22s %12s %12s %9s' % ('%d points' % POINTS, 'scalar (s)',
+                                   'vector (s)', 'speedup'))
+    for name, func in scalar.items():
+        scalar_time = best(func, 1)
+        if name in vector:
+            vector_time = best(vector[name])
+            print('%-22s %12.3f %12.3f %8.1fx' % (
+                name, scalar_time, vector_time, scalar_time / vector_time))
+        else:
+            print('%-22s %12.3f' % (name, scalar_time))
+
+
+if __name__ == '__main__':
+    main()
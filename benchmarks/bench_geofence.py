@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Python APRS Module Geofence Benchmark.
+
+Times `aprs.Geofence` against thousands of Fences, comparing a brute-force
+scan of every Fence with the grid-indexed `update` and `update_many`.
+"""
+
+import random
+import time
+
+import aprs  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+FENCES = 5000
+POSITIONS = 100000
+STATIONS = 20000
+
+
+def random_fences(rand: random.Random) -> list:
+    """
+    Small hexagons (roughly 1-10 km across) over the continental US.
+    """
+    fences = []
+    for _ in range(FENCES):
+        lat = rand.uniform(25.0, 49.0)
+        lng = rand.uniform(-125.0, -67.0)
+        size = rand.uniform(0.01, 0.1)
+        fences.append([(lat, lng), (lat + size, lng + size / 2),
+                       (lat + size, lng + size * 1.5), (lat, lng + size * 2),
+                       (lat - size, lng + size * 1.5),
+                       (lat - size, lng + size / 2)])
+    return fences
+
+
+def main():
+    """Runs the benchmark."""
+    rand = random.Random(42)
+    fences = random_fences(rand)
+    geofence = aprs.Geofence()
+    for idx, points in enumerate(fences):
+        geofence.add(idx, points)
+
+    # Stations clustered on the Fences, so Transitions actually fire:
+    callsigns = []
+    lats = []
+    lngs = []
+    for _ in range(POSITIONS):
+        lat, lng = rand.choice(fences)[0]
+        callsigns.append(b'STN%d' % rand.randrange(STATIONS))
+        lats.append(lat + rand.uniform(-0.1, 0.1))
+        lngs.append(lng + rand.uniform(-0.1, 0.2))
+
+    brute = [aprs.Fence(idx, points) for idx, points in enumerate(fences)]
+    count = POSITIONS // 100
+    start = time.perf_counter()
+    for lat, lng in zip(lats[:count], lngs[:count]):
+        [fence for fence in brute if fence.contains(lat, lng)]
+    brute_rate = count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for callsign, lat, lng in zip(callsigns, lats, lngs):
+        geofence.update(callsign, lat, lng, 0.0)
+    update_rate = POSITIONS / (time.perf_counter() - start)
+    transitions = geofence.transitions
+
+    geofence = aprs.Geofence()
+    for idx, points in enumerate(fences):
+        geofence.add(idx, points)
+    start = time.perf_counter()
+    geofence.update_many(callsigns, lats, lngs, 0.0)
+    many_rate = POSITIONS / (time.perf_counter() - start)
+    assert geofence.transitions == transitions
+
+    print('%d fences, %d positions, %d transitions' % (
+        FENCES, POSITIONS, transitions))
+    print('%-14s %14s' % ('', 'positions/s'))
+    print('%-14s %14.0f' % ('brute force', brute_rate))
+    print('%-14s %14.0f' % ('update', update_rate))
+    print('%-14s %14.0f' % ('update_many', many_rate))
+
+
+if __name__ == '__main__':
+    main()
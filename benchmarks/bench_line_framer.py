@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Python APRS Module LineFramer Benchmark.
+
+Compares `aprs.LineFramer` with the previous `TCP.receive` concatenate &
+split loop, feeding a full-feed style burst in `RECV_BUFFER` sized reads.
+"""
+
+import time
+
+import aprs  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+LINE = (b'W2GMD-6>APRX24,TCPIP*,qAC,T2SPAIN:!3745.75NI12228.05W#W2GMD-6 '
+        b'Inner Sunset, SF iGate/Digipeater http://w2gmd.org\r\n')
+
+
+def make_chunks(n_lines: int, burst: int) -> list:
+    """
+    Splits `n_lines` frames into `RECV_BUFFER` sized reads, arriving in
+    bursts of `burst` lines that have piled up in the socket.
+    """
+    chunks = []
+    for _ in range(n_lines // burst):
+        data = LINE * burst
+        for idx in range(0, len(data), aprs.RECV_BUFFER):
+            chunks.append(data[idx:idx + aprs.RECV_BUFFER])
+    return chunks
+
+
+def concat_split(chunks: list) -> int:
+    """
+    The previous `TCP.receive` framing loop.
+    """
+    n_lines = 0
+    recvd_data = bytes()
+    for recv_data in chunks:
+        recvd_data += recv_data
+        if recvd_data.endswith(b'\r\n'):
+            lines = recvd_data.strip().split(b'\r\n')
+            recvd_data = bytes()
+        else:
+            lines = recvd_data.split(b'\r\n')
+            recvd_data = lines.pop(-1)
+        for line in lines:
+            n_lines += 1
+    return n_lines
+
+
+def line_framer(chunks: list) -> int:
+    """
+    `aprs.LineFramer` based framing.
+    """
+    n_lines = 0
+    framer = aprs.LineFramer()
+    for recv_data in chunks:
+        framer.feed(recv_data)
+        for line in framer.lines():
+            n_lines += 1
+    return n_lines
+
+
+def run(func, chunks: list, rounds: int=5) -> float:
+    """
+    Returns the best lines/s of `rounds` runs of `func` over `chunks`.
+    """
+    best = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        n_lines = func(chunks)
+        elapsed = time.perf_counter() - start
+        best = max(best, n_lines / elapsed)
+    return best
+
+
+def main():
+    """Runs the benchmark."""
+    for burst in (1, 100, 1000, 5000):
+        chunks = make_chunks(20000, burst)
+        print("burst=%5d concat_split=%12.0f lines/s line_framer=%12.0f "
+              "lines/s" % (burst, run(concat_split, chunks),
+                           run(line_framer, chunks)))
+
+
+if __name__ == '__main__':
+    main()
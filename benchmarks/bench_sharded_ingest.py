@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Python APRS Module ShardedIngest Benchmark.
+
+Compares inline `aprs.Frame.parse` with `aprs.ShardedIngest` over 1, 2, 4
+and 8 worker processes.
+"""
+
+import os
+import time
+
+import aprs  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+LINES = [
+    b'W%dGMD-%d>APRX24,TCPIP*,qAC,T2TEST:!3745.75NI12228.05W#iGate %d' % (
+        n % 10, n % 15 + 1, n) for n in range(200000)]
+
+
+def inline(lines: list) -> int:
+    """
+    `aprs.Frame.parse` on this process.
+    """
+    return sum(1 for _ in map(aprs.Frame.parse, lines))
+
+
+def sharded(workers: int):
+    """
+    `aprs.ShardedIngest` with `workers` processes.
+    """
+    def _sharded(lines: list) -> int:
+        return sum(1 for _ in aprs.ShardedIngest(workers).map(lines))
+    _sharded.__name__ = 'sharded/%d' % workers
+    return _sharded
+
+
+def run(func, lines: list) -> float:
+    """
+    Returns the frames/s of `func` over `lines`.
+    """
+    start = time.perf_counter()
+    count = func(lines)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Runs the benchmark."""
+    print('%d CPUs' % os.cpu_count())
+    for func in [inline] + [sharded(workers) for workers in (1, 2, 4, 8)]:
+        print("%-10s %12.0f frames/s" % (func.__name__, run(func, LINES)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Python APRS Module Benchmark Corpus.
+
+A deterministic, APRS-IS like mix of plain-text Frames (positions in all
+three encodings, objects, messages, status, weather & telemetry) and their
+AX.25 encodings.
+"""
+
+import aprs  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+# (weight, template): templates take the station number.
+TEMPLATES = [
+    (6, b'W%dGMD-6>APRX28,TCPIP*,qAC,T2SPAIN:!3745.75NI12228.05W#iGate %d'),
+    (5, b'KF%dABC-9>APDR15,WIDE1-1,WIDE2-1,qAR,K6ABC:=/5L!!<*e7>7P['
+        b'Mobile %d'),
+    (5, b'N%dXYZ-9>S32U6T,WIDE1-1,WIDE2-1,qAR,KJ6ABC:`(_fn"Oj/]"4-}='
+        b'Mic-E %d'),
+    (3, b'K%dWX>APRS,TCPIP*,qAC,T2TEXAS:@092345z4903.50N/07201.75W_220/004'
+        b'g005t077r000p000P000h50b09900wRSW %d'),
+    (2, b'VE%dOBJ>APRS,TCPIP*,qAC,T2CAN:;LEADER%03d*092345z4903.50N/07201.75W>'
+        b'088/036'),
+    (2, b'DL%dMSG>APRS,TCPIP*,qAS,DB0ABC::W2GMD-1  :Hello %d{42'),
+    (2, b'G%dSTA>APRS,WIDE2-1,qAR,M0ABC:>Status text %d'),
+    (2, b'JA%dTLM-11>APRS,TCPIP*,qAC,T2JAPAN:T#%03d,199,000,255,073,123,'
+        b'01101001'),
+]
+
+
+def text_frames(count: int=5000) -> list:
+    """
+    Returns `count` plain-text Frames.
+    """
+    pattern = []
+    for weight, template in TEMPLATES:
+        pattern.extend([template] * weight)
+    return [pattern[idx % len(pattern)] % (idx % 10, idx % 1000)
+            for idx in range(count)]
+
+
+def ax25_frames(count: int=5000) -> list:
+    """
+    Returns `count` AX.25 encoded Frames, with FCS & flags.
+    """
+    return [aprs.Frame.parse(frame).encode_ax25()
+            for frame in text_frames(count)]
+
+
+def callsigns(count: int=5000) -> list:
+    """
+    Returns the plain-text source & path Callsigns of `count` Frames.
+    """
+    calls = []
+    for frame in text_frames(count):
+        header = frame[:frame.index(b':')]
+        source, _, path = header.partition(b'>')
+        calls.append(source)
+        calls.extend(path.split(b',')[1:])
+    return calls[:count]
@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Python APRS Module Benchmark Suite.
+
+Runs every registered hot-path benchmark over the `corpus`, reporting ops/s
+and the allocations retained per call (tracemalloc blocks & bytes of each
+call's result).
+
+Usage::
+
+    python benchmarks/run.py                       # Run everything.
+    python benchmarks/run.py -k parse              # Names with 'parse'.
+    python benchmarks/run.py --save baseline.json  # Record a baseline.
+    python benchmarks/run.py --compare baseline.json --threshold 0.1
+
+With `--compare`, exits non-zero if any benchmark's ops/s dropped by more
+than `--threshold` (a fraction) against the baseline.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+
+import aprs  # pylint: disable=R0801
+import aprs.fcs  # pylint: disable=R0801
+import aprs.geo_util  # pylint: disable=R0801
+
+import corpus  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+# name -> setup(), which returns (func, items, ops per item).
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """
+    Registers a benchmark setup function under `name`.
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark('frame.parse.text')
+def frame_parse_text():
+    """`aprs.Frame.parse` of plain-text Frames."""
+    return aprs.Frame.parse, corpus.text_frames(), 1
+
+
+@benchmark('frame.parse.lazy')
+def frame_parse_lazy():
+    """`aprs.Frame.parse(lazy=True)` of plain-text Frames."""
+    return (lambda frame: aprs.Frame.parse(frame, lazy=True),
+            corpus.text_frames(), 1)
+
+
+@benchmark('frame.parse.ax25')
+def frame_parse_ax25():
+    """`aprs.Frame.parse` of AX.25 Frames, including FCS checks."""
+    return aprs.Frame.parse, corpus.ax25_frames(), 1
+
+
+@benchmark('frame.encode_ax25')
+def frame_encode_ax25():
+    """`aprs.Frame.encode_ax25`."""
+    frames = [aprs.Frame.parse(frame) for frame in corpus.text_frames()]
+    return aprs.Frame.encode_ax25, frames, 1
+
+
+@benchmark('frame.bytes')
+def frame_bytes():
+    """`bytes(aprs.Frame)`."""
+    frames = [aprs.Frame.parse(frame) for frame in corpus.text_frames()]
+    return bytes, frames, 1
+
+
+@benchmark('callsign.parse.text')
+def callsign_parse_text():
+    """`aprs.Callsign.parse` of plain-text Callsigns."""
+    return aprs.Callsign.parse, corpus.callsigns(), 1
+
+
+@benchmark('callsign.parse.ax25')
+def callsign_parse_ax25():
+    """`aprs.Callsign.parse` of AX.25 address fields."""
+    calls = [aprs.Callsign.parse(call).encode_ax25()
+             for call in corpus.callsigns()]
+    return aprs.Callsign.parse, calls, 1
+
+
+@benchmark('fcs.update')
+def fcs_update():
+    """`aprs.FCS.update` over whole AX.25 Frames."""
+    def update(frame):
+        fcs = aprs.FCS()
+        fcs.update(frame)
+        return fcs.digest()
+    return update, [frame[1:-3] for frame in corpus.ax25_frames()], 1
+
+
+@benchmark('fcs.validate_many')
+def fcs_validate_many():
+    """`aprs.fcs.validate_many` over batches of 1000 AX.25 Frames."""
+    frames = corpus.ax25_frames()
+    batches = [frames[idx:idx + 1000] for idx in range(0, len(frames), 1000)]
+    return aprs.fcs.validate_many, batches, 1000
+
+
+@benchmark('geo.dec2dm_lat')
+def geo_dec2dm_lat():
+    """`aprs.dec2dm_lat`."""
+    return aprs.dec2dm_lat, [idx / 37.0 - 89.0 for idx in range(5000)], 1
+
+
+@benchmark('geo.dec2dm_lng')
+def geo_dec2dm_lng():
+    """`aprs.dec2dm_lng`."""
+    return aprs.dec2dm_lng, [idx / 14.0 - 179.0 for idx in range(5000)], 1
+
+
+@benchmark('geo.ambiguate')
+def geo_ambiguate():
+    """`aprs.ambiguate` of encoded latitudes."""
+    lats = [aprs.dec2dm_lat(idx / 37.0 - 89.0) for idx in range(5000)]
+    return (lambda lat: aprs.ambiguate(lat, 2), lats, 1)
+
+
+@benchmark('geo.distance_many')
+def geo_distance_many():
+    """`aprs.distance_many` over batches of 1000 points."""
+    lats = [idx / 37.0 - 89.0 for idx in range(1000)]
+    lngs = [idx / 14.0 - 179.0 for idx in range(1000)]
+    if aprs.geo_util.numpy is not None:
+        lats = aprs.geo_util.numpy.array(lats)
+        lngs = aprs.geo_util.numpy.array(lngs)
+    return (lambda lat: aprs.distance_many(lat, -122.4, lats, lngs),
+            [idx / 100.0 for idx in range(50)], 1000)
+
+
+@benchmark('position.parse')
+def position_parse():
+    """`aprs.Position.from_frame` of position Frames."""
+    frames = [aprs.Frame.parse(frame) for frame in corpus.text_frames()
+              if frame[frame.index(b':') + 1] in b'!=@`;']
+    return aprs.Position.from_frame, frames, 1
+
+
+@benchmark('filter.call')
+def filter_call():
+    """`aprs.Filter` with prefix, type and range terms over raw lines."""
+    frame_filter = aprs.Filter('p/W2/KF/N5 t/m r/37.7/-122.4/50')
+    return frame_filter, corpus.text_frames(), 1
+
+
+@benchmark('tcp.receive')
+def tcp_receive():
+    """`aprs.TCP.receive` of the corpus over a socketpair, per Frame."""
+    lines = corpus.text_frames()
+    data = b''.join(line + b'\r\n' for line in lines)
+    # Don't time the per-call 'Receive started' log line:
+    logging.getLogger('aprs.classes').setLevel(logging.WARNING)
+
+    def receive(_):
+        left, right = socket.socketpair()
+        writer = threading.Thread(target=lambda: (left.sendall(data),
+                                                  left.close()))
+        writer.start()
+        aprs_conn = aprs.TCP(b'W2GMD', b'-1')
+        aprs_conn.interface = right
+        frames = []
+        aprs_conn.receive(callback=frames.append)
+        writer.join()
+        right.close()
+        return frames
+    return receive, [None], len(lines)
+
+
+def measure(name: str, min_time: float=0.2, repeat: int=3) -> dict:
+    """
+    Runs benchmark `name`, returning its best ops/s and its retained
+    allocations per op.
+    """
+    func, items, per_item = BENCHMARKS[name]()
+    ops = len(items) * per_item
+
+    # Calibrate the number of passes over `items` to last `min_time`:
+    passes = 1
+    while 1:
+        start = time.perf_counter()
+        for _ in range(passes):
+            for item in items:
+                func(item)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        passes *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(passes):
+            for item in items:
+                func(item)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [func(item) for item in items]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del results
+
+    return {
+        'ops': ops * passes / best,
+        'blocks': blocks / ops,
+        'bytes': size / ops
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Returns the names of benchmarks slower than `baseline` by more than
+    `threshold`.
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        change = result['ops'] / baseline[name]['ops'] - 1
+        flag = ''
+        if change < -threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print('%-22s %12.0f -> %12.0f ops/s %+7.1f%%%s' % (
+            name, baseline[name]['ops'], result['ops'], change * 100, flag))
+    return regressions
+
+
+def main(argv: list=None) -> int:
+    """Runs the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-k', dest='pattern', default='',
+                        help='Only run benchmarks whose name contains this.')
+    parser.add_argument('--save', help='Write results to this JSON file.')
+    parser.add_argument('--compare', help='Compare with this JSON baseline.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Allowed ops/s slowdown, as a fraction.')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='Minimum seconds per timing run.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timing runs per benchmark, the best is kept.')
+    args = parser.parse_args(argv)
+
+    results = {}
+    print('%-22s %14s %10s %10s' % ('benchmark', 'ops/s', 'blocks/op',
+                                    'bytes/op'))
+    for name in BENCHMARKS:
+        if args.pattern not in name:
+            continue
+        result = results[name] = measure(name, args.min_time, args.repeat)
+        print('%-22s %14.0f %10.1f %10.0f' % (
+            name, result['ops'], result['blocks'], result['bytes']))
+
+    if args.save:
+        with open(args.save, 'w') as baseline_file:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'results': results
+            }, baseline_file, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print('%d regression(s) beyond %.0f%%: %s' % (
+                len(regressions), args.threshold * 100,
+                ', '.join(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -57,6 +57,9 @@ setuptools.setup(
         'requests >= 2.7.0',
         'bitarray >= 0.8.1'
     ],
+    extras_require={
+        'numpy': ['numpy']
+    },
     classifiers=[
         'Topic :: Communications :: Ham Radio',
         'Programming Language :: Python',
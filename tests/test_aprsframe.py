@@ -79,7 +79,8 @@ class FrameTestCase(aprs_test_classes.APRSTestClass):  # pylint: disable=R0904
 
         self.assertEqual(encoded_frame[0], 126)
         self.assertEqual(encoded_frame[-1:], aprs.AX25_FLAG)
-        self.assertEqual(encoded_frame[-3:-1], b'\xff\x07')
+        self.assertEqual(encoded_frame[-3:-1], b'g\x14')
+        self.assertTrue(aprs.FCS.validate(encoded_frame))
         self.assertEqual(str(aprs.Callsign.from_ax25(encoded_frame[1:8])), 'APRX24')
         self.assertEqual(str(aprs.Callsign.from_ax25(encoded_frame[8:15])), 'W2GMD-6')
         self.assertEqual(str(aprs.Callsign.from_ax25(encoded_frame[15:22])), 'WIDE1-1')
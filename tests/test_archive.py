@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Archive Tests."""
+
+import os
+import shutil
+import tempfile
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class ArchiveTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.ArchiveWriter` & `aprs.ArchiveReader`."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'test.arc')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, codec: str='zlib') -> list:
+        lines = [b'W%dGMD-%d>APRS,TCPIP*:>%d' % (n // 100, n % 7 + 1, n)
+                 for n in range(1000)]
+        with aprs.ArchiveWriter(self.path, codec=codec,
+                                block_records=100) as writer:
+            for n, line in enumerate(lines):
+                writer.write(line, timestamp=n * 10)
+        return lines
+
+    def test_round_trip(self):
+        """
+        Tests reading back every record, with both codecs.
+        """
+        for codec in ('zlib', 'lzma'):
+            lines = self._write(codec)
+            with aprs.ArchiveReader(self.path) as reader:
+                self.assertEqual(reader.codec, codec)
+                self.assertEqual(len(reader.blocks), 10)
+                self.assertEqual(len(reader), 1000)
+                self.assertEqual(list(reader.lines()), lines)
+                self.assertEqual(reader.blocks_read, 10)
+
+    def test_queries(self):
+        """
+        Tests that time and Callsign queries only decompress matching
+        blocks.
+        """
+        lines = self._write()
+        with aprs.ArchiveReader(self.path) as reader:
+            self.assertEqual(list(reader.lines(start=2050, end=2100)),
+                             lines[205:210])
+            self.assertEqual(reader.blocks_read, 1)
+
+            self.assertEqual(list(reader.lines(source='w3gmd-2')),
+                             [line for line in lines[300:400]
+                              if line.startswith(b'W3GMD-2>')])
+            self.assertLessEqual(reader.blocks_read, 3)
+
+            self.assertEqual(list(reader.lines(source=b'N0CALL')), [])
+
+    def test_frames_and_batches(self):
+        """
+        Tests feeding `aprs.Frame.parse` and `aprs.FrameBatch`.
+        """
+        self._write()
+        with aprs.ArchiveReader(self.path) as reader:
+            frame = next(reader.frames(start=5000))
+            self.assertEqual(str(frame), 'W5GMD-4>APRS,TCPIP*:>500')
+            batches = list(reader.batches(start=950))
+            self.assertEqual(
+                [len(batch) for batch in batches], [5] + [100] * 9)
+            self.assertEqual(batches[0].source(0), b'W0GMD-5')
+
+    def test_bad_archive(self):
+        """
+        Tests that incomplete archives are rejected.
+        """
+        writer = aprs.ArchiveWriter(self.path)
+        writer.write(b'W2GMD>APRS:>unclosed')
+        writer.flush()
+        writer._file.flush()
+        self.assertRaises(aprs.BadCaptureError, aprs.ArchiveReader, self.path)
+        writer.close()
+        with aprs.ArchiveReader(self.path) as reader:
+            self.assertEqual(len(reader), 1)
+
+        # Too short to even hold a trailer:
+        with open(self.path, 'r+b') as archive:
+            archive.truncate(aprs.Archive.ARCHIVE_HEADER.size + 4)
+        self.assertRaises(aprs.BadCaptureError, aprs.ArchiveReader, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
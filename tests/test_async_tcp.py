@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module asyncio APRS-IS Bindings Tests."""
+
+import asyncio
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class AsyncTCPTest(aprs_test_classes.APRSTestClass):  # pylint: disable=R0904
+
+    """Tests for `aprs.AsyncTCP`."""
+
+    def test_handshake_receive_send(self):
+        """
+        Tests logging in, receiving frames and sending a frame.
+        """
+        async def run():
+            logins = []
+            uplinked = []
+
+            async def handle(reader, writer):
+                writer.write(b'# aprsc 2.1.4\r\n')
+                logins.append(await reader.readline())
+                writer.write(b'# logresp W2GMD unverified, server T2TEST\r\n')
+                writer.write(b'W2GMD-1>APRS,TCPIP*:>one\r\n')
+                writer.write(b'# keepalive\r\n')
+                writer.write(b'W2GMD-2>APRS,TCPIP*:>two\r\n')
+                uplinked.append(await reader.readline())
+                writer.close()
+
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+
+            aprs_conn = aprs.AsyncTCP(
+                b'W2GMD', b'-1', servers=[b'127.0.0.1:%d' % port])
+            await aprs_conn.start()
+            await aprs_conn.send(aprs.Frame.parse('W2GMD-3>APRS:>three'))
+
+            frames = [str(frame) async for frame in aprs_conn]
+
+            await aprs_conn.close()
+            server.close()
+            await server.wait_closed()
+            return logins, uplinked, frames
+
+        logins, uplinked, frames = asyncio.run(run())
+
+        self.assertTrue(logins[0].startswith(b'user W2GMD pass -1'))
+        self.assertIn(b'filter p/W2GMD', logins[0])
+        self.assertEqual(uplinked[0].strip(), b'W2GMD-3>APRS:>three')
+        self.assertEqual(
+            frames, ['W2GMD-1>APRS,TCPIP*:>one', 'W2GMD-2>APRS,TCPIP*:>two'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -111,5 +111,26 @@ class CallsignTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable
         self.assertEqual(decoded_callsign.callsign, b'W2GMD')
         self.assertEqual(decoded_callsign.ssid, b'0')
 
+    def test_is_ax25(self):
+        """
+        Tests classifying AX.25 and plain-text Callsigns.
+        """
+        self.assertTrue(aprs.Callsign.is_ax25(b'\xaed\x8e\x9a\x88@b'))
+        self.assertTrue(aprs.Callsign.is_ax25(self.test_hex_frame))
+        self.assertFalse(aprs.Callsign.is_ax25(b'W2GMD-1'))
+        self.assertFalse(aprs.Callsign.is_ax25(b'WIDE2-2'))
+        self.assertFalse(aprs.Callsign.is_ax25(b'qAC'))
+
+    def test_parse_many(self):
+        """
+        Tests parsing a mix of AX.25 and plain-text Callsigns.
+        """
+        callsigns = aprs.Callsign.parse_many(
+            [b'W2GMD-1', 'TCPIP*', b'\xaed\x8e\x9a\x88@\xe0'])
+        self.assertEqual(
+            [str(callsign) for callsign in callsigns],
+            ['W2GMD-1', 'TCPIP*', 'W2GMD*'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Callsign Cache Tests."""
+
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class CallsignCacheTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.CallsignCache`."""
+
+    def tearDown(self):  # pylint: disable=C0103
+        """Teardown."""
+        aprs.Callsign.disable_cache()
+        super(CallsignCacheTestCase, self).tearDown()
+
+    def test_interned(self):
+        """
+        Tests that cached Callsigns are shared and immutable.
+        """
+        cache = aprs.Callsign.enable_cache(maxsize=16)
+        first = aprs.Callsign.parse(b'WIDE1-1')
+        second = aprs.Callsign.parse(bytearray(b'WIDE1-1'))
+
+        self.assertIs(first, second)
+        self.assertIsInstance(first, aprs.Callsign)
+        self.assertEqual(str(first), 'WIDE1-1')
+        self.assertEqual(cache.info()['hits'], 1)
+        self.assertEqual(cache.info()['misses'], 1)
+
+        with self.assertRaises(AttributeError):
+            first.set_digi(True)
+
+    def test_eviction(self):
+        """
+        Tests that the least recently used Callsign is evicted.
+        """
+        cache = aprs.Callsign.enable_cache(maxsize=2)
+        aprs.Callsign.parse(b'WIDE1-1')
+        aprs.Callsign.parse(b'WIDE2-2')
+        aprs.Callsign.parse(b'WIDE1-1')
+        aprs.Callsign.parse(b'TCPIP*')
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn(b'WIDE1-1', cache)
+        self.assertNotIn(b'WIDE2-2', cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_frame_from_text(self):
+        """
+        Tests that Frames share cached path Callsigns.
+        """
+        aprs.Callsign.enable_cache()
+        frame = 'W2GMD-1>APRS,TCPIP*,qAC,T2TEST:>test_frame_from_text'
+        first = aprs.Frame.parse(frame)
+        second = aprs.Frame.parse(frame)
+
+        self.assertEqual(str(first), frame)
+        self.assertIs(first.path[1], second.path[1])
+
+    def test_disabled(self):
+        """
+        Tests that Callsigns are not shared by default.
+        """
+        self.assertIsNone(aprs.Callsign.cache)
+        self.assertIsNot(
+            aprs.Callsign.parse(b'WIDE1-1'), aprs.Callsign.parse(b'WIDE1-1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Capture Tests."""
+
+import os
+import shutil
+import tempfile
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class CaptureTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.CaptureWriter` & `aprs.CaptureReader`."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'test.cap')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, count: int=100):
+        with aprs.CaptureWriter(self.path, interface=3, sync_every=16,
+                                index_every=10) as writer:
+            for n in range(count):
+                writer.write(b'W2GMD-1>APRS:>%d' % n, timestamp=n * 1000)
+            writer.write(aprs.Frame.parse('W2GMD-2>APRS:>rf'),
+                         timestamp=count * 1000, interface=1)
+            return writer
+
+    def test_round_trip(self):
+        """
+        Tests writing and reading back records.
+        """
+        writer = self._write()
+        self.assertEqual(writer.records, 101)
+        self.assertGreaterEqual(writer.syncs, 6)
+        with aprs.CaptureReader(self.path) as reader:
+            records = [(timestamp, interface, bytes(payload))
+                       for timestamp, interface, payload in reader]
+            self.assertEqual(len(records), 101)
+            self.assertEqual(records[0], (0, 3, b'W2GMD-1>APRS:>0'))
+            self.assertEqual(records[-1], (100000, 1, b'W2GMD-2>APRS:>rf'))
+            self.assertEqual(len(reader.index), 11)
+
+    def test_seek(self):
+        """
+        Tests seeking by timestamp, with and without the index sidecar.
+        """
+        self._write()
+        with aprs.CaptureReader(self.path) as reader:
+            sidecar_index = reader.index
+            found = [bytes(record[2]) for record in
+                     reader.between(41500, 45000)]
+            self.assertEqual(found, [b'W2GMD-1>APRS:>%d' % n
+                                     for n in range(42, 45)])
+            self.assertEqual(reader.seek(10 ** 9), os.path.getsize(self.path))
+
+        os.remove(self.path + aprs.Capture.INDEX_SUFFIX)
+        with aprs.CaptureReader(self.path, index_every=10) as reader:
+            self.assertEqual(reader.index, sidecar_index)
+            self.assertEqual(
+                bytes(next(reader.between(42000))[2]), b'W2GMD-1>APRS:>42')
+
+    def test_truncated(self):
+        """
+        Tests that a partially written last record is ignored, and that
+        other files are rejected.
+        """
+        self._write(10)
+        with open(self.path, 'ab') as capture:
+            capture.write(b'\xff\x00\x00\x00partial')
+        with aprs.CaptureReader(self.path) as reader:
+            self.assertEqual(len(list(reader)), 11)
+
+        with open(self.path, 'wb') as capture:
+            capture.write(b'W2GMD>APRS:>not a capture')
+        self.assertRaises(aprs.BadCaptureError, aprs.CaptureReader, self.path)
+
+    def test_append_after_torn_record(self):
+        """
+        Tests that reopening a capture with a torn last record cuts it off,
+        with its index entry, before appending.
+        """
+        with aprs.CaptureWriter(self.path, index_every=1) as writer:
+            writer.write(b'A>B:first', timestamp=1)
+            writer.write(b'C>D:second', timestamp=2)
+        with open(self.path, 'r+b') as capture:
+            capture.truncate(os.path.getsize(self.path) - 3)
+
+        with aprs.CaptureWriter(self.path, index_every=1) as writer:
+            writer.write(b'E>F:third', timestamp=3)
+            writer.write(b'G>H:fourth', timestamp=4)
+        with aprs.CaptureReader(self.path) as reader:
+            self.assertEqual(
+                [(timestamp, bytes(line)) for timestamp, _, line in reader],
+                [(1, b'A>B:first'), (3, b'E>F:third'), (4, b'G>H:fourth')])
+            self.assertEqual(
+                [timestamp for timestamp, _, _ in reader.between(2)],
+                [3, 4])
+        self.assertEqual(os.path.getsize(self.path + '.idx'), 3 * 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module DupeFilter Tests."""
+
+import socket
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class DupeFilterTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.DupeFilter`."""
+
+    def test_ignores_path(self):
+        """
+        Tests that copies via different paths are duplicates.
+        """
+        dupe_filter = aprs.DupeFilter(window=30, clock=lambda: 0)
+        self.assertFalse(dupe_filter.is_duplicate(
+            b'W2GMD-6>APRS,WIDE1-1,qAR,W2GMD:>hello'))
+        self.assertTrue(dupe_filter.is_duplicate(
+            b'W2GMD-6>APRS,TCPIP*,qAC,T2TEST:>hello '))
+        self.assertFalse(dupe_filter.is_duplicate(
+            b'W2GMD-6>APRS,TCPIP*,qAC,T2TEST:>hello again'))
+        self.assertFalse(dupe_filter.is_duplicate(
+            b'W2GMD-6>APZ123,TCPIP*,qAC,T2TEST:>hello'))
+        self.assertEqual(dupe_filter.info(), {
+            'seen': 4, 'passed': 3, 'suppressed': 1, 'window_size': 3})
+
+    def test_frames(self):
+        """
+        Tests duplicate `aprs.Frame` objects, as a `filter()` predicate.
+        """
+        dupe_filter = aprs.DupeFilter(clock=lambda: 0)
+        frames = [aprs.Frame.parse(frame) for frame in (
+            'W2GMD-6>APRS,WIDE1-1:>hello', 'W2GMD-6>APRS,WIDE2-2:>hello',
+            'W2GMD-7>APRS,WIDE2-2:>hello')]
+        self.assertEqual(
+            [str(frame.source) for frame in filter(dupe_filter, frames)],
+            ['W2GMD-6', 'W2GMD-7'])
+
+    def test_expiry(self):
+        """
+        Tests that packets leave the window.
+        """
+        dupe_filter = aprs.DupeFilter(window=30)
+        frame = b'W2GMD-6>APRS:>hello'
+        self.assertFalse(dupe_filter.is_duplicate(frame, now=0))
+        self.assertTrue(dupe_filter.is_duplicate(frame, now=29.9))
+        self.assertFalse(dupe_filter.is_duplicate(frame, now=30))
+        dupe_filter.expire(now=61)
+        self.assertEqual(len(dupe_filter), 0)
+
+    def test_tcp_receive(self):
+        """
+        Tests dropping duplicates in `aprs.TCP.receive`.
+        """
+        left, right = socket.socketpair()
+        try:
+            left.sendall(b'W2GMD-1>APRS,TCPIP*:>one\r\n'
+                         b'W2GMD-1>APRS,qAR,W2GMD:>one\r\n'
+                         b'W2GMD-1>APRS,TCPIP*:>two\r\n')
+            left.close()
+            aprs_conn = aprs.TCP(b'W2GMD', b'-1')
+            aprs_conn.interface = right
+            dupe_filter = aprs.DupeFilter()
+            frames = []
+            aprs_conn.receive(callback=frames.append, dupe_filter=dupe_filter)
+            self.assertEqual(len(frames), 2)
+            self.assertEqual(dupe_filter.suppressed, 1)
+        finally:
+            right.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
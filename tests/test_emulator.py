@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Emulator Tests."""
+
+import time
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class EmulatorTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.Emulator`."""
+
+    def test_synthetic_frames(self):
+        """
+        Tests that each synthetic station has its own source callsign.
+        """
+        frames = aprs.Emulator.synthetic_frames(2000, stations=1000)
+        sources = set(frame.split(b'>', 1)[0] for frame in frames)
+        self.assertEqual(len(sources), 1000)
+        self.assertEqual(str(aprs.Frame.parse(frames[-1]).source), 'EMU66-10')
+
+    def test_tcp(self):
+        """
+        Tests `aprs.TCP` logging in, receiving and uplinking.
+        """
+        frames = aprs.Emulator.synthetic_frames(500, stations=20)
+        with aprs.Emulator(frames, burst=50) as emulator:
+            aprs_conn = aprs.TCP(
+                b'W2GMD', b'%d' % aprs.passcode('W2GMD'),
+                servers=emulator.servers)
+            aprs_conn.start()
+            aprs_conn.send(aprs.Frame.parse('W2GMD-1>APRS:>uplink'))
+            received = []
+            aprs_conn.receive(callback=received.append, frame_handler=None)
+            aprs_conn.interface.close()
+
+            self.assertEqual(received, frames)
+            self.assertTrue(emulator.wait_uplinked(1))
+            self.assertEqual(emulator.uplinked[0][1:],
+                             (b'tcp', b'W2GMD-1>APRS:>uplink'))
+            self.assertIn(b'filter p/W2GMD', emulator.logins[0])
+
+    def test_rate_and_disconnect(self):
+        """
+        Tests pacing and dropping clients after `disconnect_after` Frames.
+        """
+        frames = aprs.Emulator.synthetic_frames(40)
+        with aprs.Emulator(frames, rate=400, burst=4,
+                           disconnect_after=20) as emulator:
+            for _ in range(2):
+                aprs_conn = aprs.TCP(b'W2GMD', b'-1',
+                                     servers=emulator.servers)
+                aprs_conn.start()
+                received = []
+                start = time.monotonic()
+                aprs_conn.receive(callback=received.append)
+                elapsed = time.monotonic() - start
+                aprs_conn.interface.close()
+                self.assertEqual(len(received), 20)
+                self.assertGreater(elapsed, 0.03)
+            self.assertEqual(emulator.info()['connections'], 2)
+            self.assertEqual(emulator.info()['sent'], 40)
+
+    def test_udp_http(self):
+        """
+        Tests submissions from `aprs.UDP` & `aprs.HTTP`.
+        """
+        with aprs.Emulator() as emulator:
+            host, port = emulator.address('udp')
+            udp = aprs.UDP(b'W2GMD', b'-1', server=host, port=port)
+            udp.start()
+            udp.send(aprs.Frame.parse('W2GMD-1>APRS:>udp'))
+
+            http = aprs.HTTP(b'W2GMD', b'-1', url=emulator.url)
+            http.start()
+            self.assertTrue(http.send(b'W2GMD-2>APRS:>http'))
+
+            self.assertTrue(emulator.wait_uplinked(2))
+            self.assertEqual(
+                sorted(uplink[1:] for uplink in emulator.uplinked),
+                [(b'http', b'W2GMD-2>APRS:>http'),
+                 (b'udp', b'W2GMD-1>APRS:>udp')])
+
+
+if __name__ == '__main__':
+    unittest.main()
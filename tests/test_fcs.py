@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module FCS Tests."""
+
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs.fcs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class FCSTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.FCS`."""
+
+    def test_check_value(self):
+        """
+        Tests the CRC-16/X.25 check value for both byte-wise paths.
+        """
+        fcs = aprs.FCS()
+        fcs.update(b'123456789')
+        self.assertEqual(fcs.digest(), b'\x6e\x90')
+        self.assertEqual(aprs.fcs.crc16(memoryview(b'123456789')), 0x906E)
+
+    def test_matches_bitwise(self):
+        """
+        Tests that the table-driven path matches the bitwise path.
+        """
+        data = self.test_hex_frame
+        bitwise = aprs.FCS()
+        for byte in data:
+            for i in range(8):
+                bitwise.update_bit((byte >> i) & 0x01 == 1)
+
+        bytewise = aprs.FCS()
+        bytewise.update(data[:10])
+        bytewise.update(data[10:])
+
+        self.assertEqual(bytewise.fcs, bitwise.fcs)
+        self.assertEqual(aprs.fcs.crc16(data), bitwise.fcs ^ 0xFFFF)
+
+    def test_validate_many(self):
+        """
+        Tests validating many AX.25 Frames at once.
+        """
+        encoded = aprs.Frame.parse('W2GMD-1>APRS,WIDE1-1:>test').encode_ax25()
+        corrupt = encoded[:20] + b'X' + encoded[21:]
+        unflagged = encoded[1:-1]
+
+        self.assertEqual(
+            aprs.fcs.validate_many([encoded, corrupt, unflagged, b'']),
+            [True, False, True, False])
+
+    def test_validate_fcs_ending_in_flag(self):
+        """
+        Tests that an unflagged Frame whose FCS ends in 0x7E validates.
+        """
+        encoded = aprs.Frame.parse(
+            'K6WX>APRS,TCPIP*,qAC,T2TEXAS:@092345z4903.50N/07201.75W_220/004'
+            'g005t077r000p000P000h50b09900wRSW 746').encode_ax25()
+        unflagged = encoded[1:-1]
+        self.assertEqual(unflagged[-1], 0x7E)
+        self.assertTrue(aprs.FCS.validate(unflagged))
+        # Stripping that 0x7E as a Flag would check the wrong two bytes:
+        corrupt = unflagged[:10] + b'X' + unflagged[11:]
+        self.assertEqual(
+            aprs.fcs.validate_many([encoded, unflagged, corrupt]),
+            [True, True, False])
+
+    def test_decode_strips_fcs(self):
+        """
+        Tests that decoding an AX.25 Frame drops the FCS from the info field.
+        """
+        frame = 'W2GMD-1>APRS,WIDE1-1:>test_decode_strips_fcs'
+        decoded = aprs.Frame.parse(aprs.Frame.parse(frame).encode_ax25())
+        self.assertEqual(str(decoded), frame)
+
+
+if __name__ == '__main__':
+    unittest.main()
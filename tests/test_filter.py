@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Local Filter Tests."""
+
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+SF_POSITION = b'W2GMD-6>APOTC1,WIDE1-1*,qAR,KF4MKT:!3745.94N/12228.05W>test'
+NYC_POSITION = b'K2ABC>APRS,TCPIP*,qAC,T2TEST:=4042.77N/07400.36W-test'
+WX_POSITION = b'KF4MKT-13>APRS,TCPIP*,qAC,T2TEST:@092345z3745.00N/12227.00W_'
+STATUS = b'W2GMD-1>APRS,TCPIP*,qAC,T2TEST:>status'
+OBJECT = b'KF4MKT>APRS,TCPIP*,qAC,T2TEST:;LEADER   *092345z3745.00N/12227.00W>'
+NWS = b'KF4MKT>APRS,TCPIP*,qAC,T2TEST::NWS-WARN :Heat advisory'
+
+
+class FilterTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.Filter`."""
+
+    def check(self, expression, passing, failing):
+        """
+        Checks that `expression` passes & fails the given Frames, both as raw
+        lines and as `aprs.Frame` objects.
+        """
+        aprs_filter = aprs.Filter.compile(expression)
+        for frame in passing:
+            self.assertTrue(aprs_filter(frame), frame)
+            self.assertTrue(aprs_filter(aprs.Frame.parse(frame)), frame)
+        for frame in failing:
+            self.assertFalse(aprs_filter(frame), frame)
+            self.assertFalse(aprs_filter(aprs.Frame.parse(frame)), frame)
+
+    def test_prefix_and_budlist(self):
+        """
+        Tests p/ prefixes and b/ budlists sharing one trie.
+        """
+        self.check('p/W2/KF4', [SF_POSITION, STATUS, WX_POSITION],
+                   [NYC_POSITION])
+        self.check('b/W2GMD-1/K2*', [STATUS, NYC_POSITION],
+                   [SF_POSITION, WX_POSITION])
+
+    def test_range_and_area(self):
+        """
+        Tests r/ range & a/ area filters.
+        """
+        self.check('r/37.75/-122.45/50', [SF_POSITION, WX_POSITION, OBJECT],
+                   [NYC_POSITION, STATUS])
+        self.check('a/41/-75/40/-73', [NYC_POSITION], [SF_POSITION, STATUS])
+
+    def test_types(self):
+        """
+        Tests t/ Data Type filters.
+        """
+        self.check('t/s', [STATUS], [SF_POSITION])
+        self.check('t/o', [OBJECT], [SF_POSITION])
+        self.check('t/w', [WX_POSITION], [SF_POSITION])
+        self.check('t/n', [NWS], [STATUS])
+
+    def test_path_filters(self):
+        """
+        Tests o/ object, d/ digipeater and e/ entry station filters.
+        """
+        self.check('o/LEAD*', [OBJECT], [SF_POSITION])
+        self.check('d/WIDE1-1', [SF_POSITION], [NYC_POSITION])
+        # Every hop before the last '*' has digipeated too:
+        self.check('d/N0CALL-1', [b'W2GMD>APRS,N0CALL-1,WIDE1*,WIDE2-1:>x'],
+                   [b'W2GMD>APRS,WIDE1*,N0CALL-1:>x',
+                    b'W2GMD>APRS,N0CALL-1,WIDE1-1:>x'])
+        self.check('e/KF4MKT', [SF_POSITION], [NYC_POSITION])
+        self.check('e/T2*', [NYC_POSITION, STATUS], [SF_POSITION])
+
+    def test_negation(self):
+        """
+        Tests that negated filters override positive ones.
+        """
+        self.check('p/W2 p/KF4 -t/s -b/KF4MKT-13', [SF_POSITION],
+                   [STATUS, WX_POSITION, NYC_POSITION])
+
+    def test_bad_filters(self):
+        """
+        Tests that unsupported or malformed filters are rejected.
+        """
+        for expression in ('r/37/-122', 'x/abc', 'p/', 't/z', 'r/a/b/c',
+                           't/p/W2GMD/50'):
+            with self.assertRaises(aprs.BadFilterError):
+                aprs.Filter(expression)
+
+
+if __name__ == '__main__':
+    unittest.main()
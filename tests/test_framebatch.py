@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module APRS FrameBatch Tests."""
+
+import sys
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+LINES = [
+    b'# aprsc 2.1.4-g408ed49',
+    b'W2GMD-6>APOTC1,WIDE1-1,WIDE2-1:!3745.94N/12228.05W>test\r\n',
+    b'KF4MKT>APRS:>status',
+    b'not a frame',
+    b'W2GMD-1>APRX24,TCPIP*,qAC,T2TEST:=3745.00N/12227.00W-test',
+]
+
+
+class FrameBatchTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.FrameBatch`."""
+
+    def check_batch(self):
+        """
+        Checks building, accessing and filtering a FrameBatch.
+        """
+        batch = aprs.FrameBatch.from_lines(LINES)
+
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.skipped, 2)
+        self.assertEqual(batch.source(0), b'W2GMD-6')
+        self.assertEqual(batch.destination(0), b'APOTC1')
+        self.assertEqual(batch.path(0), [b'WIDE1-1', b'WIDE2-1'])
+        self.assertEqual(batch.path(1), [])
+        self.assertEqual(batch.info(1), b'>status')
+        self.assertEqual(
+            str(batch[2]),
+            'W2GMD-1>APRX24,TCPIP*,qAC,T2TEST:=3745.00N/12227.00W-test')
+
+        positions = batch.filter_data_type('!', b'=')
+        self.assertEqual(len(positions), 2)
+        self.assertIs(positions.buffer, batch.buffer)
+
+        w2gmd = batch.filter_prefix(b'W2GMD')
+        self.assertEqual([w2gmd.source(i) for i in range(len(w2gmd))],
+                         [b'W2GMD-6', b'W2GMD-1'])
+        self.assertEqual(len(batch.filter_prefix('APR', 'destination')), 2)
+        self.assertEqual(len(w2gmd.filter_data_type('>')), 0)
+        self.assertEqual(len(batch.filter_prefix(b'W2GMD-6XXXXX')), 0)
+
+    def test_batch(self):
+        """
+        Tests a FrameBatch, with NumPy if it's installed.
+        """
+        self.check_batch()
+
+    def test_batch_without_numpy(self):
+        """
+        Tests a FrameBatch with the pure-Python fallbacks.
+        """
+        # `aprs.FrameBatch` is the class, so reach for the module:
+        module = sys.modules['aprs.FrameBatch']
+        numpy = module.numpy
+        module.numpy = None
+        try:
+            self.check_batch()
+        finally:
+            module.numpy = numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -188,6 +188,122 @@ class APRSGeoTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=
         self.assertTrue(lng_deg <= 180)
         self.assertTrue(aprs_lng.endswith('E'))
 
+    def test_minutes_carry(self):
+        """
+        Test that minutes rounding up to 60 carry into the degrees.
+        """
+        self.assertEqual(aprs.geo_util.dec2dm_lat(49.99999), '5000.00N')
+        self.assertEqual(aprs.geo_util.dec2dm_lng(-121.99999), '12200.00W')
+
+    def test_hemisphere_under_one_degree(self):
+        """
+        Test that negative coordinates under one degree keep their sign.
+        """
+        self.assertEqual(aprs.geo_util.dec2dm_lat(-0.5), '0030.00S')
+        self.assertEqual(aprs.geo_util.dec2dm_lng(-0.5), '00030.00W')
+
+    def test_many_matches_scalar(self):
+        """
+        Test that the batch encoders match the scalar encoders.
+        """
+        lats = [37.7418096, -37.7418096, -8.01, 0.0, 89.999, -0.25]
+        lngs = [122.38833, -122.38833, -99.01, 0.0, 179.999, -0.25]
+        for ambiguity in range(5):
+            self.assertEqual(
+                aprs.dec2dm_lat_many(lats, ambiguity),
+                [bytes(aprs.ambiguate(aprs.dec2dm_lat(lat), ambiguity),
+                       'UTF-8') for lat in lats])
+            self.assertEqual(
+                aprs.dec2dm_lng_many(lngs, ambiguity),
+                [bytes(aprs.ambiguate(aprs.dec2dm_lng(lng), ambiguity),
+                       'UTF-8') for lng in lngs])
+
+        self.assertEqual(
+            aprs.dec2dm_lat_many([37.7418096, 37.7418096], [0, 3]),
+            [b'3744.51N', b'374 .  N'])
+
+    def check_vectorized(self):
+        """
+        Checks the vectorized distance, bearing, destination & Maidenhead
+        functions against their scalar versions.
+        """
+        lats = [37.7418096, -33.9, 64.8, 0.0, -89.5]
+        lngs = [-122.38833, 151.2, -179.9, 0.0, 45.0]
+        distances = aprs.distance_many(40.7128, -74.0060, lats, lngs)
+        bearings = aprs.bearing_many(40.7128, -74.0060, lats, lngs)
+        dest_lats, dest_lngs = aprs.destination_point_many(
+            lats, lngs, 45.0, [10.0, 100.0, 1000.0, 5000.0, 20.0])
+        for idx, (lat, lng) in enumerate(zip(lats, lngs)):
+            self.assertAlmostEqual(
+                distances[idx], aprs.distance(40.7128, -74.0060, lat, lng))
+            self.assertAlmostEqual(
+                bearings[idx], aprs.bearing(40.7128, -74.0060, lat, lng))
+            dest = aprs.destination_point(
+                lat, lng, 45.0, [10.0, 100.0, 1000.0, 5000.0, 20.0][idx])
+            self.assertAlmostEqual(dest_lats[idx], dest[0])
+            self.assertAlmostEqual(dest_lngs[idx], dest[1])
+
+        for precision in range(1, 5):
+            locators = aprs.latlng_to_maidenhead_many(lats, lngs, precision)
+            self.assertEqual(locators, [
+                bytes(aprs.latlng_to_maidenhead(lat, lng, precision), 'ascii')
+                for lat, lng in zip(lats, lngs)])
+            centers = aprs.maidenhead_to_latlng_many(locators)
+            for idx, locator in enumerate(locators):
+                center = aprs.maidenhead_to_latlng(locator)
+                self.assertAlmostEqual(centers[0][idx], center[0])
+                self.assertAlmostEqual(centers[1][idx], center[1])
+
+    def test_vectorized(self):
+        """
+        Test the vectorized functions, with NumPy if it's installed.
+        """
+        self.check_vectorized()
+
+    def test_vectorized_without_numpy(self):
+        """
+        Test the pure-Python fallbacks of the vectorized functions.
+        """
+        numpy = aprs.geo_util.numpy
+        aprs.geo_util.numpy = None
+        try:
+            self.check_vectorized()
+        finally:
+            aprs.geo_util.numpy = numpy
+
+    def test_destination_round_trip(self):
+        """
+        Test that travelling `distance` along `bearing` reaches the point.
+        """
+        start = (37.7418096, -122.38833)
+        end = (40.7128, -74.0060)
+        dest = aprs.destination_point(
+            start[0], start[1], aprs.bearing(*start, *end),
+            aprs.distance(*start, *end))
+        self.assertAlmostEqual(dest[0], end[0], 6)
+        self.assertAlmostEqual(dest[1], end[1], 6)
+
+    def test_maidenhead(self):
+        """
+        Test Maidenhead locators, round trips & edges.
+        """
+        self.assertEqual(aprs.latlng_to_maidenhead(41.714775, -72.727260),
+                         'FN31pr')
+        self.assertEqual(aprs.latlng_to_maidenhead(90.0, 179.9999), 'RR99xx')
+        # 180E is the antimeridian, same as 180W:
+        self.assertEqual(aprs.latlng_to_maidenhead(0.0, 180.0),
+                         aprs.latlng_to_maidenhead(0.0, -180.0))
+        self.assertEqual(aprs.latlng_to_maidenhead(-90.0, -180.0, 1), 'AA')
+        lat, lng = aprs.maidenhead_to_latlng(b'fn31PR')
+        self.assertEqual(aprs.latlng_to_maidenhead(lat, lng), 'FN31pr')
+        for bad in ('FN3', 'SN31', 'FN31pz', 'FN31pr00xx'):
+            with self.assertRaises(aprs.BadPositionError):
+                aprs.maidenhead_to_latlng(bad)
+        with self.assertRaises(aprs.BadPositionError):
+            aprs.maidenhead_to_latlng_many([b'FN31', b'FN31pr'])
+        with self.assertRaises(ValueError):
+            aprs.latlng_to_maidenhead(0.0, 0.0, 5)
+
 
 if __name__ == '__main__':
     unittest.main()
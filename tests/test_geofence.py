@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Geofence Tests."""
+
+import random
+import sys
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+# An L-shaped depot around 37.7N 122.4W, concave so a bbox hit isn't enough:
+DEPOT = [(37.70, -122.50), (37.80, -122.50), (37.80, -122.45),
+         (37.75, -122.45), (37.75, -122.30), (37.70, -122.30)]
+
+
+class GeofenceTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.Geofence`."""
+
+    def test_fence_contains(self):
+        """
+        Tests point-in-polygon on a concave Fence.
+        """
+        fence = aprs.Fence('depot', DEPOT)
+        self.assertTrue(fence.contains(37.72, -122.35))
+        self.assertTrue(fence.contains(37.78, -122.48))
+        # Inside the bounding box, outside the L:
+        self.assertFalse(fence.contains(37.78, -122.35))
+        self.assertFalse(fence.contains(38.0, -122.4))
+
+        with self.assertRaises(aprs.BadPositionError):
+            aprs.Fence('bad', DEPOT[:2])
+        with self.assertRaises(aprs.BadPositionError):
+            aprs.Fence('bad', [(0, 0), (91, 0), (0, 1)])
+
+    def test_update_transitions(self):
+        """
+        Tests that only entering & leaving a Fence fire Transitions.
+        """
+        fired = []
+        geofence = aprs.Geofence(callback=fired.append, clock=lambda: 5.0)
+        geofence.add('depot', DEPOT)
+        geofence.add('yard', [(37.71, -122.34), (37.73, -122.34),
+                              (37.73, -122.31), (37.71, -122.31)])
+
+        self.assertEqual(geofence.update(b'W2GMD-1', 38.0, -122.4), [])
+        self.assertEqual(geofence.update(b'W2GMD-1', 37.72, -122.40), [
+            aprs.Transition(b'W2GMD-1', 'depot', True, 0, 0, 0)])
+        # Still inside, nothing fires:
+        self.assertEqual(geofence.update(b'W2GMD-1', 37.72, -122.39), [])
+        self.assertEqual(
+            geofence.update(b'W2GMD-1', 37.72, -122.32),
+            [aprs.Transition(b'W2GMD-1', 'yard', True, 0, 0, 0)])
+        self.assertEqual(geofence.inside(b'W2GMD-1'),
+                         frozenset(['depot', 'yard']))
+        self.assertEqual(
+            set(geofence.update(b'W2GMD-1', 37.78, -122.35)),
+            set([aprs.Transition(b'W2GMD-1', 'depot', False, 0, 0, 0),
+                 aprs.Transition(b'W2GMD-1', 'yard', False, 0, 0, 0)]))
+        self.assertEqual(geofence.inside(b'W2GMD-1'), frozenset())
+
+        self.assertEqual(len(fired), 4)
+        self.assertEqual(fired[0].timestamp, 5.0)
+        self.assertEqual(fired[0].lat, 37.72)
+        self.assertEqual(geofence.info(), {
+            'fences': 2, 'cells': 6, 'stations_inside': 0, 'updates': 5,
+            'transitions': 4})
+
+    def test_add_remove(self):
+        """
+        Tests replacing & removing Fences.
+        """
+        geofence = aprs.Geofence(cell_size=0.01)
+        geofence.add('depot', DEPOT)
+        cells = geofence.info()['cells']
+        geofence.update(b'W2GMD-1', 37.72, -122.40)
+        geofence.add('depot', DEPOT)
+        self.assertEqual(geofence.info()['cells'], cells)
+
+        geofence.remove('depot')
+        self.assertEqual(geofence.info()['cells'], 0)
+        self.assertEqual(geofence.inside(b'W2GMD-1'), frozenset())
+        self.assertEqual(geofence.fences_at(37.72, -122.40), frozenset())
+
+    def check_update_many(self):
+        """
+        Checks `update_many` against per-position `update` calls.
+        """
+        rand = random.Random(42)
+        scalar = aprs.Geofence(cell_size=0.05)
+        batched = aprs.Geofence(cell_size=0.05)
+        for idx in range(300):
+            lat = rand.uniform(36.0, 39.0)
+            lng = rand.uniform(-123.0, -121.0)
+            size = rand.uniform(0.01, 0.3)
+            points = [(lat, lng), (lat + size, lng + size / 3),
+                      (lat + size / 2, lng + size), (lat - size / 4, lng)]
+            scalar.add(idx, points)
+            batched.add(idx, points)
+
+        callsigns = [b'STN%d' % rand.randrange(50) for _ in range(3000)]
+        lats = [rand.uniform(36.0, 39.0) for _ in callsigns]
+        lngs = [rand.uniform(-123.0, -121.0) for _ in callsigns]
+        lats[7] = float('nan')
+
+        expected = []
+        for callsign, lat, lng in zip(callsigns, lats, lngs):
+            if lat == lat:
+                expected.extend(scalar.update(callsign, lat, lng, 1.0))
+        transitions = batched.update_many(callsigns, lats, lngs, 1.0)
+        self.assertTrue(expected)
+        # Order within one update is unspecified, across updates it's kept:
+        self.assertEqual(
+            sorted((t.callsign, t.fence_id, t.entered, t.lat)
+                   for t in transitions),
+            sorted((t.callsign, t.fence_id, t.entered, t.lat)
+                   for t in expected))
+        self.assertEqual([t.lat for t in transitions],
+                         [t.lat for t in expected])
+        self.assertEqual(batched.info(), scalar.info())
+
+    def test_update_many(self):
+        """
+        Tests batched updates, with NumPy if it's installed.
+        """
+        self.check_update_many()
+
+    def test_update_many_without_numpy(self):
+        """
+        Tests the pure-Python batched update fallback.
+        """
+        module = sys.modules['aprs.Geofence']
+        numpy = module.numpy
+        module.numpy = None
+        try:
+            self.check_update_many()
+        finally:
+            module.numpy = numpy
+
+    def test_update_frames(self):
+        """
+        Tests updating from Frames and from an `aprs.FrameBatch`.
+        """
+        lines = [b'W2GMD-1>APRS,TCPIP*:!3743.20N/12224.00W>',
+                 b'KF4ABC>APRS:>No position',
+                 b'N0CALL>APRS:!3800.00N/12224.00W>',
+                 b'W2GMD-1>APRS,TCPIP*:!3800.00N/12224.00W>']
+        for frames in ([aprs.Frame.parse(line) for line in lines],
+                       aprs.FrameBatch.from_lines(lines)):
+            geofence = aprs.Geofence(clock=lambda: 0.0)
+            geofence.add('depot', DEPOT)
+            transitions = geofence.update_frames(frames)
+            self.assertEqual(transitions, [
+                aprs.Transition(b'W2GMD-1', 'depot', True, 0, 0, 0),
+                aprs.Transition(b'W2GMD-1', 'depot', False, 0, 0, 0)])
+            self.assertEqual(geofence.info()['updates'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Hub Tests."""
+
+import asyncio
+import socket
+import threading
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class HubTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.Hub`."""
+
+    def test_fan_out(self):
+        """
+        Tests that every Subscription receives the same parsed Frame.
+        """
+        hub = aprs.Hub()
+        first = hub.subscribe()
+        second = hub.subscribe(frame_filter='p/W2GMD')
+        frame = aprs.Frame.parse('W2GMD-1>APRS,TCPIP*:>one')
+        other = aprs.Frame.parse('KF4ABC>APRS,TCPIP*:>two')
+        self.assertEqual(hub.publish(frame), 2)
+        self.assertEqual(hub.publish(other), 1)
+        self.assertIs(first.get(timeout=0), frame)
+        self.assertIs(second.get(timeout=0), frame)
+        self.assertIs(first.get(timeout=0), other)
+        self.assertIsNone(second.get(timeout=0))
+        self.assertEqual(second.info()['filtered'], 1)
+
+    def test_drop_policies(self):
+        """
+        Tests the 'oldest' and 'newest' drop policies.
+        """
+        hub = aprs.Hub()
+        oldest = hub.subscribe(maxsize=2, policy='oldest')
+        newest = hub.subscribe(maxsize=2, policy='newest')
+        for text in (b'one', b'two', b'three'):
+            hub.publish(text)
+        self.assertEqual(list(oldest._queue), [b'two', b'three'])
+        self.assertEqual(list(newest._queue), [b'one', b'two'])
+        self.assertEqual(oldest.info(), {
+            'delivered': 3, 'dropped': 1, 'filtered': 0, 'lag': 2,
+            'max_lag': 2, 'maxsize': 2})
+        self.assertEqual(newest.dropped, 1)
+        self.assertRaises(ValueError, hub.subscribe, policy='random')
+
+    def test_block_policy(self):
+        """
+        Tests that a 'block' Subscription waits for its consumer.
+        """
+        hub = aprs.Hub()
+        blocking = hub.subscribe(maxsize=1, policy='block')
+        publisher = threading.Thread(
+            target=lambda: [hub.publish(n) for n in range(5)])
+        publisher.start()
+        received = [blocking.get(timeout=5) for _ in range(5)]
+        publisher.join(5)
+        self.assertEqual(received, list(range(5)))
+        self.assertEqual(blocking.dropped, 0)
+
+    def test_run(self):
+        """
+        Tests running a Hub over an `aprs.TCP` upstream.
+        """
+        left, right = socket.socketpair()
+        try:
+            left.sendall(
+                b'# logresp W2GMD verified\r\n'
+                b'W2GMD-1>APRS,TCPIP*:>one\r\nKF4ABC>APRS,TCPIP*:>two\r\n')
+            left.close()
+            aprs_conn = aprs.TCP(b'W2GMD', b'-1')
+            aprs_conn.interface = right
+            hub = aprs.Hub(aprs_conn)
+            everything = hub.subscribe()
+            mine = hub.subscribe(frame_filter='b/W2GMD-1')
+            hub.run()
+            self.assertEqual([str(frame) for frame in everything], [
+                'W2GMD-1>APRS,TCPIP*:>one', 'KF4ABC>APRS,TCPIP*:>two'])
+            self.assertEqual(
+                [str(frame) for frame in mine], ['W2GMD-1>APRS,TCPIP*:>one'])
+            self.assertEqual(hub.info()['received'], 2)
+        finally:
+            right.close()
+
+    def test_run_async_block(self):
+        """
+        Tests a 'block' Subscription consumed on the event loop running the
+        Hub over an `aprs.AsyncTCP` upstream.
+        """
+        async def run():
+            aprs_conn = aprs.AsyncTCP(b'W2GMD', b'-1')
+            aprs_conn._reader = asyncio.StreamReader()
+            aprs_conn._reader.feed_data(b''.join(
+                b'W2GMD-%d>APRS,TCPIP*:>%d\r\n' % (n, n) for n in range(1, 6)))
+            aprs_conn._reader.feed_eof()
+            hub = aprs.Hub(aprs_conn)
+            blocking = hub.subscribe(maxsize=1, policy='block')
+            newest = hub.subscribe(maxsize=1, policy='newest')
+
+            async def consume():
+                return [str(frame) async for frame in blocking]
+
+            consumer = asyncio.ensure_future(consume())
+            await asyncio.wait_for(hub.run_async(), 5)
+            return await asyncio.wait_for(consumer, 5), blocking, newest
+
+        frames, blocking, newest = asyncio.run(run())
+        self.assertEqual(
+            frames, ['W2GMD-%d>APRS,TCPIP*:>%d' % (n, n) for n in range(1, 6)])
+        self.assertEqual(blocking.dropped, 0)
+        self.assertEqual(newest.dropped, 4)
+
+    def test_get_async(self):
+        """
+        Tests awaiting Frames published from another thread, and timeouts.
+        """
+        async def run():
+            hub = aprs.Hub()
+            subscription = hub.subscribe()
+            timed_out = await subscription.get_async(timeout=0.01)
+            loop = asyncio.get_running_loop()
+            publisher = loop.run_in_executor(None, hub.publish, b'one')
+            frame = await asyncio.wait_for(subscription.get_async(), 5)
+            await publisher
+            hub.close()
+            return timed_out, frame, await subscription.get_async()
+
+        self.assertEqual(asyncio.run(run()), (None, b'one', None))
+
+
+if __name__ == '__main__':
+    unittest.main()
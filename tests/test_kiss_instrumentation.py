@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module KISSInstrumentation Tests."""
+
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class FakeKISS(object):
+
+    """The read API of `kiss.KISS`, over canned device reads."""
+
+    def __init__(self, reads):
+        self.reads = list(reads)
+
+    def _read_handler(self, read_bytes=None):
+        return self.reads.pop(0) if self.reads else b''
+
+    def read(self, read_bytes=None, callback=None, readmode=True):
+        while self.reads:
+            frames = [frame for frame in
+                      self._read_handler(read_bytes).split(b'\xc0') if frame]
+            if not readmode:
+                return frames
+            for frame in frames:
+                callback(frame)
+        return None
+
+
+class InstrumentedKISS(aprs.KISSInstrumentation, FakeKISS):
+
+    """A `FakeKISS` with `aprs.KISSInstrumentation` mixed in."""
+
+    _transport = 'kiss_test'
+
+    def __init__(self, reads, metrics):
+        super(InstrumentedKISS, self).__init__(reads)
+        self._start_metrics(metrics)
+
+
+class KISSInstrumentationTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.KISSInstrumentation`."""
+
+    READS = [b'\xc0W2GMD-1>APRS:>one\xc0\xc0W2GMD-2>APRS:>two\xc0',
+             b'\xc0W2GMD-3>APRS:>three\xc0']
+
+    def test_read_traced(self):
+        """
+        Tests stamping each Frame delivered to a callback.
+        """
+        metrics = aprs.Metrics()
+        tracer = aprs.Tracer(metrics, envelopes=True)
+        kiss_conn = InstrumentedKISS(self.READS, metrics)
+        delivered = []
+        kiss_conn.read(callback=delivered.append,
+                       frame_handler=aprs.Frame.parse, tracer=tracer)
+
+        self.assertEqual([str(envelope.frame) for envelope in delivered], [
+            'W2GMD-1>APRS:>one', 'W2GMD-2>APRS:>two', 'W2GMD-3>APRS:>three'])
+        for envelope in delivered:
+            self.assertTrue(
+                0 < envelope.received <= envelope.framed <= envelope.parsed <=
+                envelope.filtered <= envelope.delivered)
+        # Frames of one device read share its receive stamp:
+        self.assertEqual(delivered[0].received, delivered[1].received)
+        self.assertLess(delivered[1].received, delivered[2].received)
+        self.assertEqual(delivered[2].received, kiss_conn.read_ns)
+        self.assertEqual(tracer.traced, 3)
+
+        info = metrics.info()
+        self.assertEqual(
+            info['aprs_kiss_frames_received_total{transport="kiss_test"}'], 3)
+        self.assertEqual(
+            info['aprs_kiss_bytes_received_total{transport="kiss_test"}'],
+            sum(len(data) for data in self.READS))
+        self.assertEqual(info['aprs_parse_seconds{transport="kiss_test"}'], 3)
+        self.assertEqual(
+            info['aprs_callback_seconds{transport="kiss_test"}'], 3)
+        self.assertEqual(info['aprs_trace_latency_seconds'], 3)
+
+    def test_read_returned(self):
+        """
+        Tests that `readmode=False` returns Frames, traced as they're
+        returned.
+        """
+        metrics = aprs.Metrics()
+        tracer = aprs.Tracer(metrics)
+        kiss_conn = InstrumentedKISS(self.READS, metrics)
+        frames = kiss_conn.read(readmode=False, tracer=tracer)
+        self.assertEqual(frames, [b'W2GMD-1>APRS:>one', b'W2GMD-2>APRS:>two'])
+        self.assertEqual(tracer.traced, 2)
+        self.assertEqual(kiss_conn.read(readmode=False),
+                         [b'W2GMD-3>APRS:>three'])
+        self.assertEqual(tracer.traced, 2)
+
+    def test_parse_error(self):
+        """
+        Tests that parse errors are counted and raised.
+        """
+        metrics = aprs.Metrics()
+        kiss_conn = InstrumentedKISS([b'\xc0not a frame\xc0'], metrics)
+        with self.assertRaises(ValueError):
+            kiss_conn.read(callback=lambda frame: None,
+                           frame_handler=aprs.Frame.parse)
+        self.assertEqual(
+            metrics.info()['aprs_parse_errors_total{transport="kiss_test"}'],
+            1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module APRS LazyFrame Tests."""
+
+import unittest  # pylint: disable=R0801
+import unittest.mock
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class LazyFrameTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.LazyFrame`."""
+
+    def test_lazy_fields(self):
+        """
+        Tests that fields are only decoded on access.
+        """
+        raw = b'W2GMD-6>APOTC1,WIDE1-1,WIDE2-1:!3745.94N/12228.05W>test'
+        frame = aprs.Frame.parse(raw, lazy=True)
+
+        self.assertIsInstance(frame, aprs.LazyFrame)
+        self.assertIsInstance(frame, aprs.Frame)
+        self.assertEqual(str(frame.source), 'W2GMD-6')
+        self.assertIsNone(frame._destination)  # pylint: disable=W0212
+        self.assertIsNone(frame._path)  # pylint: disable=W0212
+        self.assertIsNone(frame._info)  # pylint: disable=W0212
+
+        self.assertEqual(str(frame.destination), 'APOTC1')
+        self.assertEqual([str(p) for p in frame.path], ['WIDE1-1', 'WIDE2-1'])
+        self.assertEqual(frame.info.data_type, 'position_nots_nomsg')
+        self.assertEqual(str(frame), raw.decode())
+
+    def test_bytes_unmodified(self):
+        """
+        Tests that `bytes()` returns the original buffer.
+        """
+        raw = b'W2GMD-1>APRS:>test_bytes_unmodified'
+        frame = aprs.Frame.parse(raw, lazy=True)
+        frame.source  # pylint: disable=W0104
+        self.assertIs(bytes(frame), raw)
+
+    def test_modified(self):
+        """
+        Tests that setting a field re-serializes the Frame.
+        """
+        frame = aprs.Frame.parse('W2GMD-1>APRS:>test_modified', lazy=True)
+        frame.set_source('W2GMD-2')
+        frame.update_path('WIDE1-1')
+        self.assertTrue(frame.modified)
+        self.assertEqual(bytes(frame), b'W2GMD-2>APRS,WIDE1-1:>test_modified')
+        self.assertEqual(
+            frame.encode_ax25(),
+            aprs.Frame.parse(bytes(frame)).encode_ax25())
+
+    def test_modified_in_place(self):
+        """
+        Tests that changing a decoded field in place re-serializes the Frame.
+        """
+        raw = b'W2GMD-1>APRS,WIDE1-1:>test_modified_in_place'
+        frame = aprs.Frame.parse(raw, lazy=True)
+        frame.path.append(aprs.Callsign.parse('WIDE2-1'))
+        self.assertTrue(frame.modified)
+        self.assertEqual(
+            bytes(frame),
+            b'W2GMD-1>APRS,WIDE1-1,WIDE2-1:>test_modified_in_place')
+
+        frame = aprs.Frame.parse(raw, lazy=True)
+        frame.source.set_ssid('2')
+        self.assertEqual(
+            bytes(frame), b'W2GMD-2>APRS,WIDE1-1:>test_modified_in_place')
+
+        # Decoding every field leaves the raw Frame in use:
+        frame = aprs.Frame.parse(raw, lazy=True)
+        str(frame.source), str(frame.destination), frame.path, frame.info
+        self.assertFalse(frame.modified)
+        self.assertIs(bytes(frame), raw)
+
+    def test_unmodified_no_encoding(self):
+        """
+        Tests that decoded fields aren't re-encoded to check for changes,
+        and that a "-0" SSID doesn't count as one.
+        """
+        raw = b'W2GMD-0>APRS-0,WIDE1-1:>test_unmodified_no_encoding'
+        frame = aprs.Frame.parse(raw, lazy=True)
+        for field in ('source', 'destination', 'path', 'info'):
+            getattr(frame, field)
+        with unittest.mock.patch.object(
+                aprs.Callsign, '__bytes__', side_effect=AssertionError):
+            self.assertFalse(frame.modified)
+            self.assertIs(bytes(frame), raw)
+
+        frame.destination.set_ssid('1')
+        self.assertEqual(
+            bytes(frame), b'W2GMD>APRS-1,WIDE1-1:>test_unmodified_no_encoding')
+
+
+if __name__ == '__main__':
+    unittest.main()
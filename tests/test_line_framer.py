@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module LineFramer Tests."""
+
+import socket
+import threading
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class LineFramerTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.LineFramer`."""
+
+    def test_split_lines(self):
+        """
+        Tests framing complete lines, skipping empty ones.
+        """
+        framer = aprs.LineFramer()
+        framer.feed(
+            b'# aprsc 2.1\r\nW2GMD>APRS:>one\r\n\r\nW2GMD>APRS:>two\r\n')
+        lines = [bytes(line) for line in framer.lines()]
+        self.assertEqual(
+            lines, [b'# aprsc 2.1', b'W2GMD>APRS:>one', b'W2GMD>APRS:>two'])
+        self.assertEqual(len(framer), 0)
+
+    def test_partial_lines(self):
+        """
+        Tests lines and delimiters split across reads.
+        """
+        framer = aprs.LineFramer(size=8)
+        lines = []
+        for chunk in (b'W2GMD>AP', b'RS:>one\r', b'\nW2GMD>APRS:>t',
+                      b'wo\r\n'):
+            framer.feed(chunk)
+            lines.extend(bytes(line) for line in framer.lines())
+        self.assertEqual(lines, [b'W2GMD>APRS:>one', b'W2GMD>APRS:>two'])
+
+    def test_stop_early(self):
+        """
+        Tests that lines left behind when the consumer stops early are still
+        framed on their own later.
+        """
+        framer = aprs.LineFramer()
+        framer.feed(b'A\r\nB\r\nC')
+        for line in framer.lines():
+            self.assertEqual(bytes(line), b'A')
+            break
+        framer.feed(b'\r\n')
+        self.assertEqual([bytes(line) for line in framer.lines()],
+                         [b'B', b'C'])
+
+    def test_grow_with_live_views(self):
+        """
+        Tests that growing the buffer leaves earlier line views intact.
+        """
+        framer = aprs.LineFramer(size=16)
+        framer.feed(b'W2GMD>APRS:>one\r\n')
+        line = next(framer.lines())
+        framer.feed(b'W2GMD>APRS:>' + b'x' * 64 + b'\r\n')
+        self.assertEqual(bytes(line), b'W2GMD>APRS:>one')
+        self.assertEqual(
+            [bytes(line) for line in framer.lines()],
+            [b'W2GMD>APRS:>' + b'x' * 64])
+
+    def test_recv_into(self):
+        """
+        Tests reading straight from a socket.
+        """
+        left, right = socket.socketpair()
+        try:
+            left.sendall(b'W2GMD>APRS:>one\r\nW2GMD>APRS:>tw')
+            left.close()
+            framer = aprs.LineFramer()
+            lines = []
+            while framer.recv_into(right):
+                lines.extend(bytes(line) for line in framer.lines())
+            self.assertEqual(lines, [b'W2GMD>APRS:>one'])
+            self.assertEqual(len(framer), len(b'W2GMD>APRS:>tw'))
+        finally:
+            right.close()
+
+    def test_tcp_receive(self):
+        """
+        Tests `aprs.TCP.receive` delivering framed lines to a callback.
+        """
+        left, right = socket.socketpair()
+        try:
+            left.sendall(
+                b'# logresp W2GMD verified\r\nW2GMD-1>APRS,TCPIP*:>one\r\n')
+            left.close()
+            aprs_conn = aprs.TCP(b'W2GMD', b'-1')
+            aprs_conn.interface = right
+            frames = []
+            aprs_conn.receive(callback=frames.append)
+            self.assertEqual(len(frames), 1)
+            self.assertEqual(str(frames[0]), 'W2GMD-1>APRS,TCPIP*:>one')
+        finally:
+            right.close()
+
+    def test_tcp_start_keeps_frames(self):
+        """
+        Tests that Frames arriving in the same read as logresp are each
+        delivered on their own.
+        """
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        sent = threading.Event()
+
+        def serve():
+            """Logs the client in, with Frames right behind logresp."""
+            conn, _ = listener.accept()
+            with conn:
+                conn.sendall(b'# aprsc 2.1\r\n')
+                conn.makefile('rb').readline()
+                conn.sendall(b'# logresp W2GMD verified\r\nA>B:one\r\n'
+                             b'C>D:two\r\n')
+                sent.wait(5)
+                conn.sendall(b'E>F:three\r\n')
+
+        server = threading.Thread(target=serve, daemon=True)
+        server.start()
+        try:
+            aprs_conn = aprs.TCP(
+                b'W2GMD', b'-1',
+                servers=[b'127.0.0.1:%d' % listener.getsockname()[1]])
+            aprs_conn.start()
+            sent.set()
+            lines = []
+            aprs_conn.receive(callback=lines.append, frame_handler=None)
+            aprs_conn.interface.close()
+            self.assertEqual(lines, [b'A>B:one', b'C>D:two', b'E>F:three'])
+        finally:
+            server.join(5)
+            listener.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
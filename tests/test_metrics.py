@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Metrics Tests."""
+
+import socket
+import unittest  # pylint: disable=R0801
+import urllib.request
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class MetricsTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.Metrics`."""
+
+    def test_registry(self):
+        """
+        Tests that metrics are shared by name & labels.
+        """
+        metrics = aprs.Metrics()
+        counter = metrics.counter('frames_total', 'Frames.', {'a': 'b'})
+        self.assertIs(metrics.counter('frames_total', labels={'a': 'b'}),
+                      counter)
+        self.assertIsNot(metrics.counter('frames_total', labels={'a': 'c'}),
+                         counter)
+        with self.assertRaises(ValueError):
+            metrics.gauge('frames_total', labels={'a': 'b'})
+        metrics.gauge('queued')
+        with self.assertRaises(ValueError):
+            metrics.counter('queued')
+        with self.assertRaises(ValueError):
+            metrics.histogram('queued')
+        self.assertEqual(len(metrics), 3)
+
+        metrics.unregister(counter)
+        self.assertEqual(len(metrics), 2)
+        self.assertIsNot(metrics.counter('frames_total', labels={'a': 'b'}),
+                         counter)
+
+    def test_histogram(self):
+        """
+        Tests Histogram buckets, quantiles & export.
+        """
+        metrics = aprs.Metrics()
+        histogram = metrics.histogram('parse_seconds', buckets=(0.1, 1))
+        for value in (0.05, 0.05, 0.5, 5):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [2, 1, 1])
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertEqual(histogram.quantile(0.75), 1)
+        self.assertEqual(histogram.quantile(1), float('inf'))
+        self.assertEqual(metrics.export(), '\n'.join([
+            '# TYPE parse_seconds histogram',
+            'parse_seconds_bucket{le="0.1"} 2.0',
+            'parse_seconds_bucket{le="1.0"} 3.0',
+            'parse_seconds_bucket{le="+Inf"} 4.0',
+            'parse_seconds_sum 5.6',
+            'parse_seconds_count 4.0',
+            '']))
+
+    def test_export(self):
+        """
+        Tests the Prometheus text format of Counters & Gauges.
+        """
+        metrics = aprs.Metrics()
+        metrics.counter('sent_total', 'Sent.', {'transport': 'udp'}).inc(2)
+        metrics.counter('sent_total', 'Sent.', {'transport': 'tcp'}).inc()
+        metrics.gauge('depth', 'Queue "depth".').set_function(lambda: 7)
+        self.assertEqual(metrics.export(), '\n'.join([
+            '# HELP depth Queue "depth".',
+            '# TYPE depth gauge',
+            'depth 7.0',
+            '# HELP sent_total Sent.',
+            '# TYPE sent_total counter',
+            'sent_total{transport="udp"} 2.0',
+            'sent_total{transport="tcp"} 1.0',
+            '']))
+        self.assertEqual(metrics.info()['sent_total{transport="tcp"}'], 1)
+
+    def test_serve(self):
+        """
+        Tests the HTTP endpoint.
+        """
+        metrics = aprs.Metrics()
+        metrics.counter('up').inc()
+        server = metrics.serve(port=0)
+        try:
+            with urllib.request.urlopen(
+                    'http://%s:%d/metrics' % server.server_address) as resp:
+                self.assertEqual(resp.read(), b'# TYPE up counter\nup 1.0\n')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_tcp_receive(self):
+        """
+        Tests the metrics updated by `aprs.TCP.receive`.
+        """
+        left, right = socket.socketpair()
+        try:
+            data = (b'# logresp W2GMD verified\r\n'
+                    b'W2GMD-1>APRS,TCPIP*:>one\r\n'
+                    b'W2GMD-1>APRS,qAR,W2GMD:>one\r\n'
+                    b'W2GMD-1>APRS,TCPIP*:>two\r\n')
+            left.sendall(data)
+            left.close()
+            metrics = aprs.Metrics()
+            aprs_conn = aprs.TCP(b'W2GMD', b'-1', metrics=metrics)
+            aprs_conn.interface = right
+            frames = []
+            aprs_conn.receive(callback=frames.append,
+                              dupe_filter=aprs.DupeFilter())
+            self.assertEqual(len(frames), 2)
+            info = metrics.info()
+            self.assertEqual(
+                info['aprs_lines_received_total{transport="tcp"}'], 4)
+            self.assertEqual(
+                info['aprs_bytes_received_total{transport="tcp"}'], len(data))
+            self.assertEqual(
+                info['aprs_comments_received_total{transport="tcp"}'], 1)
+            self.assertEqual(info['aprs_duplicates_total{transport="tcp"}'], 1)
+            self.assertEqual(info['aprs_parse_seconds{transport="tcp"}'], 2)
+            self.assertEqual(info['aprs_callback_seconds{transport="tcp"}'], 2)
+        finally:
+            right.close()
+
+    def test_pipeline_parse_errors(self):
+        """
+        Tests that `aprs.ReceivePipeline` counts parse errors, and exports
+        its queue depths only while it runs.
+        """
+        left, right = socket.socketpair()
+        try:
+            left.sendall(b'W2GMD-1>APRS,TCPIP*:>one\r\nnot a frame\r\n')
+            left.close()
+            metrics = aprs.Metrics()
+            aprs_conn = aprs.TCP(b'W2GMD', b'-1', metrics=metrics)
+            aprs_conn.interface = right
+            running = []
+            aprs_conn.receive(
+                callback=lambda frame: running.append(metrics.info()),
+                workers=2)
+            info = metrics.info()
+            self.assertEqual(info['aprs_parse_errors_total{transport="tcp"}'],
+                             1)
+            gauges = [key for key in running[0]
+                      if key.startswith('aprs_pipeline_lines_queued')]
+            self.assertEqual(len(gauges), 1)
+            self.assertIn('{pipeline="', gauges[0])
+            self.assertNotIn(gauges[0], info)
+        finally:
+            right.close()
+
+    def test_udp_send(self):
+        """
+        Tests the metrics updated by `aprs.UDP.send`.
+        """
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            receiver.bind(('127.0.0.1', 0))
+            metrics = aprs.Metrics()
+            aprs_conn = aprs.UDP(b'W2GMD', b'-1', '127.0.0.1',
+                                 receiver.getsockname()[1], metrics=metrics)
+            aprs_conn.start()
+            sent = aprs_conn.send(b'W2GMD-1>APRS:>test')
+            aprs_conn.interface.close()
+            info = metrics.info()
+            self.assertEqual(info['aprs_frames_sent_total{transport="udp"}'],
+                             1)
+            self.assertEqual(info['aprs_bytes_sent_total{transport="udp"}'],
+                             sent)
+        finally:
+            receiver.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Python APRS Module Position Decoding Tests.
+
+Examples per ftp://ftp.tapr.org/aprssig/aprsspec/spec/aprs101/APRS101.pdf
+"""
+
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class PositionTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.Position`."""
+
+    def test_uncompressed(self):
+        """
+        Tests decoding uncompressed positions, with & without timestamps.
+        """
+        for info in (b'!4903.50N/07201.75W-Test /A=001234',
+                     b'=4903.50N/07201.75W-Test /A=001234',
+                     b'/092345z4903.50N/07201.75W-Test /A=001234',
+                     b'@092345z4903.50N/07201.75W-Test /A=001234'):
+            position = aprs.Position.parse(info)
+            self.assertEqual(position.format, 'uncompressed')
+            self.assertAlmostEqual(position.lat, 49.058333, places=5)
+            self.assertAlmostEqual(position.lng, -72.029167, places=5)
+            self.assertEqual(position.table, b'/')
+            self.assertEqual(position.symbol, b'-')
+            self.assertEqual(position.altitude, 1234)
+            self.assertEqual(position.comment, b'Test /A=001234')
+
+    def test_uncompressed_course_speed(self):
+        """
+        Tests decoding the course/speed extension.
+        """
+        position = aprs.Position.parse(b'!3745.94S/12228.05E>118/010/comment')
+        self.assertAlmostEqual(position.lat, -37.765667, places=5)
+        self.assertAlmostEqual(position.lng, 122.4675, places=5)
+        self.assertEqual(position.course, 118)
+        self.assertEqual(position.speed, 10)
+        self.assertEqual(position.comment, b'/comment')
+
+    def test_uncompressed_ambiguity(self):
+        """
+        Tests decoding an ambiguous position.
+        """
+        position = aprs.Position.parse(b'!49  .  N/072  .  W-')
+        self.assertEqual(position.ambiguity, 4)
+        self.assertEqual(position.lat, 49.0)
+        self.assertEqual(position.lng, -72.0)
+
+    def test_compressed(self):
+        """
+        Tests decoding compressed positions with course/speed & altitude.
+        """
+        position = aprs.Position.parse(b'=/5L!!<*e7>7P[')
+        self.assertEqual(position.format, 'compressed')
+        self.assertAlmostEqual(position.lat, 49.5, places=4)
+        self.assertAlmostEqual(position.lng, -72.75, places=4)
+        self.assertEqual(position.symbol, b'>')
+        self.assertEqual(position.course, 88)
+        self.assertAlmostEqual(position.speed, 36.2, places=1)
+
+        position = aprs.Position.parse(b'!/5L!!<*e7OS]S')
+        self.assertEqual(int(position.altitude), 10004)
+
+        # cs & type bytes must be base-91 digits, '!' to '{':
+        for info in (b'=/5L!!<*e7>7\x1f[', b'=/5L!!<*e7>7P~'):
+            with self.assertRaises(aprs.BadPositionError):
+                aprs.Position.parse(info)
+
+    def test_mice(self):
+        """
+        Tests decoding a Mic-E position.
+        """
+        position = aprs.Position.parse(b'`(_fn"Oj/]"4-}', b'S32U6T')
+        self.assertEqual(position.format, 'mice')
+        self.assertAlmostEqual(position.lat, 33.427333, places=5)
+        self.assertAlmostEqual(position.lng, -(12 + 7.74 / 60), places=5)
+        self.assertEqual(position.speed, 20)
+        self.assertEqual(position.course, 251)
+        self.assertEqual(position.table, b'/')
+        self.assertEqual(position.symbol, b'j')
+        self.assertAlmostEqual(position.altitude, 22 * 3.28084, places=3)
+
+    def test_objects_and_items(self):
+        """
+        Tests decoding Object & Item positions.
+        """
+        position = aprs.Position.parse(
+            b';LEADER   *092345z4903.50N/07201.75W>088/036')
+        self.assertAlmostEqual(position.lat, 49.058333, places=5)
+        self.assertEqual(position.course, 88)
+        position = aprs.Position.parse(b')AID #2!4903.50N/07201.75WA')
+        self.assertEqual(position.symbol, b'A')
+
+    def test_no_position(self):
+        """
+        Tests Data Types without a position, and malformed positions.
+        """
+        self.assertIsNone(aprs.Position.parse(b'>status'))
+        self.assertIsNone(aprs.Position.parse(b''))
+        with self.assertRaises(aprs.BadPositionError):
+            aprs.Position.parse(b'!4903.50X/07201.75W-')
+        with self.assertRaises(aprs.BadPositionError):
+            aprs.Position.parse(b'!9903.50N/07201.75W-')
+
+    def test_decode_batch(self):
+        """
+        Tests decoding a FrameBatch into columns.
+        """
+        batch = aprs.FrameBatch.from_lines([
+            b'W2GMD-6>APOTC1,WIDE1-1:!3745.94N/12228.05W>118/010/',
+            b'W2GMD-7>S32U6T,WIDE1-1:`(_fn"Oj/]"4-}',
+            b'W2GMD-8>APRS:>status',
+        ])
+        columns = aprs.Position.decode_batch(batch)
+        self.assertEqual(list(columns['valid']), [True, True, False])
+        self.assertAlmostEqual(columns['lat'][0], 37.765667, places=5)
+        self.assertAlmostEqual(columns['lat'][1], 33.427333, places=5)
+        self.assertEqual(columns['course'][0], 118)
+        self.assertNotEqual(columns['lat'][2], columns['lat'][2])  # NaN
+
+        columns = aprs.Position.decode_batch([b'!4903.50N/07201.75W-', b'x'])
+        self.assertEqual(list(columns['valid']), [True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module ReceivePipeline Tests."""
+
+import random
+import socket
+import threading
+import time
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class ReceivePipelineTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.ReceivePipeline`."""
+
+    def _connect(self, data: bytes) -> 'aprs.TCP':
+        left, right = socket.socketpair()
+        self.addCleanup(right.close)
+
+        def write():
+            left.sendall(data)
+            left.close()
+        threading.Thread(target=write, daemon=True).start()
+
+        aprs_conn = aprs.TCP(b'W2GMD', b'-1')
+        aprs_conn.interface = right
+        return aprs_conn
+
+    def test_ordered(self):
+        """
+        Tests that Frames are delivered in order despite uneven parse times.
+        """
+        lines = [b'W2GMD-%d>APRS,TCPIP*:>%d' % (n % 15 + 1, n)
+                 for n in range(200)]
+        aprs_conn = self._connect(
+            b'# logresp W2GMD verified\r\n' + b'\r\n'.join(lines) + b'\r\n')
+
+        def slow_parse(line):
+            time.sleep(random.random() / 1000)
+            return aprs.Frame.parse(line)
+
+        frames = []
+        pipeline = aprs.ReceivePipeline(
+            aprs_conn, frames.append, slow_parse, workers=4, queue_size=8)
+        pipeline.run()
+
+        self.assertEqual([bytes(frame) for frame in frames], lines)
+        info = pipeline.info()
+        self.assertEqual(info['read'], 200)
+        self.assertEqual(info['dispatched'], 200)
+        self.assertEqual(info['lines_queued'], 0)
+        self.assertEqual(info['pending'], 0)
+
+    def test_receive_workers(self):
+        """
+        Tests `aprs.TCP.receive` with parse workers, skipping bad Frames.
+        """
+        aprs_conn = self._connect(
+            b'W2GMD-1>APRS:>one\r\nnot a frame\r\nW2GMD-2>APRS:>two\r\n')
+        frames = []
+        aprs_conn.receive(callback=frames.append, workers=2)
+        self.assertEqual(
+            [str(frame) for frame in frames],
+            ['W2GMD-1>APRS:>one', 'W2GMD-2>APRS:>two'])
+
+    def test_callback_error(self):
+        """
+        Tests that a callback exception stops the pipeline and is re-raised,
+        without waiting for more data on the connection.
+        """
+        left, right = socket.socketpair()
+        self.addCleanup(left.close)
+        self.addCleanup(right.close)
+        left.sendall(b'W2GMD-1>APRS:>one\r\nW2GMD-2>APRS:>two\r\n')
+        aprs_conn = aprs.TCP(b'W2GMD', b'-1')
+        aprs_conn.interface = right
+
+        def callback(frame):
+            raise KeyError(str(frame))
+
+        pipeline = aprs.ReceivePipeline(aprs_conn, callback)
+        with self.assertRaises(KeyError):
+            pipeline.run()
+        self.assertEqual(pipeline.info()['dispatched'], 1)
+
+    def test_reader_error(self):
+        """
+        Tests that a socket error is re-raised after the Frames read before
+        it are delivered.
+        """
+        class BrokenSocket(object):
+            """Returns one read, then fails."""
+
+            def __init__(self):
+                self.reads = [b'W2GMD-1>APRS:>one\r\n']
+
+            def recv_into(self, view):
+                """Fills `view`, or fails once out of reads."""
+                if not self.reads:
+                    raise ConnectionResetError('reset')
+                data = self.reads.pop()
+                view[:len(data)] = data
+                return len(data)
+
+        aprs_conn = aprs.TCP(b'W2GMD', b'-1')
+        aprs_conn.interface = BrokenSocket()
+        frames = []
+        with self.assertRaises(ConnectionResetError):
+            aprs_conn.receive(callback=frames.append, workers=2)
+        self.assertEqual([str(frame) for frame in frames],
+                         ['W2GMD-1>APRS:>one'])
+
+
+if __name__ == '__main__':
+    unittest.main()
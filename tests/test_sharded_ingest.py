@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module ShardedIngest Tests."""
+
+import itertools
+import threading
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class ShardedIngestTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.ShardedIngest`."""
+
+    def test_map(self):
+        """
+        Tests that every Frame is parsed, keeping per-station order.
+        """
+        lines = [b'W2GMD-%d>APRS,TCPIP*,qAC,T2TEST:>%d' % (n % 7 + 1, n)
+                 for n in range(500)]
+        lines.insert(250, b'not a frame')
+        ingest = aprs.ShardedIngest(workers=3, batch_size=16)
+        records = list(ingest.map(lines))
+
+        self.assertEqual(len(records), 500)
+        self.assertEqual(ingest.info(), {
+            'workers': 3, 'read': 501, 'records': 500, 'errors': 1})
+        for ssid in range(1, 8):
+            sequence = [int(record[3][1:]) for record in records
+                        if record[0] == b'W2GMD-%d' % ssid]
+            self.assertEqual(sequence, list(range(ssid - 1, 500, 7)))
+
+    def test_decode_to_frame(self):
+        """
+        Tests the decode stage and rebuilding Frames from records.
+        """
+        line = b'W2GMD-6>APRS,TCPIP*,qAC,T2TEST:!4042.77N/07400.36W-Test'
+        ingest = aprs.ShardedIngest(
+            workers=2, decode=aprs.Position.from_frame)
+        record, = ingest.map([line])
+        self.assertEqual(
+            record[:4],
+            (b'W2GMD-6', b'APRS', b'TCPIP*,qAC,T2TEST',
+             b'!4042.77N/07400.36W-Test'))
+        self.assertAlmostEqual(record[4].lat, 40.712833, 5)
+        self.assertEqual(bytes(ingest.to_frame(record)), line)
+
+    def test_stop_early(self):
+        """
+        Tests that a consumer stopping early doesn't leak the feeder thread
+        blocked on a full inbox.
+        """
+        lines = itertools.cycle([b'W2GMD-1>APRS:>one', b'KF4ABC>APRS:>two'])
+        ingest = aprs.ShardedIngest(workers=2, batch_size=4, queue_size=1)
+        records = ingest.map(lines)
+        self.assertEqual(len(list(itertools.islice(records, 10))), 10)
+        records.close()
+        self.assertEqual(
+            [thread for thread in threading.enumerate()
+             if thread.name == 'ShardedIngest feeder'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module SpatialIndex Tests."""
+
+import random
+import sys
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs.geo_util  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class SpatialIndexTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.SpatialIndex`."""
+
+    def setUp(self):  # pylint: disable=C0103
+        """Builds random points, clustered around a few cities."""
+        super(SpatialIndexTestCase, self).setUp()
+        rand = random.Random(42)
+        self.points = {}
+        for idx in range(3000):
+            if idx % 3:
+                lat, lng = rand.choice([(37.7, -122.4), (51.5, -0.1),
+                                        (-33.9, 151.2), (64.8, -179.9)])
+                lat += rand.uniform(-2, 2)
+                lng = (lng + rand.uniform(-2, 2) + 180) % 360 - 180
+            else:
+                lat = rand.uniform(-90, 90)
+                lng = rand.uniform(-180, 180)
+            self.points[b'STN%d' % idx] = (lat, lng)
+
+    def check_queries(self):
+        """Checks every query against a brute-force scan."""
+        distance = aprs.geo_util.distance
+        index = aprs.SpatialIndex(cell_size=0.5)
+        for key, (lat, lng) in self.points.items():
+            index.insert(key, lat, lng)
+
+        for lat, lng, km in ((37.7, -122.4, 50), (64.8, 179.9, 300),
+                             (89.5, 0, 500), (0, 0, 5000)):
+            expected = sorted(
+                key for key, (plat, plng) in self.points.items()
+                if distance(lat, lng, plat, plng) <= km)
+            results = index.radius(lat, lng, km)
+            self.assertEqual(sorted(key for key, _ in results), expected)
+            self.assertEqual([dist for _, dist in results],
+                             sorted(dist for _, dist in results))
+
+        for south, west, north, east in ((37, -123, 38, -122),
+                                         (60, 178, 70, -178)):
+            expected = sorted(
+                key for key, (plat, plng) in self.points.items()
+                if south <= plat <= north and
+                (west <= plng <= east if west <= east
+                 else plng >= west or plng <= east))
+            self.assertTrue(expected)
+            self.assertEqual(sorted(index.bbox(south, west, north, east)),
+                             expected)
+
+        expected = sorted(
+            (distance(10, 20, plat, plng), key)
+            for key, (plat, plng) in self.points.items())[:5]
+        self.assertEqual([key for key, _ in index.nearest(10, 20, 5)],
+                         [key for _, key in expected])
+
+    def test_queries(self):
+        """
+        Tests radius, bbox & nearest queries, with NumPy if it's installed.
+        """
+        self.check_queries()
+
+    def test_queries_without_numpy(self):
+        """
+        Tests the pure-Python query fallbacks.
+        """
+        # `aprs.SpatialIndex` is the class, so reach for the module:
+        module = sys.modules['aprs.SpatialIndex']
+        numpy = module.numpy
+        module.numpy = None
+        try:
+            self.check_queries()
+        finally:
+            module.numpy = numpy
+
+    def test_move_delete(self):
+        """
+        Tests moving & deleting points, and slot reuse.
+        """
+        index = aprs.SpatialIndex(cell_size=1)
+        index.insert(b'W2GMD-1', 37.7, -122.4)
+        index.insert(b'KF4ABC', 37.8, -122.3)
+        index.move(b'W2GMD-1', 40.7, -74.0)
+        self.assertEqual(index.position(b'W2GMD-1'), (40.7, -74.0))
+        self.assertEqual([key for key, _ in index.radius(37.7, -122.4, 50)],
+                         [b'KF4ABC'])
+        self.assertEqual(index.bbox(40, -75, 41, -73), [b'W2GMD-1'])
+
+        index.delete(b'KF4ABC')
+        self.assertNotIn(b'KF4ABC', index)
+        self.assertEqual(index.radius(37.7, -122.4, 50), [])
+        index.insert(b'N0CALL', 0, 0)
+        self.assertEqual(index.info(), {
+            'points': 2, 'slots': 2, 'free': 0, 'cells': 2})
+        self.assertEqual(index.nearest(0, 1, 10)[0][0], b'N0CALL')
+        self.assertEqual(len(index.nearest(0, 1, 10)), 2)
+
+        with self.assertRaises(aprs.BadPositionError):
+            index.insert(b'N0CALL', 91, 0)
+
+    def test_from_station_table(self):
+        """
+        Tests indexing the positions of an `aprs.StationTable`.
+        """
+        table = aprs.StationTable()
+        table.update(aprs.Frame.parse(
+            'W2GMD-1>APRS,TCPIP*:!3745.75NI12228.05W#'))
+        table.update(aprs.Frame.parse('KF4ABC>APRS:>No position'))
+        index = aprs.SpatialIndex.from_station_table(table)
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.nearest(37.7, -122.4)[0][0], b'W2GMD-1')
+
+
+if __name__ == '__main__':
+    unittest.main()
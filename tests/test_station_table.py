@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module StationTable Tests."""
+
+import math
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class StationTableTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.StationTable`."""
+
+    def test_update(self):
+        """
+        Tests recording position, symbol, info & heard-via from Frames.
+        """
+        table = aprs.StationTable(ttl=60, clock=lambda: 1000.0)
+        station = table.update(aprs.Frame.parse(
+            'W2GMD-1>APRS,WIDE1-1,N5ABC-3*,WIDE2*,qAR,K6ABC:'
+            '!3745.75NI12228.05W#PHG'))
+        self.assertEqual(station.callsign, b'W2GMD-1')
+        self.assertAlmostEqual(station.lat, 37.7625)
+        self.assertAlmostEqual(station.lng, -122.4675)
+        self.assertEqual(station.symbol, b'I#')
+        self.assertEqual(station.heard_via, b'K6ABC')
+        self.assertEqual(station.heard, 1000.0)
+
+        # A status Frame keeps the last position:
+        table.update(aprs.Frame.parse(
+            'W2GMD-1>APRS,N5ABC-3*,WIDE2-1:>Status'), timestamp=1010.0)
+        station = table['W2GMD-1']
+        self.assertEqual(station.info, b'>Status')
+        self.assertEqual(station.heard_via, b'N5ABC-3')
+        self.assertAlmostEqual(station.position[0], 37.7625)
+        self.assertEqual(station.heard, 1010.0)
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.info()['updates'], 2)
+
+    def test_no_position(self):
+        """
+        Tests a station never heard with a position.
+        """
+        table = aprs.StationTable()
+        station = table.update(aprs.Frame.parse('KF4ABC>APRS:>Status'))
+        self.assertIsNone(station.position)
+        self.assertTrue(math.isnan(station.lat))
+        self.assertEqual(station.symbol, b'')
+        self.assertEqual(station.heard_via, b'')
+        self.assertIsNone(table.get(b'N0CALL'))
+        self.assertIn(b'KF4ABC', table)
+
+    def test_ttl(self):
+        """
+        Tests TTL eviction through the timing wheel, and slot reuse.
+        """
+        now = [0.0]
+        table = aprs.StationTable(ttl=60, resolution=10, clock=lambda: now[0])
+        table.update(aprs.Frame.parse('W2GMD-1>APRS:>one'))
+        table.update(aprs.Frame.parse('KF4ABC>APRS:>one'))
+
+        now[0] = 50.0
+        table.update(aprs.Frame.parse('KF4ABC>APRS:>two'))
+        now[0] = 75.0
+        self.assertEqual(table.expire(), 1)
+        self.assertNotIn('W2GMD-1', table)
+        self.assertIn('KF4ABC', table)
+
+        table.update(aprs.Frame.parse('N0CALL>APRS:>three'))
+        self.assertEqual(table.info()['slots'], 2)
+        self.assertEqual(table['N0CALL'].info, b'>three')
+
+        # Long idle gap, everything ages out:
+        now[0] = 10000.0
+        self.assertEqual(table.expire(), 2)
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.evictions, 3)
+
+    def test_out_of_order(self):
+        """
+        Tests that a late Frame neither overwrites the station, nor moves
+        last heard backwards, nor refiles it for earlier eviction.
+        """
+        table = aprs.StationTable(ttl=60, resolution=10)
+        table.update(aprs.Frame.parse(
+            'W2GMD-1>APRS,qAR,K6ABC:!3745.75NI12228.05W#'), 1000.0)
+        table.update(aprs.Frame.parse(
+            'W2GMD-1>APRS,qAR,N0CALL:!3800.00N/12224.00W>'), 900.0)
+        table.update(aprs.Frame.parse('W2GMD-1>APRS:>one'), 500.0)
+        station = table['W2GMD-1']
+        self.assertEqual(station.heard, 1000.0)
+        self.assertEqual(station.info, b'!3745.75NI12228.05W#')
+        self.assertAlmostEqual(station.position[0], 37.7625)
+        self.assertEqual(station.symbol, b'I#')
+        self.assertEqual(station.heard_via, b'K6ABC')
+        self.assertEqual(table.info()['updates'], 3)
+        self.assertEqual(table.expire(1050.0), 0)
+        self.assertIn('W2GMD-1', table)
+        self.assertEqual(table.expire(1100.0), 1)
+
+    def test_remove(self):
+        """
+        Tests removing a station.
+        """
+        table = aprs.StationTable(ttl=60, clock=lambda: 0.0)
+        table.update(aprs.Frame.parse('W2GMD-1>APRS:>one'))
+        table.remove(b'W2GMD-1')
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.expire(1000.0), 0)
+        self.assertEqual(list(table), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module Tracer Tests."""
+
+import socket
+import time
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+class TracerTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.Tracer` & `aprs.Envelope`."""
+
+    @staticmethod
+    def _receive(callback=None, **kwargs) -> list:
+        left, right = socket.socketpair()
+        try:
+            left.sendall(b'# logresp W2GMD verified\r\n'
+                         b'W2GMD-1>APRS,TCPIP*:>one\r\n'
+                         b'KF4ABC>APRS,TCPIP*:>two\r\n'
+                         b'W2GMD-2>APRS,TCPIP*:>three\r\n')
+            left.close()
+            aprs_conn = aprs.TCP(b'W2GMD', b'-1', metrics=aprs.Metrics())
+            aprs_conn.interface = right
+            delivered = []
+            aprs_conn.receive(callback=callback or delivered.append, **kwargs)
+            return delivered
+        finally:
+            right.close()
+
+    def test_envelope(self):
+        """
+        Tests Envelope latency & per-stage breakdown.
+        """
+        envelope = aprs.Envelope(b'frame', received=100, framed=150)
+        envelope.parsed = 400
+        envelope.filtered = 410
+        envelope.delivered = 1000
+        self.assertEqual(envelope.latency, 900)
+        self.assertEqual(envelope.stages(), {
+            'framed': 50, 'parsed': 250, 'filtered': 10, 'delivered': 590})
+
+    def test_receive_envelopes(self):
+        """
+        Tests stamping & filtering in `aprs.TCP.receive`.
+        """
+        metrics = aprs.Metrics()
+        tracer = aprs.Tracer(metrics, envelopes=True)
+        delivered = self._receive(frame_filter='b/W2GMD-*', tracer=tracer)
+        self.assertEqual([str(envelope.frame) for envelope in delivered], [
+            'W2GMD-1>APRS,TCPIP*:>one', 'W2GMD-2>APRS,TCPIP*:>three'])
+        for envelope in delivered:
+            self.assertTrue(
+                0 < envelope.received <= envelope.framed <= envelope.parsed <=
+                envelope.filtered <= envelope.delivered)
+        self.assertEqual(tracer.info(), {'traced': 2, 'slow': 0,
+                                         'sampled': 0})
+        self.assertEqual(
+            metrics.info()['aprs_trace_stage_seconds{stage="parsed"}'], 2)
+        self.assertEqual(metrics.info()['aprs_trace_latency_seconds'], 2)
+
+    def test_receive_frames(self):
+        """
+        Tests that a Tracer without `envelopes` still delivers Frames.
+        """
+        tracer = aprs.Tracer(aprs.Metrics())
+        delivered = self._receive(tracer=tracer)
+        self.assertEqual(len(delivered), 3)
+        self.assertIsInstance(delivered[0], aprs.Frame)
+        self.assertEqual(tracer.traced, 3)
+
+    def test_slow_sampler(self):
+        """
+        Tests that slow Frames are sampled, and logged at most once per
+        interval.
+        """
+        tracer = aprs.Tracer(aprs.Metrics(), slow_ms=1, sample_size=2,
+                             sample_interval=60)
+        with self.assertLogs('aprs.Tracer', 'WARNING') as logs:
+            self._receive(callback=lambda frame: time.sleep(0.002),
+                          tracer=tracer)
+        self.assertEqual(tracer.slow_count, 3)
+        self.assertEqual(len(tracer.slow), 2)
+        self.assertEqual(len(logs.output), 1)
+
+    def test_pipeline(self):
+        """
+        Tests tracing through `aprs.ReceivePipeline`.
+        """
+        tracer = aprs.Tracer(aprs.Metrics(), envelopes=True)
+        delivered = self._receive(workers=2, frame_filter='b/KF4ABC',
+                                  tracer=tracer)
+        self.assertEqual(len(delivered), 1)
+        self.assertEqual(str(delivered[0].frame), 'KF4ABC>APRS,TCPIP*:>two')
+        self.assertGreater(delivered[0].delivered, delivered[0].received)
+        self.assertEqual(tracer.traced, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
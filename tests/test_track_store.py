@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Python APRS Module TrackStore Tests."""
+
+import math
+import sys
+import unittest  # pylint: disable=R0801
+
+import aprs  # pylint: disable=R0801
+import aprs_test_classes  # pylint: disable=R0801
+
+__author__ = 'Greg Albrecht W2GMD <oss@undef.net>'  # NOQA pylint: disable=R0801
+__copyright__ = 'Copyright 2017 Greg Albrecht and Contributors'  # NOQA pylint: disable=R0801
+__license__ = 'Apache License, Version 2.0'  # NOQA pylint: disable=R0801
+
+
+@unittest.skipIf(sys.modules['aprs.TrackStore'].numpy is None,
+                 'TrackStore requires NumPy.')
+class TrackStoreTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable=R0904
+
+    """Tests for `aprs.TrackStore`."""
+
+    def test_ring_buffer(self):
+        """
+        Tests that a trail keeps the last `capacity` points, oldest first.
+        """
+        store = aprs.TrackStore(capacity=4, slab_size=2)
+        for idx in range(3):
+            store.append(b'W2GMD-1', 37.0 + idx, -122.0, float(idx))
+        trail = store.trail('W2GMD-1')
+        self.assertEqual(trail['time'].tolist(), [0.0, 1.0, 2.0])
+        self.assertTrue(math.isnan(trail['speed'][0]))
+
+        for idx in range(3, 10):
+            store.append(b'W2GMD-1', 37.0 + idx, -122.0, float(idx),
+                         speed=10.0, course=90)
+        trail = store.trail(b'W2GMD-1')
+        self.assertEqual(trail['time'].tolist(), [6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(trail['lat'].tolist(), [43.0, 44.0, 45.0, 46.0])
+        self.assertEqual(trail['course'].tolist(), [90.0] * 4)
+        self.assertEqual(store.trail(b'W2GMD-1', since=7.5)['time'].tolist(),
+                         [8.0, 9.0])
+
+    def test_zero_copy(self):
+        """
+        Tests that trails are read-only views of the ring buffer.
+        """
+        store = aprs.TrackStore(capacity=4)
+        for idx in range(6):
+            store.append(b'W2GMD-1', 37.0, -122.0, float(idx))
+        trail = store.trail(b'W2GMD-1')
+        self.assertFalse(trail['time'].flags.owndata)
+        self.assertFalse(trail['time'].flags.writeable)
+        # The next append overwrites the oldest point in place:
+        store.append(b'W2GMD-1', 37.0, -122.0, 6.0)
+        self.assertEqual(trail['time'].tolist(), [6.0, 3.0, 4.0, 5.0])
+
+    def test_slabs(self):
+        """
+        Tests slot allocation across slabs, and slot reuse.
+        """
+        store = aprs.TrackStore(capacity=8, slab_size=2)
+        for call in (b'A', b'B', b'C'):
+            store.append(call, 1.0, 2.0, 0.0)
+        self.assertEqual(store.info()['slabs'], 2)
+        trail = store.trail(b'A')
+
+        store.remove(b'B')
+        self.assertNotIn(b'B', store)
+        store.append(b'D', 3.0, 4.0, 1.0)
+        self.assertEqual(store.trail(b'D')['lat'].tolist(), [3.0])
+        self.assertEqual(sorted(store), [b'A', b'C', b'D'])
+        self.assertEqual(trail['lat'].tolist(), [1.0])
+        self.assertEqual(store.info(), {
+            'stations': 3, 'slots': 4, 'free': 1, 'slabs': 2, 'points': 3,
+            'appends': 4, 'bytes': 2 * 2 * 5 * 16 * 8})
+
+    def test_append_frames(self):
+        """
+        Tests appending positions from Frames and from an `aprs.FrameBatch`.
+        """
+        lines = [b'W2GMD-1>APRS,TCPIP*:!3745.75N/12228.05W>090/036',
+                 b'KF4ABC>APRS:>No position',
+                 b'W2GMD-1>APRS,TCPIP*:!3746.00N/12228.05W>',
+                 b'N0CALL>APRS:!3800.00N/12224.00W>']
+        for frames in ([aprs.Frame.parse(line) for line in lines],
+                       aprs.FrameBatch.from_lines(lines)):
+            store = aprs.TrackStore(clock=lambda: 5.0)
+            self.assertEqual(store.append_frames(frames), 3)
+            trail = store.trail(b'W2GMD-1')
+            self.assertAlmostEqual(trail['lat'][0], 37.7625)
+            self.assertEqual(trail['speed'][0], 36.0)
+            self.assertEqual(trail['course'][0], 90.0)
+            self.assertTrue(math.isnan(trail['speed'][1]))
+            self.assertEqual(trail['time'].tolist(), [5.0, 5.0])
+            self.assertEqual(len(store), 2)
+
+    def test_douglas_peucker(self):
+        """
+        Tests Douglas-Peucker simplification.
+        """
+        # A straight road with a 2 km detour in the middle:
+        lats = [37.0, 37.0, 37.0, 37.018, 37.0, 37.0, 37.0]
+        lngs = [-122.0, -121.99, -121.98, -121.97, -121.96, -121.95, -121.94]
+        self.assertEqual(
+            aprs.TrackStore.douglas_peucker(lats, lngs, 0.5).tolist(),
+            [0, 2, 3, 4, 6])
+        self.assertEqual(
+            aprs.TrackStore.douglas_peucker(lats, lngs, 5).tolist(), [0, 6])
+        self.assertEqual(
+            aprs.TrackStore.douglas_peucker(lats[:2], lngs[:2], 5).tolist(),
+            [0, 1])
+
+    def test_simplify(self):
+        """
+        Tests time-bucket downsampling, then simplification, of a trail.
+        """
+        store = aprs.TrackStore(capacity=64)
+        for idx in range(60):
+            store.append(b'W2GMD-1', 37.0, -122.0 + idx * 0.001,
+                         1000.0 + idx * 10)
+        self.assertEqual(
+            aprs.TrackStore.time_buckets([0, 10, 59, 60, 61, 130], 60)
+            .tolist(), [2, 4, 5])
+
+        trail = store.simplify(b'W2GMD-1', interval=60)
+        self.assertEqual(len(trail['time']), 11)
+        self.assertEqual(trail['time'][-1], 1590.0)
+        self.assertTrue(trail['time'].flags.owndata)
+
+        trail = store.simplify(b'W2GMD-1', tolerance=0.1, interval=60)
+        self.assertEqual(trail['time'].tolist(), [1010.0, 1590.0])
+
+    def test_requires_numpy(self):
+        """
+        Tests that TrackStore refuses to run without NumPy.
+        """
+        module = sys.modules['aprs.TrackStore']
+        numpy = module.numpy
+        module.numpy = None
+        try:
+            with self.assertRaises(ValueError):
+                aprs.TrackStore()
+        finally:
+            module.numpy = numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
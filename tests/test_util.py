@@ -35,6 +35,13 @@ class APRSUtilTestCase(aprs_test_classes.APRSTestClass):  # NOQA pylint: disable
             self.assertFalse(
                 aprs.valid_callsign(i), "%s is an invalid call" % i)
 
+    def test_passcode(self):
+        """
+        Tests APRS-IS passcodes using `aprs.passcode()`.
+        """
+        self.assertEqual(aprs.passcode('N0CALL'), 13023)
+        self.assertEqual(aprs.passcode(b'n0call-9'), 13023)
+
 
 if __name__ == '__main__':
     unittest.main()